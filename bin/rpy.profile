@@ -143,7 +143,7 @@ def get_data_profile(fileId, xy, ll,
                 print("Read %s ip1=%d ip2=%d ip3=%d typv=%s etk=%s" %
                       (rec['nomvar'], rec['ip1'], rec['ip2'], rec['ip3'],
                        rec['typvar'], rec['etiket']))
-            g = rmn.readGrid(fileId, rec)
+            g = rmn.readGrid(fileId, rec, cache=True)
             if len(xpts) > 0:
                 v1 = rmn.gdxysval(g['id'], xpts, ypts, rec['d'])
                 rfld[0:len(xy)] = v1[:]
@@ -168,7 +168,7 @@ def get_data_profile(fileId, xy, ll,
     for ip1,key in viptkeys:
         rec = rmn.fstluk(key, dataArray=rec['d'])
         if hGrid is None:
-           hGrid = rmn.readGrid(fileId, rec)
+           hGrid = rmn.readGrid(fileId, rec, cache=True)
         vals = rmn.gdxysval(hGrid['id'], xpts, ypts, rec['d'])
         data[0:len(xy),ilvl] = vals[:]
         vals = rmn.gdllsval(hGrid['id'], lats, lons, rec['d'])
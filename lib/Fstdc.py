@@ -109,9 +109,9 @@ def level_to_ip1(level_list, kind):
     @exception Fstdc.error
     """
     try:
-        return [(_rmn.convertIp(CONVIP_STYLE_NEW, lvl, kind),
-                 _rmn.convertIp(CONVIP_STYLE_OLD, lvl, kind))
-                 for lvl in level_list]
+        return list(zip(
+            _rmn.convertIp_many(CONVIP_STYLE_NEW, level_list, kind).tolist(),
+            _rmn.convertIp_many(CONVIP_STYLE_OLD, level_list, kind).tolist()))
     except:
         raise error("")
 
@@ -125,7 +125,8 @@ def ip1_to_level(ip1_list):
     @exception Fstdc.error
     """
     try:
-        return [_rmn.convertIp(CONVIP_IP2P_DEFAULT, ip1) for ip1 in ip1_list]
+        (values, kinds) = _rmn.convertIp_many(CONVIP_IP2P_DEFAULT, ip1_list)
+        return list(zip(values.tolist(), kinds.tolist()))
     except:
         raise error("")
 
@@ -269,6 +269,35 @@ class BurpcFile(_BurpcObjBase):
         self.__iteridx = BurpcRpt()
         raise StopIteration
 
+    def iterlite(self):
+        """
+        Iterate over the reports as lightweight BurpcRptLite objects
+
+        for rpt in burpfile.iterlite(): ...
+
+        Args:
+            None
+        Return:
+            iterator over BurpcRptLite
+        Raises:
+            BurpcError on any error
+
+        Notes:
+            All yielded reports share the same C report buffer,
+            a report (and its blocks) is only valid until the next one is read.
+
+        See Also:
+            BurpcRptLite
+            BurpcBlkLite
+            BurpcEleLite
+        """
+        key = BurpcRpt()
+        rpt = BurpcRptLite(_bp.c_brp_newrpt(), owner=True)
+        while _bp.c_brp_findrpt(self.funit, key.getptr()) >= 0:
+            if _bp.c_brp_getrpt(self.funit, key.handle, rpt.getptr()) < 0:
+                raise BurpcError('BurpcFile.iterlite(): problem in c_brp_getrpt')
+            yield rpt
+
     ## def __setitem__(self, name, value):
     ##     #TODO: Should replace the rpt found with getitem(name) or add a new one
 
@@ -1743,6 +1772,274 @@ class BurpcEle(_BurpcObjBase):
         return params
 
 
+class BurpcRptLite(object):
+    """
+    Lightweight read only view of a burp_c's BURP_RPT C structure
+
+    Attributes are read from the C structure on access,
+    blocks are only extracted from the report when accessed.
+
+    for rpt in burpfile.iterlite():
+        for blk in rpt:
+            arrays = blk.as_arrays()
+
+    Attributes:
+        handle, nsize, temps, flgs, idtype, lati, longi, dx, dy, elev,
+        drnd, date, oars, runn, nblk : BURP_RPT values, see BurpcRpt
+        stnid : Station ID
+        time  : Observation time/hour (HHMM), same as temps
+        idtyp : Report Type, same as idtype
+        lat   : Station latitude (degrees)
+        lon   : Station longitude (degrees)
+
+    See Also:
+        BurpcFile.iterlite
+        BurpcBlkLite
+        BurpcRpt
+    """
+    __slots__ = ('_ptr', '_owner')
+    _alias = {
+        'time'  : 'temps',
+        'idtyp' : 'idtype',
+        'ilat'  : 'lati',
+        'ilon'  : 'longi'
+        }
+
+    def __init__(self, ptr, owner=False):
+        self._ptr = ptr
+        self._owner = owner
+
+    def __del__(self):
+        if self._owner:
+            _bp.c_brp_freerpt(self._ptr)
+
+    def __getattr__(self, name):
+        name = self._alias.get(name, name)
+        if name in ('_ptr', '_owner'):
+            raise AttributeError(name)
+        try:
+            return getattr(self._ptr[0], name)
+        except AttributeError:
+            raise AttributeError("{} object has no attribute: {}"
+                                 .format(self.__class__.__name__, repr(name)))
+
+    def __repr__(self):
+        return '{}(handle={}, stnid={}, nblk={})'.format(
+            self.__class__.__name__, self.handle, repr(self.stnid), self.nblk)
+
+    @property
+    def stnid(self):
+        return _C_CHAR2WCHAR_COND(self._ptr[0].stnid)
+
+    @property
+    def lat(self):
+        return (float(self._ptr[0].lati)/100.) - 90.
+
+    @property
+    def lon(self):
+        return float(self._ptr[0].longi)/100.
+
+    def __len__(self):
+        return max(0, self._ptr[0].nblk)
+
+    def __iter__(self):
+        for i in _range(len(self)):
+            yield BurpcBlkLite(self, i)
+
+    def __getitem__(self, index):
+        if index < 0 or index >= len(self):
+            raise IndexError('Index out of range: [0:{}['.format(len(self)))
+        return BurpcBlkLite(self, index)
+
+    def getptr(self):
+        """
+        Return the pointer to the BURP_RPT structure
+        """
+        return self._ptr
+
+
+class BurpcBlkLite(object):
+    """
+    Lightweight read only view of a report's block
+
+    The block is extracted (c_brp_getblk) on first access,
+    values are exposed as NumPy views on the C arrays, without copy.
+
+    blk = rpt[index]
+    arrays = blk.as_arrays()
+
+    Attributes:
+        bkno, nele, nval, nt, bfam, bdesc, btyp, bknat, bktyp, bkstp,
+        nbit, bit0, datyp, store_type : BURP_BLK values, see BurpcBlk
+
+    See Also:
+        BurpcRptLite
+        BurpcEleLite
+        BurpcBlk
+    """
+    __slots__ = ('_rpt', '_bkno', '_ptr')
+
+    def __init__(self, rpt, index):
+        self._rpt = rpt
+        self._bkno = index + 1
+        self._ptr = None
+
+    def __del__(self):
+        if self._ptr is not None:
+            _bp.c_brp_freeblk(self._ptr)
+
+    def getptr(self):
+        """
+        Return the pointer to the BURP_BLK structure, extract the block if need be
+        """
+        if self._ptr is None:
+            ptr = _bp.c_brp_newblk()
+            if _bp.c_brp_getblk(self._bkno, ptr, self._rpt.getptr()) < 0:
+                _bp.c_brp_freeblk(ptr)
+                raise BurpcError('Problem in c_brp_getblk: {}'
+                                 .format(self._bkno))
+            self._ptr = ptr
+        return self._ptr
+
+    def __getattr__(self, name):
+        if name in self.__slots__:
+            raise AttributeError(name)
+        try:
+            return _C_CHAR2WCHAR_COND(getattr(self.getptr()[0], name))
+        except AttributeError:
+            raise AttributeError("{} object has no attribute: {}"
+                                 .format(self.__class__.__name__, repr(name)))
+
+    def __repr__(self):
+        return '{}(bkno={})'.format(self.__class__.__name__, self._bkno)
+
+    def __len__(self):
+        return max(0, self.getptr()[0].nele)
+
+    def __iter__(self):
+        for i in _range(len(self)):
+            yield BurpcEleLite(self, i)
+
+    def __getitem__(self, index):
+        if index < 0 or index >= len(self):
+            raise IndexError('Index out of range: [0:{}['.format(len(self)))
+        return BurpcEleLite(self, index)
+
+    def as_arrays(self):
+        """
+        Return the block tables as NumPy views on the C arrays
+
+        arrays = blk.as_arrays()
+
+        Return:
+            {
+                'lstele'  : coded elements (CMCID), shape: (nele, )
+                'dlstele' : decoded elements (BUFRID), shape: (nele, )
+                'tblval'  : coded values, shape: (nele, nval, nt)
+                'rval'    : decoded real values, shape: (nele, nval, nt)
+                'drval'   : decoded double values, shape: (nele, nval, nt)
+                'charval' : decoded char values, shape: (nele, nval, nt)
+            }
+            tables not allocated by burp_c, depending on store_type, are None
+            3d tables are in Fortran order.
+
+        Notes:
+            The views are only valid as long as this block object
+            and its report are.
+        """
+        ptr = self.getptr()
+        blk = ptr[0]
+        (nele, nval, nt) = (blk.nele, blk.nval, blk.nt)
+        arrays = dict([(k, None) for k in ('lstele', 'dlstele', 'tblval',
+                                           'rval', 'drval', 'charval')])
+        if nele <= 0:
+            return arrays
+        for k in ('lstele', 'dlstele'):
+            if getattr(blk, k):
+                arrays[k] = _np.ctypeslib.as_array(getattr(blk, k), (nele, ))
+        for k in ('tblval', 'rval', 'drval'):
+            if getattr(blk, k) and nval > 0 and nt > 0:
+                arrays[k] = _np.ctypeslib.as_array(getattr(blk, k),
+                                                   (nt, nval, nele)).T
+        addr = _ct.c_void_p.from_buffer(blk, _bp.BURP_BLK.charval.offset).value
+        if addr and nval > 0 and nt > 0:
+            charval = _ct.cast(addr, _ct.POINTER(_ct.c_uint8))
+            arrays['charval'] = _np.ctypeslib.as_array(charval,
+                                                       (nt, nval, nele)).T
+        return arrays
+
+
+class BurpcEleLite(object):
+    """
+    Lightweight read only view of a block's element
+
+    Values are views on the block C arrays,
+    table B info is only looked up when accessed.
+
+    ele = blk[index]
+
+    Attributes:
+        e_cmcid  : Element CMC code name (lstele)
+        e_bufrid : Element BUFR code (dlstele)
+        e_tblval : coded values, shape: (nval, nt)
+        e_rval   : decoded real values, shape: (nval, nt)
+        e_drval, e_charval : other decoded values if available
+        e_desc, e_units, e_scale, e_bias, e_nbits, e_multi, e_cvt, e_error :
+                   BUFR table B info, see rpnpy.librmn.burp.mrbcvt_dict
+        nval, nt, shape
+
+    See Also:
+        BurpcBlkLite
+        BurpcEle
+    """
+    __slots__ = ('_blk', '_index')
+
+    def __init__(self, blk, index):
+        self._blk = blk
+        self._index = index
+
+    def __repr__(self):
+        return '{}(e_bufrid={})'.format(self.__class__.__name__,
+                                        self.e_bufrid)
+
+    @property
+    def e_cmcid(self):
+        return int(self._blk.getptr()[0].lstele[self._index])
+
+    @property
+    def e_bufrid(self):
+        return int(self._blk.getptr()[0].dlstele[self._index])
+
+    @property
+    def shape(self):
+        blk = self._blk.getptr()[0]
+        return (blk.nval, blk.nt)
+
+    @property
+    def nval(self):
+        return self._blk.getptr()[0].nval
+
+    @property
+    def nt(self):
+        return self._blk.getptr()[0].nt
+
+    def __getattr__(self, name):
+        if name in self.__slots__:
+            raise AttributeError(name)
+        if name in ('e_tblval', 'e_rval', 'e_drval', 'e_charval'):
+            v = self._blk.as_arrays()[name[2:]]
+            if v is None and name == 'e_rval':
+                return _rmn.mrbcvt_decode_many(
+                    _np.array([self.e_cmcid]),
+                    self.e_tblval[_np.newaxis, :, :])[0]
+            return v if v is None else v[self._index, :, :]
+        try:
+            return _rmn.mrbcvt_dict_many(_np.array([self.e_cmcid]))[name][0]
+        except KeyError:
+            raise AttributeError("{} object has no attribute: {}"
+                                 .format(self.__class__.__name__, repr(name)))
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
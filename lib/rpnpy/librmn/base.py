@@ -888,6 +888,340 @@ def newdate(imode, idate1, idate2=0):
     elif imode == -7:
         return (cidate2.value, cidate3.value)
 
+
+## New style CMC date-time stamps encode the number of 5 seconds steps
+## (tdate) since 1980-01-01 00Z as: (tdate // 8) * 10 + tdate % 8 + 123200000
+## Older dates use old style stamps, below 123200000
+_NEWDATE_STAMP0 = 123200000
+_NEWDATE_STEPS_PER_HOUR = 720
+_NEWDATE_STEPS_PER_DAY = 17280
+_NEWDATE_EPOCH = _np.datetime64('1980-01-01T00:00:00', 's')
+_NEWDATE_NOLEAP_MDAYS = _np.array([0, 31, 59, 90, 120, 151, 181, 212, 243,
+                                   273, 304, 334], dtype=_np.int64)
+
+def _newdate_many_int(values, caller):
+    """
+    Return values as an int64 array, check for int values
+    """
+    values = _np.asarray(values)
+    if not (values.dtype.kind in 'iu' or values.size == 0):
+        raise TypeError("{0}: Expecting idates of type int, Got {1}"\
+                        .format(caller, values.dtype))
+    return values.astype(_np.int64)
+
+
+def _newdate_many_float(values, caller):
+    """
+    Return values as a float64 array, check for numerical values
+    """
+    values = _np.asarray(values)
+    if not (values.dtype.kind in 'iuf' or values.size == 0):
+        raise TypeError("{0}: Expecting nhours of type float, Got {1}"\
+                        .format(caller, values.dtype))
+    return values.astype(_np.float64)
+
+
+def _newdate_stamp2tdate(stamps):
+    """
+    Return (tdate, valid) for an int64 array of new style stamps
+    """
+    dstamp = stamps - _NEWDATE_STAMP0
+    valid = (dstamp >= 0) & (dstamp % 10 < 8)
+    return ((dstamp // 10) * 8 + dstamp % 10, valid)
+
+
+def _newdate_tdate2stamp(tdate):
+    """
+    Return (stamps, valid) for an int64 array of tdate
+    """
+    stamps = (tdate // 8) * 10 + tdate % 8 + _NEWDATE_STAMP0
+    valid = (tdate >= 0) & (stamps <= _np.iinfo(_np.int32).max)
+    return (stamps, valid)
+
+
+def _newdate_calendar():
+    """
+    Return (calendar, tdate of 1980-01-01 00Z) for the newdate options
+    """
+    calendar = newdate_options_get('year')
+    stamp0 = newdate(_rc.NEWDATE_PRINT2STAMP, 19800101, 0)
+    (tdate0, valid) = _newdate_stamp2tdate(_np.array([stamp0], dtype=_np.int64))
+    return (calendar, int(tdate0[0]) if valid[0] else None)
+
+
+def _newdate_fallback(func, out, fast, *args):
+    """
+    Fill out where not fast with func(*args), calling it once per distinct args
+    """
+    if _np.all(fast):
+        return out
+    flat = out.reshape(-1)
+    fargs = [a.ravel() for a in args]
+    cache = {}
+    for i in _np.flatnonzero(~fast).tolist():
+        key = tuple(a[i].item() for a in fargs)
+        if key not in cache:
+            cache[key] = func(*key)
+        flat[i] = cache[key]
+    return out
+
+
+def _incdatr_many(idates, nhours):
+    """
+    Increase new style stamps idates by nhours, rounded to 5 seconds
+
+    Return (idates2, fast), idates2 is only valid where fast is True
+    """
+    idates = _newdate_many_int(idates, 'incdatr_many')
+    nhours = _newdate_many_float(nhours, 'incdatr_many')
+    (idates, nhours) = _np.broadcast_arrays(idates, nhours)
+    (tdate, fast) = _newdate_stamp2tdate(idates)
+    with _np.errstate(invalid='ignore'):
+        nsteps = nhours * _NEWDATE_STEPS_PER_HOUR
+        fast &= (_np.abs(nsteps) < 2.**31)
+    nsteps = _np.where(fast, _np.trunc(nsteps + _np.copysign(0.5, nsteps)), 0.)
+    (idates2, valid) = _newdate_tdate2stamp(tdate + nsteps.astype(_np.int64))
+    fast &= valid
+    return (_np.where(fast, idates2, -1).astype(_np.int32), fast)
+
+
+def incdatr_many(idates, nhours, missing=None):
+    """
+    Increase many idates by nhours at once
+
+    date2 = incdatr_many(idates, nhours)
+
+    Array version of incdatr, new style stamps (dates from 1980)
+    are computed with numpy, others with incdatr once per distinct value.
+
+    Args:
+        idates  : CMC encodec dates (array-like of int)
+        nhours  : number of hours (float or array-like of float,
+                  broadcasted against idates)
+        missing : value given to dates incdatr cannot compute (int),
+                  if None (default) the error is raised
+    Returns:
+        numpy.ndarray of int32, CMC encodec dates, idates+nhours
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        RMNBaseError on any other error
+
+    Examples:
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> idate1 = rmn.newdate(rmn.NEWDATE_PRINT2STAMP, 20150123, 0)
+    >>> idates = rmn.incdatr_many(idate1, np.arange(0., 24., 6.))
+    >>> idates[1] == rmn.incdatr(idate1, 6.)
+    True
+
+    See also:
+        incdatr
+        difdatr_many
+        stamp2datetime64
+    """
+    (idates2, fast) = _incdatr_many(idates, nhours)
+    (idates, nhours) = _np.broadcast_arrays(
+        _newdate_many_int(idates, 'incdatr_many'),
+        _newdate_many_float(nhours, 'incdatr_many'))
+    func = incdatr
+    if missing is not None:
+        def func(idate, nhours1):
+            try:
+                return incdatr(idate, nhours1)
+            except (ValueError, RMNBaseError):
+                return missing
+    return _newdate_fallback(func, idates2, fast, idates, nhours)
+
+
+def difdatr_many(idates1, idates2):
+    """
+    Compute many diffences between dates in hours (nhours = idates1 - idates2)
+
+    nhours = difdatr_many(idates1, idates2)
+
+    Array version of difdatr, new style stamps (dates from 1980)
+    are computed with numpy, others with difdatr once per distinct value.
+
+    Args:
+        idates1 : CMC encodec dates (array-like of int)
+        idates2 : CMC encodec dates (array-like of int,
+                  broadcasted against idates1)
+    Returns:
+        numpy.ndarray of float64, number of hours, idates1 - idates2
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        RMNBaseError on any other error
+
+    Examples:
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> idate1 = rmn.newdate(rmn.NEWDATE_PRINT2STAMP, 20150123, 0)
+    >>> idates = rmn.incdatr_many(idate1, [6., 12.])
+    >>> nhours = rmn.difdatr_many(idates, idate1)
+    >>> print('# {}'.format(nhours.tolist()))
+    # [6.0, 12.0]
+
+    See also:
+        difdatr
+        incdatr_many
+    """
+    (idates1, idates2) = _np.broadcast_arrays(
+        _newdate_many_int(idates1, 'difdatr_many'),
+        _newdate_many_int(idates2, 'difdatr_many'))
+    (tdate1, fast1) = _newdate_stamp2tdate(idates1)
+    (tdate2, fast2) = _newdate_stamp2tdate(idates2)
+    fast = fast1 & fast2
+    nhours = _np.where(fast, tdate1 - tdate2, 0) / float(_NEWDATE_STEPS_PER_HOUR)
+    return _newdate_fallback(difdatr, nhours, fast, idates1, idates2)
+
+
+def stamp2datetime64(idates):
+    """
+    Convert many CMC date-time stamps to numpy datetime64
+
+    dates = stamp2datetime64(idates)
+
+    New style stamps (dates from 1980) are converted with numpy, in the
+    'gregorian' and '365_day' calendars (see newdate_options_set),
+    others with newdate once per distinct value.
+    With the '365_day' calendar, dates are the printable date of the stamps.
+
+    Args:
+        idates : CMC encodec dates (array-like of int)
+    Returns:
+        numpy.ndarray of datetime64[s]
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        RMNBaseError on any other error
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> idate1 = rmn.newdate(rmn.NEWDATE_PRINT2STAMP, 20150123, 6000000)
+    >>> dates = rmn.stamp2datetime64([idate1])
+    >>> print('# {}'.format(dates[0]))
+    # 2015-01-23T06:00:00
+
+    See also:
+        datetime642stamp
+        newdate
+        newdate_options_set
+    """
+    idates = _newdate_many_int(idates, 'stamp2datetime64')
+    (calendar, tdate0) = _newdate_calendar()
+    (tdate, fast) = _newdate_stamp2tdate(idates)
+    if tdate0 is None:
+        fast[...] = False
+    else:
+        tdate = tdate - tdate0
+        fast &= (tdate >= 0)
+    tdate = _np.where(fast, tdate, 0)
+    if calendar == '365_day':
+        (days, steps) = _np.divmod(tdate, _NEWDATE_STEPS_PER_DAY)
+        (years, doy) = _np.divmod(days, 365)
+        months = _np.searchsorted(_NEWDATE_NOLEAP_MDAYS, doy, side='right') - 1
+        mdays = doy - _NEWDATE_NOLEAP_MDAYS[months]
+        dates = ((_np.datetime64('1980-01', 'M') +
+                  (years * 12 + months).astype('timedelta64[M]'))
+                 .astype('datetime64[D]') + mdays.astype('timedelta64[D]'))
+        dates = (dates.astype('datetime64[s]') +
+                 (steps * 5).astype('timedelta64[s]'))
+    else:
+        if calendar != 'gregorian':
+            fast[...] = False
+        dates = _NEWDATE_EPOCH + (tdate * 5).astype('timedelta64[s]')
+    return _newdate_fallback(_newdate_stamp2datetime64, dates, fast, idates)
+
+
+def _newdate_stamp2datetime64(idate):
+    """
+    Convert a stamp to datetime64 with newdate
+    """
+    (yyyymmdd, hhmmsshh) = newdate(_rc.NEWDATE_STAMP2PRINT, idate)
+    return _np.datetime64(
+        '{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}'.format(
+            yyyymmdd // 10000, (yyyymmdd // 100) % 100, yyyymmdd % 100,
+            hhmmsshh // 1000000, (hhmmsshh // 10000) % 100,
+            (hhmmsshh // 100) % 100), 's')
+
+
+def datetime642stamp(dates):
+    """
+    Convert many numpy datetime64 to CMC date-time stamps
+
+    idates = datetime642stamp(dates)
+
+    Dates from 1980 are converted with numpy, in the
+    'gregorian' and '365_day' calendars (see newdate_options_set),
+    others with newdate once per distinct value.
+    Precision of new style stamps is 5 seconds.
+
+    Args:
+        dates : dates (array-like of datetime64 or datetime.datetime)
+    Returns:
+        numpy.ndarray of int32, CMC encodec dates
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        RMNBaseError on any other error
+
+    Examples:
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> dates = np.arange('2015-01-23T00', '2015-01-24T00', 6,
+    ...                   dtype='datetime64[h]')
+    >>> idates = rmn.datetime642stamp(dates)
+    >>> idates[1] == rmn.newdate(rmn.NEWDATE_PRINT2STAMP, 20150123, 6000000)
+    True
+
+    See also:
+        stamp2datetime64
+        newdate
+        newdate_options_set
+    """
+    try:
+        dates = _np.asarray(dates, dtype='datetime64[s]')
+    except (TypeError, ValueError):
+        raise TypeError("datetime642stamp: Expecting dates of type datetime64")
+    (calendar, tdate0) = _newdate_calendar()
+    fast = ~_np.isnat(dates)
+    days = dates.astype('datetime64[D]')
+    nsec = _np.where(fast, (dates - days).astype(_np.int64), 0)
+    if calendar == '365_day':
+        months = dates.astype('datetime64[M]')
+        mdays = (days - months.astype('datetime64[D]')).astype(_np.int64)
+        months = _np.where(fast, months.astype(_np.int64), 120)
+        (years, months) = _np.divmod(months - 120, 12)
+        fast &= ~((months == 1) & (mdays == 28))
+        ndays = years * 365 + _NEWDATE_NOLEAP_MDAYS[months] + mdays
+    else:
+        if calendar != 'gregorian':
+            fast[...] = False
+        ndays = _np.where(fast, (days - _NEWDATE_EPOCH.astype('datetime64[D]'))
+                          .astype(_np.int64), 0)
+    tdate = ndays * _NEWDATE_STEPS_PER_DAY + nsec // 5
+    fast &= (tdate >= 0) & (tdate0 is not None)
+    (idates, valid) = _newdate_tdate2stamp(tdate + (tdate0 or 0))
+    fast &= valid
+    idates = _np.where(fast, idates, -1).astype(_np.int32)
+    return _newdate_fallback(_newdate_datetime642stamp, idates, fast,
+                             dates.astype(_np.int64))
+
+
+def _newdate_datetime642stamp(nsec):
+    """
+    Convert a datetime64[s], as int64 seconds, to a stamp with newdate
+    """
+    if nsec == _np.datetime64('NaT').astype(_np.int64):
+        raise ValueError("datetime642stamp: must provide valid dates, got NaT")
+    date = str(_np.datetime64(nsec, 's'))
+    yyyymmdd = int(date[0:10].replace('-', ''))
+    hhmmsshh = int(date[11:19].replace(':', '')) * 100
+    return newdate(_rc.NEWDATE_PRINT2STAMP, yyyymmdd, hhmmsshh)
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -50,6 +50,7 @@ from rpnpy.librmn import proto_burp as _rp
 from rpnpy.librmn import const as _rc
 from rpnpy.librmn import burp_const as _rbc
 from rpnpy.librmn import base as _rb
+from rpnpy.librmn import npzcache as _npzc
 from rpnpy.librmn import RMNError
 from rpnpy import integer_types as _integer_types
 from rpnpy import C_WCHAR2CHAR as _C_WCHAR2CHAR
@@ -58,11 +59,18 @@ from rpnpy import C_MKSTR as _C_MKSTR
 
 _ERR_INV_DATYP = 16
 
+## Path of the files opened with burp_open in read mode, by unit (see burp_index)
+_burpUnitPaths = {}
+
+## Report handle bits holding the file index, see MAKE_RND_HANDLE in xdf98
+_BURP_HANDLE_FINDEX_MASK = 0x3FF
+
 _mrbcvt_dict = {
     'path'  : '',
     'raise' : False,
     'init'  : False,
-    'dict'  : {}
+    'dict'  : {},
+    'table' : None
     }
 #_mrbcvt_dict_full.__doc__ = """
 #    Parsed BUFR table B into a python dict,
@@ -243,6 +251,8 @@ def burp_open(filename, filemode=_rbc.BURP_MODE_READ):
         raise BurpError('Problem associating a unit with the file: {0}'
                         .format(filename))
     nrep = mrfopn(funit, filemode)
+    if filemode == _rbc.BURP_MODE_READ:
+        _burpUnitPaths[funit] = os.path.abspath(filename)
     return funit
 
 
@@ -280,6 +290,7 @@ def burp_close(iunit):
     """
     mrfcls(iunit)
     _rb.fclos(iunit)
+    _burpUnitPaths.pop(iunit, None)
 
 
 def mrfopt(name, value=None):
@@ -656,7 +667,7 @@ def mrfloc(funit, handle=0, stnid='*********', idtyp=-1, ilat=-1, ilon=-1,
                           params['date'], params['time'],
                           params['sup'], nsup)
     if handle < 0:
-        raise BurpError('c_mrfloc', params['handle'])
+        raise BurpError('c_mrfloc', handle)
     return handle
 
 
@@ -715,6 +726,85 @@ def mrfget(handle, rpt=None, funit=None):
     return rpt
 
 
+def mrfprm(handle):
+    """
+    Get the main parameters of the report pointed to by handle
+    without reading it.
+
+    params = mrfprm(handle)
+
+    Args:
+        handle : Report handle
+    Returns:
+        {
+            'handle': (int)   Report handle
+            'stnid' : (str)   Station ID
+            'idtyp' : (int)   Report Type
+            'ilat'  : (int)   Station latitude (1/100 of degrees)
+                              with respect to the south pole. (0 to 1800)
+            'lat'   : (float) Station latitude (degrees)
+            'ilon'  : (int)   Station longitude (1/100 of degrees)
+            'lon'   : (float) Station longitude (degrees)
+            'idx'   : (int)   Width of a box for regrouped data
+            'idy'   : (int)   Height of a box for regrouped data
+            'date'  : (int)   Report valid date (YYYYMMDD)
+            'time'  : (int)   Observation time/hour (HHMM)
+            'flgs'  : (int)   Global flags
+            'lng'   : (int)   Length of the report in host words
+        }
+    Raises:
+        TypeError  on wrong input arg types
+        BurpError  on any other error
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> funit  = rmn.burp_open(filename)
+    >>> handle = rmn.mrfloc(funit)
+    >>> params = rmn.mrfprm(handle)
+    >>> rmn.burp_close(funit)
+
+    Notes:
+        This is a new function in version 2.2
+
+    See Also:
+        mrfloc
+        mrfget
+        mrbhdr
+        burp_iter
+    """
+    if not isinstance(handle, _integer_types):
+        raise TypeError('handle should be an int, got {}'.format(type(handle)))
+    stnid = _C_MKSTR(' '*(_rbc.BURP_STNID_STRLEN + 1))
+    (idtyp, ilat, ilon, idx, idy, idate, itime, iflgs, lng) = \
+        [_ct.c_int() for i in range(9)]
+    sup = _np.empty((1, ), dtype=_np.int32)
+    istat = _rp.c_mrfprm(handle, stnid, _ct.byref(idtyp),
+                         _ct.byref(ilat), _ct.byref(ilon),
+                         _ct.byref(idx), _ct.byref(idy),
+                         _ct.byref(idate), _ct.byref(itime),
+                         _ct.byref(iflgs), sup, 0, _ct.byref(lng))
+    if istat != 0:
+        raise BurpError('c_mrfprm', istat)
+    return {
+        'handle': handle,
+        'stnid' : _C_CHAR2WCHAR(stnid.value),
+        'idtyp' : idtyp.value,
+        'ilat'  : ilat.value,
+        'lat'   : _rbc.BRP_ILAT2RLAT(ilat.value),
+        'ilon'  : ilon.value,
+        'lon'   : _rbc.BRP_ILON2RLON(ilon.value),
+        'idx'   : idx.value,
+        'idy'   : idy.value,
+        'date'  : idate.value,
+        'time'  : itime.value,
+        'flgs'  : iflgs.value,
+        'lng'   : lng.value
+        }
+
+
 def mrfput(funit, handle, rpt):
     """
     Write a report.
@@ -949,6 +1039,7 @@ def flags_decode(iflgs, raise_error=True):
         This is a new function in version 2.1.b2
 
     See Also:
+        flags_decode_many
         mrfhdr
         rpnpy.librmn.burp_const
     """
@@ -981,6 +1072,57 @@ def flags_decode(iflgs, raise_error=True):
             }
 
 
+def flags_decode_many(iflgs):
+    """
+    Decode many report header flags at once.
+
+    flags = flags_decode_many(flgs)
+
+    Args:
+        flgs : integer values of the flags (array-like of int)
+    Returns:
+        numpy structured array of the same shape as flgs,
+        with dtype BURP_FLAGS_DTYPE fields:
+            'flgs'  : (int)   Global flags
+            'flgsl' : (int8)  Global flags bits, flgsl[..., i] is bit i
+                              See BURP_FLAGS_IDX for Bits/flags desc.
+    Raises:
+        TypeError  on wrong input arg types
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> flags = rmn.flags_decode_many([1024, 1025, 2048])
+    >>> observed = flags['flgsl'][:, rmn.BURP_FLAGS_IDX['data observed']]
+    >>> print('# {}'.format(observed.tolist()))
+    # [1, 1, 0]
+
+    See Also:
+        flags_decode
+        mrbtyp_decode_many
+        rpnpy.librmn.burp_const.BURP_FLAGS_DTYPE
+    """
+    iflgs = _burp_decode_many_int(iflgs, 'flags_decode_many')
+    nbits = len(_rbc.BURP_FLAGS_IDX_NAME)
+    params = _np.empty(iflgs.shape, dtype=list(_rbc.BURP_FLAGS_DTYPE))
+    params['flgs'] = iflgs
+    params['flgsl'] = (iflgs[..., None] >> _np.arange(nbits)) & 1
+    return params
+
+
+def _burp_decode_many_int(values, caller):
+    """
+    Return values as an int32 array, check for int and non negative values
+    """
+    values = _np.asarray(values)
+    if not (values.dtype.kind in 'iu' or values.size == 0):
+        raise TypeError("{0}: Expecting int values, Got {1}"\
+                        .format(caller, values.dtype))
+    values = values.astype(_np.int32, copy=False)
+    if _np.any(values < 0):
+        raise ValueError("{0}: Provided values must be >= 0".format(caller))
+    return values
+
+
 def mrbprm(rpt, blkno):
     """
     Returns block header information.
@@ -1170,6 +1312,7 @@ def mrbtyp_decode(btyp):
     >>> rmn.burp_close(funit)
 
     See Also:
+        mrbtyp_decode_many
         mrbtyp_encode_bknat
         mrbtyp_encode_bktyp
         mrbtyp_encode
@@ -1200,6 +1343,53 @@ def mrbtyp_decode(btyp):
     return params
 
 
+def mrbtyp_decode_many(btyp):
+    """
+    Decode many btyp into bknat, bktyp, bkstp at once
+
+    params = mrbtyp_decode_many(btyp)
+
+    Args:
+        btyp  : (array-like of int) Block types, see mrbtyp_decode
+    Returns:
+        numpy structured array of the same shape as btyp,
+        with dtype BURP_BTYP_DTYPE fields:
+            'btyp', 'bknat', 'bknat_multi', 'bknat_kind',
+            'bktyp', 'bktyp_alt', 'bktyp_kind', 'bkstp'
+        See mrbtyp_decode for their meaning,
+        descriptions can be obtained from BURP_BKNAT_KIND_DESC,
+        BURP_BKTYP_KIND_DESC and BURP_BKSTP_DESC
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on wrong input arg value
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> table  = rmn.burp_read_table(filename)
+    >>> params = rmn.mrbtyp_decode_many(table['btyp'])
+    >>> isflags = (params['bknat_kind'] == rmn.BURP_BKNAT_KIND_IDX['flags'])
+
+    See Also:
+        mrbtyp_decode
+        mrbtyp_decode_bknat_many
+        mrbtyp_decode_bktyp_many
+        flags_decode_many
+        rpnpy.librmn.burp_const.BURP_BTYP_DTYPE
+    """
+    btyp = _burp_decode_many_int(btyp, 'mrbtyp_decode_many')
+    params = _np.empty(btyp.shape, dtype=list(_rbc.BURP_BTYP_DTYPE))
+    params['btyp'] = btyp
+    for (k, v) in mrbtyp_decode_bknat_many((btyp >> 11) & 0xf).items():
+        params[k] = v
+    for (k, v) in mrbtyp_decode_bktyp_many((btyp >> 4) & 0x7f).items():
+        params[k] = v
+    params['bkstp'] = btyp & 0xf
+    return params
+
+
 def mrbtyp_decode_bknat(bknat):
     """
     Decode bknat intp bknat_multi, bknat_kind
@@ -1247,6 +1437,42 @@ def mrbtyp_decode_bknat(bknat):
         }
 
 
+def mrbtyp_decode_bknat_many(bknat):
+    """
+    Decode many bknat into bknat_multi, bknat_kind at once
+
+    bknat_dict = mrbtyp_decode_bknat_many(bknat)
+
+    Args:
+        bknat : (array-like of int) encoded block types, kind component
+    Returns:
+        {
+            'bknat'       : (array) block type, kind component
+            'bknat_multi' : (array) block type, kind component, uni/multi bit
+            'bknat_kind'  : (array) block type, kind component, kind value
+        }
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on wrong input arg value
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> bknatdict = rmn.mrbtyp_decode_bknat_many([3, 7])
+    >>> print('# {}'.format(bknatdict['bknat_multi'].tolist()))
+    # [0, 1]
+
+    See Also:
+        mrbtyp_decode_bknat
+        mrbtyp_decode_many
+    """
+    bknat = _burp_decode_many_int(bknat, 'mrbtyp_decode_bknat_many')
+    return {
+        'bknat'       : bknat,
+        'bknat_multi' : (bknat >> 2) & 0x3,
+        'bknat_kind'  : bknat & 0x3
+        }
+
+
 def mrbtyp_encode_bknat(bknat_multi, bknat_kind):
     """
     Encode bknat_multi, bknat_kind into bknat
@@ -1306,8 +1532,8 @@ def mrbtyp_decode_bktyp(bktyp):
     """
     if isinstance(bktyp, _ct.c_int):
         bktyp = bktyp.value
-    bktyp_alt   = int(_rbc.BURP2BIN(bktyp, 4)[0], 2)
-    bktyp_kind  = int(_rbc.BURP2BIN(bktyp, 4)[1:], 2)
+    bktyp_alt   = int(_rbc.BURP2BIN(bktyp, 7)[0], 2)
+    bktyp_kind  = int(_rbc.BURP2BIN(bktyp, 7)[1:], 2)
     try:
         bktyp_kindd = _rbc.BURP_BKTYP_KIND_DESC[bktyp_kind]
     except KeyError:
@@ -1320,6 +1546,44 @@ def mrbtyp_decode_bktyp(bktyp):
         }
 
 
+def mrbtyp_decode_bktyp_many(bktyp):
+    """
+    Decode many bktyp into bktyp_alt, bktyp_kind at once
+
+    bktyp_dict = mrbtyp_decode_bktyp_many(bktyp)
+
+    Args:
+        bktyp : (array-like of int) block types, Data-type component
+    Returns:
+        {
+            'bktyp'       : (array) block type, Data-type component
+            'bktyp_alt'   : (array) block type, Data-type component,
+                                    surf/alt bit
+            'bktyp_kind'  : (array) block type, Data-type component, flags
+        }
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on wrong input arg value
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> bktypdict = rmn.mrbtyp_decode_bktyp_many([0, 86])
+    >>> print('# {} {}'.format(bktypdict['bktyp_alt'].tolist(),
+    ...                        bktypdict['bktyp_kind'].tolist()))
+    # [0, 1] [0, 22]
+
+    See Also:
+        mrbtyp_decode_bktyp
+        mrbtyp_decode_many
+    """
+    bktyp = _burp_decode_many_int(bktyp, 'mrbtyp_decode_bktyp_many')
+    return {
+        'bktyp'       : bktyp,
+        'bktyp_alt'   : (bktyp >> 6) & 0x1,
+        'bktyp_kind'  : bktyp & 0x3f
+        }
+
+
 def mrbtyp_encode_bktyp(bktyp_alt, bktyp_kind):
     """
     Encode bktyp_alt, bktyp_kind into bktyp
@@ -1702,7 +1966,8 @@ def mrbcvt_dict_path_set(filepath='', raiseError=False):
         'path'  : filepath.strip(),
         'raise' : raiseError,
         'init'  : False,
-        'dict'  : {}
+        'dict'  : {},
+        'table' : None
         })
 
 
@@ -1726,14 +1991,10 @@ def mrbcvt_dict_get():
     return copy.deepcopy(_mrbcvt_dict['dict'])
 
 
-def _mrbcvt_dict_full_init():
+def _mrbcvt_dict_path():
     """
-    Read BUFR table B and parse into a dict
-    in preparation for use in other functions
+    Return the path of the BUFR table B in use
     """
-    if _mrbcvt_dict['init']:
-        return
-
     mypath = _mrbcvt_dict['path']
     if not mypath:
         CMCCONST = os.getenv('CMCCONST', '')
@@ -1746,7 +2007,18 @@ def _mrbcvt_dict_full_init():
             CMCCONST2 = os.getenv('rpnpy', '/')
             mypath = os.path.join(CMCCONST2.strip(), 'share',
                                   _rbc.BURP_TABLE_B_FILENAME)
+    return mypath
+
+
+def _mrbcvt_dict_full_init():
+    """
+    Read BUFR table B and parse into a dict
+    in preparation for use in other functions
+    """
+    if _mrbcvt_dict['init']:
+        return
 
+    mypath = _mrbcvt_dict_path()
     try:
         ## sys.stderr.write('_mrbcvt_dict_full_init: '+mypath+"\n") #TODO: print this in verbose mode
         fd = open(mypath, "r")
@@ -1832,12 +2104,13 @@ def mrbcvt_dict_find_id(desc, nmax=999, flags=_re.IGNORECASE):
         mrbcvt_dict
         mrbcvt_dict_bufr
     """
-    if not _mrbcvt_dict['init']:
-        _mrbcvt_dict_full_init()
+    table = mrbcvt_table()
+    cmcids = _np.nonzero(table['idesc'] >= 0)[0]
+    cmcids = cmcids[_np.argsort(table['idesc'][cmcids])]
     e_bufrid = []
-    for k, v in _mrbcvt_dict['dict'].items():
-        if _re.match(desc, v['e_desc'], flags):
-            e_bufrid.append(v['e_bufrid'])
+    for cmcid in cmcids:
+        if _re.match(desc, table['desc'][table['idesc'][cmcid]], flags):
+            e_bufrid.append(int(table['bufrid'][cmcid]))
         if len(e_bufrid) >= nmax:
             break
     return e_bufrid
@@ -1996,6 +2269,219 @@ def mrbcvt_dict(cmcid, raise_error=True):
     return mrbcvt_dict_bufr(bufrid, raise_error, cmcid)
 
 
+def mrbcvt_table(cachedir=None, verbose=None):
+    """
+    Return BUFR table B compiled into lookup arrays indexed by cmcid
+
+    The table is parsed only once, the compiled arrays are kept
+    in memory and, if a cachedir is set, cached on disk
+    for the next python sessions.
+
+    table = mrbcvt_table()
+
+    Args:
+        cachedir : dir where to read/write the compiled table
+                   (default: ${RPNPY_BURP_TABLE_B_CACHE_DIR},
+                    no disk cache if not set)
+        verbose  : print cache usage info
+    Returns
+        {
+        'path'   : (str) BUFR table B file the arrays were compiled from
+        'bufrid' : (ndarray of int32) Element BUFR code
+        'error'  : (ndarray of int8) 0 if found in BURP table B, -1 otherwise
+        'cvt'    : (ndarray of int8) Flag for conversion
+        'scale'  : (ndarray of int32) Scaling factor for value conversion
+        'bias'   : (ndarray of int32) Bias for value conversion
+        'nbits'  : (ndarray of int32) nb of bits for encoding value
+        'multi'  : (ndarray of int8) 1 for "multi" (repeatable) elements
+        'iunits' : (ndarray of int16) index in units, -1 if not found
+        'idesc'  : (ndarray of int32) index in desc, -1 if not found
+        'units'  : (ndarray of str) Units descriptions
+        'desc'   : (ndarray of str) Element descriptions
+        }
+        All arrays but units, desc are of size BURP_TABLE_B_NCMCID
+        and indexed by cmcid; arrays are read only.
+    Raises:
+        IOError if table B file not found
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> table = rmn.mrbcvt_table()
+    >>> cmcids = rmn.mrbcol([12004, 10004])
+    >>> units = table['units'][table['iunits'][cmcids]]
+
+    Notes:
+        Failures to write the cache file (e.g. read only dir) are ignored.
+
+    See Also:
+        mrbcvt_dict_many
+        mrbcvt_dict
+        mrbcvt_dict_path_set
+        rpnpy.librmn.burp_const.BURP_TABLE_B_CACHE_DIR_ENV
+    """
+    if _mrbcvt_dict['table'] is not None:
+        return _mrbcvt_dict['table']
+    mypath = _mrbcvt_dict_path()
+    if not os.path.isfile(mypath):
+        raise IOError(" Oops! File does not exist or is not readable: {0}".format(mypath))
+    if cachedir is None:
+        cachedir = os.getenv(_rbc.BURP_TABLE_B_CACHE_DIR_ENV, None)
+    table = _mrbcvt_table_load(mypath, cachedir, verbose)
+    if table is None:
+        table = _mrbcvt_table_compile(mypath)
+        _mrbcvt_table_save(mypath, cachedir, table, verbose)
+    for v in table.values():
+        if isinstance(v, _np.ndarray):
+            v.setflags(write=False)
+    _mrbcvt_dict['table'] = table
+    return table
+
+
+def _mrbcvt_table_compile(mypath):
+    """
+    Compile the parsed BUFR table B dict into lookup arrays
+    """
+    _mrbcvt_dict_full_init()
+    n = _rbc.BURP_TABLE_B_NCMCID
+    cmcid = _np.arange(n, dtype=_np.int32)
+    table = {
+        'path'   : mypath,
+        'bufrid' : (((cmcid >> 14) & 3) * 100000 + ((cmcid >> 8) & 63) * 1000
+                    + (cmcid & 255)).astype(_np.int32),
+        'error'  : _np.full(n, -1, dtype=_np.int8),
+        'cvt'    : _np.zeros(n, dtype=_np.int8),
+        'scale'  : _np.zeros(n, dtype=_np.int32),
+        'bias'   : _np.zeros(n, dtype=_np.int32),
+        'nbits'  : _np.zeros(n, dtype=_np.int32),
+        'multi'  : _np.zeros(n, dtype=_np.int8),
+        'iunits' : _np.full(n, -1, dtype=_np.int16),
+        'idesc'  : _np.full(n, -1, dtype=_np.int32),
+        }
+    (units, desc) = ({}, [])
+    for d in _mrbcvt_dict['dict'].values():
+        i = d['e_cmcid']
+        if not 0 <= i < n:
+            continue
+        table['error'][i] = d['e_error']
+        table['cvt'][i] = d['e_cvt']
+        table['scale'][i] = d['e_scale']
+        table['bias'][i] = d['e_bias']
+        table['nbits'][i] = d['e_nbits']
+        table['multi'][i] = d['e_multi']
+        table['iunits'][i] = units.setdefault(d['e_units'], len(units))
+        table['idesc'][i] = len(desc)
+        desc.append(d['e_desc'])
+    table['units'] = _np.array(sorted(units, key=units.get) or [''])
+    table['desc'] = _np.array(desc or [''])
+    return table
+
+
+def _mrbcvt_table_load(mypath, cachedir, verbose=None):
+    """
+    Load the compiled table for table B path
+
+    Return None if there is no valid cache for the table in its current state
+    """
+    if not cachedir:
+        return None
+    mypath = os.path.abspath(mypath)
+    table = _npzc.npzcache_load(
+        _npzc.npzcache_path(mypath, cachedir, _rbc.BURP_TABLE_B_CACHE_SUFFIX),
+        mypath, _rbc.BURP_TABLE_B_CACHE_VERSION, 'mrbcvt_table',
+        verbose=verbose)
+    if table is not None:
+        table['path'] = mypath
+    return table
+
+
+def _mrbcvt_table_save(mypath, cachedir, table, verbose=None):
+    """
+    Save the compiled table for table B path, ignore errors
+    """
+    if not cachedir:
+        return
+    mypath = os.path.abspath(mypath)
+    arrays = dict([(k, v) for (k, v) in table.items()
+                   if isinstance(v, _np.ndarray)])
+    _npzc.npzcache_save(
+        _npzc.npzcache_path(mypath, cachedir, _rbc.BURP_TABLE_B_CACHE_SUFFIX),
+        mypath, _rbc.BURP_TABLE_B_CACHE_VERSION, arrays, 'mrbcvt_table',
+        verbose)
+
+
+def mrbcvt_dict_many(cmcids):
+    """
+    Extract BUFR table B info for an array of cmcid
+
+    Vectorized version of mrbcvt_dict, lookup is done in
+    the compiled table B arrays (see mrbcvt_table).
+
+    cvtdict = mrbcvt_dict_many(cmcids)
+
+    Args:
+        cmcids : Element CMC code names (list or ndarray of int)
+    Returns
+        {
+        'e_cmcid'   : (ndarray of int32) Element CMC code
+        'e_bufrid'  : (ndarray of int32) Element BUFR code
+        'e_desc'    : (ndarray of str) Element description
+        'e_cvt'     : (ndarray of int8) Flag for conversion
+        'e_units'   : (ndarray of str) Units desciption
+        'e_scale'   : (ndarray of int32) Scaling factor for value conversion
+        'e_bias'    : (ndarray of int32) Bias for value conversion
+        'e_nbits'   : (ndarray of int32) nb of bits for encoding value
+        'e_multi'   : (ndarray of int8) 1 for "multi" (repeatable) elements
+        'e_error'   : (ndarray of int8) 0 if found in BURP table B, -1 otherwise
+        }
+        All arrays have the same shape as cmcids,
+        e_desc, e_units are '' where e_error is -1.
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on cmcids out of range
+        IOError    if table B file not found
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> funit  = rmn.burp_open(filename)
+    >>> handle = rmn.mrfloc(funit)
+    >>> rpt    = rmn.mrfget(handle, funit=funit)
+    >>> blkdata = rmn.mrbxtr(rpt, 1)
+    >>> cvtdict = rmn.mrbcvt_dict_many(blkdata['cmcids'])
+    >>> rmn.burp_close(funit)
+
+    See Also:
+        mrbcvt_table
+        mrbcvt_dict
+        mrbdcl
+    """
+    cmcids = _np.asarray(cmcids)
+    if not _np.issubdtype(cmcids.dtype, _np.integer):
+        raise TypeError('mrbcvt_dict_many: cmcids should be int, got {0}'\
+                        .format(cmcids.dtype))
+    if cmcids.size and (cmcids.min() < 0 or
+                        cmcids.max() >= _rbc.BURP_TABLE_B_NCMCID):
+        raise ValueError('mrbcvt_dict_many: cmcids out of range')
+    table = mrbcvt_table()
+    found = (table['error'][cmcids] == 0)
+    return {
+        'e_cmcid'   : cmcids.astype(_np.int32),
+        'e_bufrid'  : table['bufrid'][cmcids],
+        'e_desc'    : _np.where(found, table['desc'][table['idesc'][cmcids]],
+                                ''),
+        'e_cvt'     : table['cvt'][cmcids],
+        'e_units'   : _np.where(found,
+                                table['units'][table['iunits'][cmcids]], ''),
+        'e_scale'   : table['scale'][cmcids],
+        'e_bias'    : table['bias'][cmcids],
+        'e_nbits'   : table['nbits'][cmcids],
+        'e_multi'   : table['multi'][cmcids],
+        'e_error'   : table['error'][cmcids]
+        }
+
+
 def mrbcvt_decode(cmcids, tblval=None, datyp=_rbc.BURP_DATYP_LIST['float']):
     """
     Convert table/BUFR values to real values.
@@ -2283,6 +2769,13 @@ def mrb_prm_xtr_dcl_cvt(rpt, blkno):
     blkdata = mrbprm(rpt, blkno)
     blkdata.update(mrbxtr(rpt, blkno))
     blkdata['bufrids'] = mrbdcl(blkdata['cmcids'])
+    return _mrb_cvt(blkdata)
+
+
+def _mrb_cvt(blkdata):
+    """
+    Add decoded values 'rval' to blkdata from mrbprm+mrbxtr+mrbdcl
+    """
     if blkdata['bknat_kindd'] != 'flags':
         blkdata['rval'] = mrbcvt_decode(blkdata['cmcids'], blkdata['tblval'])
     else:
@@ -2290,62 +2783,1227 @@ def mrb_prm_xtr_dcl_cvt(rpt, blkno):
     return blkdata
 
 
-def mrbcvt_encode(cmcids, rval):
+def burp_iter(filename, stnid='*********', idtyp=-1, ilat=-1, ilon=-1,
+              date=-1, time=-1, latlon=None, timewindow=None, elements=None,
+              predicate=None, decode=True):
     """
-    Convert real values to table/BUFR values.
+    Iterate over the reports of a BURP file matching the provided criteria
 
-    tblval = mrbcvt_encode(cmcids, rval)
-    tblval = mrbcvt_encode(blkdata)
+    Reports are read one at a time into a single reused buffer.
+    Search keys are passed to mrfloc, the lat-lon box and time window
+    are checked with mrfprm before reading the report, the predicate
+    after mrbhdr, elements before decoding the blocks values.
+
+    for rpt in burp_iter(filename, ...): ...
 
     Args:
-        cmcids : List of element names in the report in numeric BUFR codes.
-                 See the code desc in the FM 94 BUFR man
-        rval   : Real-valued table data
-                 nint(rval) is used as tblval for mrbcvt_encode for not
-                 converted values
-        blkdata : (dict) Block data as returned by mrbxtr,
-                           must contains 2 keys: 'cmcids', 'rval'
-    Returns
-        array, integer table data, converted rval to tblval
-               missing values equielent to mrfopt("MISSING") will
-               be properly encoded
-               not convertable values will be copied from rval to tblval
+        filename   : name of the file to read (str)
+                     or unit number of an already opened file (int)
+        stnid, idtyp, ilat, ilon, date, time :
+                     mrfloc search keys, see mrfloc
+        latlon     : (latmin, latmax, lonmin, lonmax) box in degrees,
+                     lon in 0-360; lonmin > lonmax for a box crossing lon=0
+        timewindow : (start, end) inclusive valid time window
+                     as YYYYMMDDHHMM int or datetime.datetime
+        elements   : list of BUFR element codes, only reports/blocks
+                     with at least one of these elements are returned
+        predicate  : function called with the report header (mrbhdr dict)
+                     the report is skipped if it returns False
+        decode     : if False, do not decode the report blocks values,
+                     blocks are then only read (mrbxtr) to check elements
+    Returns:
+        iterator over reports header dict (see mrbhdr) with added keys
+        {
+            'handle' : report handle
+            'rpt'    : report buffer, reused, only valid until next report
+            'blocks' : list of blocks data (see mrb_prm_xtr_dcl_cvt),
+                       only blocks with one of elements (or their
+                       marker elements) if provided,
+                       if not decode: blocks data without 'rval'
+                       (see mrbxtr) when elements are provided, else []
+        }
     Raises:
         TypeError  on wrong input arg types
         BurpError  on any other error
 
     Examples:
     >>> import os, os.path
-    >>> import numpy as np
     >>> import rpnpy.librmn.all as rmn
     >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
     >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
-    >>> funit  = rmn.burp_open(filename)
-    >>> handle = rmn.mrfloc(funit)
-    >>> rpt    = rmn.mrfget(handle, funit=funit)
-    >>> params = rmn.mrbhdr(rpt)
-    >>> for iblk in range(params['nblk']):
-    ...     blkdata  = rmn.mrbxtr(rpt, iblk+1)
-    ...     tblval0  = blkdata['tblval'].copy()
-    ...     rval     = rmn.mrbcvt_decode(blkdata)
-    ...     tblval   = rmn.mrbcvt_encode(blkdata['cmcids'], rval)
-    ...     if not np.all(tblval == tblval0):
-    ...        print("Problem encoding rval to tblval")
-    >>> rmn.burp_close(funit)
+    >>>
+    >>> # Temperatures of radiosondes north of 45N
+    >>> for rpt in rmn.burp_iter(filename, latlon=(45., 90., 0., 360.),
+    ...                          elements=[12001]):
+    ...     for blk in rpt['blocks']:
+    ...         tt = blk['rval']
 
     See Also:
-        mrbcvt_decode
-        mrfopt
+        burp_read_table
         mrfloc
+        mrfprm
         mrfget
         mrbhdr
-        mrbprm
-        mrbxtr
-        mrbdcl
-        mrbcvt_dict
-        mrfopn
-        mrfcls
-        rpnpy.librmn.base.fnom
+        mrb_prm_xtr_dcl_cvt
+    """
+    if isinstance(filename, str):
+        funit = burp_open(filename)
+    elif isinstance(filename, _integer_types):
+        funit = filename
+    else:
+        raise TypeError("burp_iter: Expecting arg of type str or int, Got {0}"\
+                        .format(type(filename)))
+    if timewindow is not None:
+        timewindow = [int(t.strftime('%Y%m%d%H%M')) if hasattr(t, 'strftime')
+                      else int(t) for t in timewindow]
+    if elements is not None:
+        elements = set(elements)
+        elements |= set([e + 200000 for e in elements])
+    try:
+        (rpt, handle) = (None, 0)
+        while True:
+            handle = _mrfloc_next(funit, handle, stnid, idtyp, ilat, ilon,
+                                  date, time)
+            if handle <= 0:
+                break
+            if latlon is not None or timewindow is not None:
+                prm = mrfprm(handle)
+                if not _burp_iter_select(prm, latlon, timewindow):
+                    continue
+            rpt = mrfget(handle, rpt, funit)
+            hdr = mrbhdr(rpt)
+            if predicate is not None and not predicate(hdr):
+                continue
+            hdr['handle'] = handle
+            hdr['rpt'] = rpt
+            hdr['blocks'] = []
+            if decode or elements is not None:
+                hdr['blocks'] = _burp_iter_blocks(rpt, hdr['nblk'], elements,
+                                                  decode)
+                if elements is not None and not hdr['blocks']:
+                    continue
+            yield hdr
+    finally:
+        if funit is not filename:
+            burp_close(funit)
+
+
+def _mrfloc_next(funit, handle, *keys):
+    """
+    Return the handle of the next matching report, 0 at the end of the search
+
+    mrfloc fails at the end of the search, errors leaving the unit
+    unusable (checked with c_mrfnbr) are re-raised
+    """
+    try:
+        return mrfloc(funit, handle, *keys)
+    except BurpError as e:
+        if _rp.c_mrfnbr(funit) < 0:
+            raise e
+        return 0
+
+
+def _burp_iter_select(prm, latlon, timewindow):
+    """
+    Check mrfprm params against the lat-lon box and time window
+    """
+    if latlon is not None:
+        (latmin, latmax, lonmin, lonmax) = latlon
+        if not latmin <= prm['lat'] <= latmax:
+            return False
+        if lonmin <= lonmax:
+            if not lonmin <= prm['lon'] <= lonmax:
+                return False
+        elif lonmax < prm['lon'] < lonmin:
+            return False
+    if timewindow is not None:
+        t = prm['date'] * 10000 + prm['time']
+        if not timewindow[0] <= t <= timewindow[1]:
+            return False
+    return True
+
+
+def _burp_iter_blocks(rpt, nblk, elements, decode=True):
+    """
+    Return the report's blocks, with one of elements if not None
+
+    Each block is extracted once (mrbxtr includes mrbprm), when filtering
+    on elements blocks without elements are skipped on their header.
+    """
+    blocks = []
+    for iblk in range(nblk):
+        if elements is not None and mrbprm(rpt, iblk + 1)['nele'] <= 0:
+            continue
+        blkdata = mrbxtr(rpt, iblk + 1)
+        blkdata['bufrids'] = mrbdcl(blkdata['cmcids'])
+        if (elements is not None and
+            elements.isdisjoint(blkdata['bufrids'].tolist())):
+            continue
+        blocks.append(_mrb_cvt(blkdata) if decode else blkdata)
+    return blocks
+
+
+def burp_index(funit, cache=None, cachedir=None, verbose=None):
+    """
+    Build the spatial/temporal index of all the reports of a BURP file
+
+    Only the reports headers are read (mrfloc, mrfprm), the index can then
+    be queried with burp_index_query and the matching reports
+    read directly with mrfget on their handle.
+
+    If cache is enabled, the index is saved next to the file
+    (or in cachedir) and reused as long as the file is not modified.
+
+    index = burp_index(funit)
+
+    Args:
+        funit    : unit number of the file, opened with burp_open (int)
+        cache    : use/save the index file, only for files opened
+                   with burp_open in BURP_MODE_READ mode (bool)
+                   Default: only if a cachedir is set
+        cachedir : dir where to read/write index files
+                   (default: ${RPNPY_BURP_INDEX_DIR},
+                    next to the file if not set and cache=True)
+        verbose  : print index file usage info
+    Returns:
+        {
+            'handle'    : reports handle                   # numpy.ndarray
+            'stnid'     : station ID                       # numpy.ndarray
+            'idtyp'     : report type                      # numpy.ndarray
+            'lat'       : station latitude (degrees)       # numpy.ndarray
+            'lon'       : station longitude (degrees)      # numpy.ndarray
+            'date'      : report valid date (YYYYMMDD)     # numpy.ndarray
+            'time'      : observation time (HHMM)          # numpy.ndarray
+            'stamp'     : date*10000+time (YYYYMMDDHHMM)   # numpy.ndarray
+            'cell_order': reports order by lat-lon cell    # numpy.ndarray
+            'cell_start': start of each cell in cell_order # numpy.ndarray
+            'time_order': reports order by stamp           # numpy.ndarray
+        }
+    Raises:
+        TypeError  on wrong input arg types
+        BurpError  on any other error
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> funit = rmn.burp_open(filename)
+    >>> index = rmn.burp_index(funit, cachedir='.')
+    >>>
+    >>> # Reports within 200km of Montreal, between 00Z and 03Z
+    >>> rows = rmn.burp_index_query(index, latlon=(45.5, 286.4), radius=200.,
+    ...                             timewindow=(200702190000, 200702190300))
+    >>> rpt = None
+    >>> for handle in index['handle'][rows]:
+    ...     rpt = rmn.mrfget(int(handle), rpt, funit)
+    >>> rmn.burp_close(funit)
+
+    Notes:
+        Failures to write an index file (e.g. read only dir) are ignored.
+
+    See Also:
+        burp_index_query
+        burp_iter
+        mrfloc
+        mrfprm
+        mrfget
+        rpnpy.librmn.burp_const.BURP_INDEX_DIR_ENV
+    """
+    if not isinstance(funit, _integer_types):
+        raise TypeError("burp_index: Expecting arg of type int, Got {0}"\
+                        .format(type(funit)))
+    if cachedir is None:
+        cachedir = os.getenv(_rbc.BURP_INDEX_DIR_ENV, None)
+    if cache is None:
+        cache = bool(cachedir)
+    path = _burpUnitPaths.get(funit, None) if cache else None
+    try:
+        handle1 = mrfloc(funit, 0)
+    except BurpError:
+        handle1 = 0
+    index = _burp_index_load(path, cachedir, handle1, verbose)
+    if index is None:
+        index = _burp_index_scan(funit)
+        _burp_index_save(path, cachedir, index, verbose)
+    elif index['handle'].size:
+        findex = handle1 & _BURP_HANDLE_FINDEX_MASK
+        index['handle'] = ((index['handle'] & ~_BURP_HANDLE_FINDEX_MASK)
+                           | findex)
+    index.update(_burp_index_sort(index))
+    return index
+
+
+def burp_index_query(index, latlon=None, radius=None, box=None,
+                     timewindow=None, stnid=None, idtyp=None):
+    """
+    Find the reports matching the criteria in a BURP reports index
+
+    rows = burp_index_query(index, latlon=(lat, lon), radius=radius)
+    rows = burp_index_query(index, box=(latmin, latmax, lonmin, lonmax))
+    rows = burp_index_query(index, timewindow=(start, end))
+
+    Args:
+        index      : reports index as returned by burp_index
+        latlon     : (lat, lon) center in degrees, requires radius
+        radius     : max distance from latlon (km)
+        box        : (latmin, latmax, lonmin, lonmax) box in degrees,
+                     lon in 0-360; lonmin > lonmax for a box crossing lon=0
+        timewindow : (start, end) inclusive valid time window
+                     as YYYYMMDDHHMM int or datetime.datetime
+        stnid      : station ID (str)
+        idtyp      : report type (int)
+    Returns:
+        numpy.ndarray, sorted rows in index of the matching reports
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+
+    See Also:
+        burp_index
+    """
+    if (latlon is None) != (radius is None):
+        raise ValueError("burp_index_query: latlon and radius must be "+
+                         "provided together")
+    nrep = index['handle'].size
+    select = None
+    if timewindow is not None:
+        (start, end) = [int(t.strftime('%Y%m%d%H%M')) if hasattr(t, 'strftime')
+                        else int(t) for t in timewindow]
+        sstamp = index['stamp'][index['time_order']]
+        (i0, i1) = (_np.searchsorted(sstamp, start, side='left'),
+                    _np.searchsorted(sstamp, end, side='right'))
+        select = _np.zeros(nrep, dtype=bool)
+        select[index['time_order'][i0:i1]] = True
+    if latlon is not None:
+        dlat = _np.degrees(float(radius) / _rbc.BURP_EARTH_RADIUS_KM)
+        (lat0, lon0) = (float(latlon[0]), float(latlon[1]) % 360.)
+        (latmin, latmax) = (lat0 - dlat, lat0 + dlat)
+        if latmin <= -90. or latmax >= 90.:
+            dlon = 180.
+        else:
+            dlon = min(180., dlat / _np.cos(_np.radians(max(abs(latmin),
+                                                            abs(latmax)))))
+        rows = _burp_index_cells(index, latmin, latmax,
+                                 lon0 - dlon, lon0 + dlon)
+        if select is not None:
+            rows = rows[select[rows]]
+        dist = _burp_index_distance(lat0, lon0, index['lat'][rows],
+                                    index['lon'][rows])
+        rows = rows[dist <= radius]
+        select = _np.zeros(nrep, dtype=bool)
+        select[rows] = True
+    if box is not None:
+        (latmin, latmax, lonmin, lonmax) = [float(x) for x in box]
+        if lonmin > lonmax:
+            lonmax += 360.
+        rows = _burp_index_cells(index, latmin, latmax, lonmin, lonmax)
+        (lat, lon) = (index['lat'][rows], index['lon'][rows])
+        inbox = (lat >= latmin) & (lat <= latmax)
+        if box[2] <= box[3]:
+            inbox &= (lon >= box[2]) & (lon <= box[3])
+        else:
+            inbox &= (lon >= box[2]) | (lon <= box[3])
+        box_select = _np.zeros(nrep, dtype=bool)
+        box_select[rows[inbox]] = True
+        select = box_select if select is None else (select & box_select)
+    if select is None:
+        select = _np.ones(nrep, dtype=bool)
+    if stnid is not None:
+        select &= (index['stnid'] == stnid.strip())
+    if idtyp is not None:
+        select &= (index['idtyp'] == idtyp)
+    return _np.nonzero(select)[0]
+
+
+def _burp_index_scan(funit):
+    """
+    Read all the reports headers of a file into an index dict
+    """
+    names = ('handle', 'stnid', 'idtyp', 'lat', 'lon', 'date', 'time')
+    cols = dict([(k, []) for k in names])
+    handle = 0
+    while True:
+        handle = _mrfloc_next(funit, handle)
+        if handle <= 0:
+            break
+        prm = mrfprm(handle)
+        for k in names:
+            cols[k].append(prm[k])
+    dtypes = {
+        'handle' : _np.int32,
+        'stnid'  : 'U{0}'.format(_rbc.BURP_STNID_STRLEN),
+        'idtyp'  : _np.int32,
+        'lat'    : _np.float32,
+        'lon'    : _np.float32,
+        'date'   : _np.int32,
+        'time'   : _np.int32
+        }
+    index = dict([(k, _np.asarray(cols[k], dtype=dtypes[k])) for k in names])
+    index['stnid'] = _np.char.strip(index['stnid'])
+    index['stamp'] = (index['date'].astype(_np.int64) * 10000 +
+                      index['time'])
+    return index
+
+
+def _burp_index_sort(index):
+    """
+    Compute the lat-lon cells and time sorted orders of an index
+    """
+    (nlat, nlon) = _burp_index_ncells()
+    deg = _rbc.BURP_INDEX_CELL_DEG
+    ilat = _np.clip(((index['lat'] + 90.) // deg).astype(_np.intp),
+                    0, nlat - 1)
+    ilon = ((index['lon'] % 360.) // deg).astype(_np.intp) % nlon
+    cell = ilat * nlon + ilon
+    cell_order = _np.argsort(cell, kind='mergesort')
+    return {
+        'cell_order' : cell_order,
+        'cell_start' : _np.searchsorted(cell[cell_order],
+                                        _np.arange(nlat * nlon + 1)),
+        'time_order' : _np.argsort(index['stamp'], kind='mergesort')
+        }
+
+
+def _burp_index_ncells():
+    """
+    Return the number of lat, lon cells
+    """
+    deg = _rbc.BURP_INDEX_CELL_DEG
+    return (int(_np.ceil(180. / deg)), int(_np.ceil(360. / deg)))
+
+
+def _burp_index_cells(index, latmin, latmax, lonmin, lonmax):
+    """
+    Return the index rows in the cells covering the lat-lon range,
+    lonmin <= lonmax, may be outside of 0-360
+    """
+    (nlat, nlon) = _burp_index_ncells()
+    deg = _rbc.BURP_INDEX_CELL_DEG
+    (j0, j1) = [int(_np.clip((x + 90.) // deg, 0, nlat - 1))
+                for x in (latmin, latmax)]
+    if lonmax - lonmin >= 360.:
+        lonranges = [(0, nlon - 1)]
+    else:
+        (i0, i1) = (int((lonmin % 360.) // deg) % nlon,
+                    int((lonmax % 360.) // deg) % nlon)
+        lonranges = [(i0, i1)] if i0 <= i1 else [(i0, nlon - 1), (0, i1)]
+    (order, start) = (index['cell_order'], index['cell_start'])
+    rows = [order[start[j * nlon + i0]:start[j * nlon + i1 + 1]]
+            for j in range(j0, j1 + 1) for (i0, i1) in lonranges]
+    if not rows:
+        return _np.zeros(0, dtype=_np.intp)
+    return _np.sort(_np.concatenate(rows))
+
+
+def _burp_index_distance(lat0, lon0, lat, lon):
+    """
+    Great circle distance (km) from lat0, lon0 to lat, lon arrays
+    """
+    (lat0, lon0) = (_np.radians(lat0), _np.radians(lon0))
+    (lat, lon) = (_np.radians(lat.astype(_np.float64)),
+                  _np.radians(lon.astype(_np.float64)))
+    a = (_np.sin((lat - lat0) / 2.) ** 2 +
+         _np.cos(lat0) * _np.cos(lat) * _np.sin((lon - lon0) / 2.) ** 2)
+    return 2. * _rbc.BURP_EARTH_RADIUS_KM * _np.arcsin(_np.sqrt(_np.minimum(a, 1.)))
+
+
+def _burp_index_load(path, cachedir, handle1, verbose=None):
+    """
+    Load the index file for the BURP file path
+
+    Return None if there is no valid index for the file in its current state
+    """
+    if not path:
+        return None
+    # Make sure the reports handles are still the same, less the file index
+    def check(index):
+        nrep = index['handle'].size
+        if nrep == 0:
+            return handle1 <= 0
+        return ((int(index['handle'][0]) ^ handle1)
+                & ~_BURP_HANDLE_FINDEX_MASK) == 0
+    return _npzc.npzcache_load(
+        _npzc.npzcache_path(path, cachedir, _rbc.BURP_INDEX_SUFFIX), path,
+        _rbc.BURP_INDEX_VERSION, 'burp_index', check, verbose)
+
+
+def _burp_index_save(path, cachedir, index, verbose=None):
+    """
+    Save the index file for the BURP file path, ignore errors
+    """
+    if not path:
+        return
+    _npzc.npzcache_save(
+        _npzc.npzcache_path(path, cachedir, _rbc.BURP_INDEX_SUFFIX), path,
+        _rbc.BURP_INDEX_VERSION, index, 'burp_index', verbose)
+
+
+def burp_read_table(filename, flags=True, asDataFrame=False, **kwargs):
+    """
+    Read all the observations of a BURP file into a flat columnar table
+
+    One row per (report, block, element, level, group), marker (flags)
+    blocks values are attached to the matching data rows.
+
+    table = burp_read_table(filename)
+    table = burp_read_table(funit)
+
+    Args:
+        filename    : name of the file to read (str)
+        funit       : or unit number of an already opened file (int)
+        flags       : if False, do not read the marker blocks
+        asDataFrame : if True return a pandas.DataFrame (requires pandas)
+        **kwargs    : reports selection criteria, see burp_iter,
+                      with elements, only rows of these elements are kept
+    Returns:
+        {
+            'irep'    : report number (0-based), in reading order
+                                                     # numpy.ndarray
+            'stnid'   : station ID
+            'idtyp'   : report type
+            'lat'     : report latitude (degrees)
+            'lon'     : report longitude (degrees, 0-360)
+            'date'    : report date (YYYYMMDD)
+            'time'    : report time (HHMM)
+            'datetime': report date and time (numpy.datetime64)
+            'iblk'    : block number in report (1-based)
+            'btyp'    : block type
+            'bfam'    : block family
+            'element' : BUFR element code
+            'ilev'    : level index in block (0-based)
+            'igrp'    : group index in block (0-based)
+            'value'   : decoded value, NaN if missing
+            'flag'    : matching marker block flags value, -1 if none
+        }
+        or the equivalent pandas.DataFrame if asDataFrame
+        See rpnpy.librmn.burp_const.BURP_TABLE_COLUMNS for dtypes
+    Raises:
+        TypeError   on wrong input arg types
+        BurpError   on any other error
+        ImportError if asDataFrame and pandas is not available
+
+    Notes:
+        Data blocks are matched with the marker block of same
+        bktyp, bkstp, nval, nt; the flag of element e is taken from
+        the marker element 200000+e.
+        Complex data blocks (datyp 8, 9) are skipped.
+
+    Examples:
+    >>> import os, os.path
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> table = rmn.burp_read_table(filename)
+    >>>
+    >>> # Select all valid temperatures (BUFR 12001) north of 45N
+    >>> select = ((table['element'] == 12001) & (table['lat'] > 45.) &
+    ...           ~np.isnan(table['value']))
+    >>> tt = table['value'][select]
+
+    See Also:
+        burp_iter_tables
+        burp_open
+        mrfget
+        mrb_prm_xtr_dcl_cvt
+        rpnpy.librmn.burp_const.BURP_TABLE_COLUMNS
+    """
+    if isinstance(filename, str):
+        funit = burp_open(filename)
+    elif isinstance(filename, _integer_types):
+        funit = filename
+    else:
+        raise TypeError("burp_read_table: Expecting arg of type str or int, Got {0}"\
+                        .format(type(filename)))
+    reps = dict([(k, []) for k in ('stnid', 'idtyp', 'lat', 'lon',
+                                    'date', 'time')])
+    blks = dict([(k, []) for k in ('irep', 'iblk', 'btyp', 'bfam',
+                                    'datyp')])
+    rows = dict([(k, []) for k in ('ib', 'element', 'ilev', 'igrp',
+                                    'value', 'flag')])
+    # Elements are filtered on the extracted blocks rows, not by burp_iter,
+    # to extract each block only once
+    kwargs = dict(kwargs)
+    elements = kwargs.pop('elements', None)
+    if elements is not None:
+        elements = _np.asarray(list(elements), dtype=_np.int32)
+    try:
+        for hdr in burp_iter(funit, decode=False, **kwargs):
+            irep = len(reps['stnid'])
+            if (_burp_table_report(hdr['rpt'], irep, hdr['nblk'], flags,
+                                   blks, rows, elements) or
+                elements is None):
+                for k in reps.keys():
+                    reps[k].append(hdr[k])
+    finally:
+        if funit is not filename:
+            burp_close(funit)
+    table = _burp_table_columns(reps, blks, rows)
+    if asDataFrame:
+        import pandas as _pd
+        return _pd.DataFrame(table)
+    return table
+
+
+def burp_iter_tables(filename, nrep=1000, flags=True, asDataFrame=False,
+                     **kwargs):
+    """
+    Iterate over the observations of a BURP file as flat columnar tables
+    of at most nrep reports each
+
+    Streaming version of burp_read_table, memory use is bounded by nrep.
+
+    for table in burp_iter_tables(filename, nrep): ...
+
+    Args:
+        filename    : name of the file to read (str)
+        funit       : or unit number of an already opened file (int)
+        nrep        : max number of reports per table (int)
+        flags       : if False, do not read the marker blocks
+        asDataFrame : if True yield pandas.DataFrame (requires pandas)
+        **kwargs    : reports selection criteria, see burp_read_table
+    Returns:
+        iterator over tables, same columns as burp_read_table,
+        irep is the report number in reading order over the whole file
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        BurpError  on any other error
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> nrows = 0
+    >>> for table in rmn.burp_iter_tables(filename, nrep=500):
+    ...     nrows += table['irep'].size
+
+    See Also:
+        burp_read_table
+        burp_iter
+        rpnpy.librmn.burp_const.BURP_TABLE_COLUMNS
+    """
+    if not isinstance(nrep, _integer_types):
+        raise TypeError("burp_iter_tables: Expecting nrep of type int, Got {0}"\
+                        .format(type(nrep)))
+    if nrep < 1:
+        raise ValueError("burp_iter_tables: nrep should be > 0, got {0}"\
+                         .format(nrep))
+    if isinstance(filename, str):
+        funit = burp_open(filename)
+    elif isinstance(filename, _integer_types):
+        funit = filename
+    else:
+        raise TypeError("burp_iter_tables: Expecting arg of type str or int, Got {0}"\
+                        .format(type(filename)))
+    kwargs = dict(kwargs)
+    elements = kwargs.pop('elements', None)
+    if elements is not None:
+        elements = _np.asarray(list(elements), dtype=_np.int32)
+    try:
+        irep0 = 0
+        reports = burp_iter(funit, decode=False, **kwargs)
+        while True:
+            reps = dict([(k, []) for k in ('stnid', 'idtyp', 'lat', 'lon',
+                                            'date', 'time')])
+            blks = dict([(k, []) for k in ('irep', 'iblk', 'btyp', 'bfam',
+                                            'datyp')])
+            rows = dict([(k, []) for k in ('ib', 'element', 'ilev', 'igrp',
+                                            'value', 'flag')])
+            for hdr in reports:
+                irep = len(reps['stnid'])
+                if (_burp_table_report(hdr['rpt'], irep, hdr['nblk'], flags,
+                                       blks, rows, elements) or
+                    elements is None):
+                    for k in reps.keys():
+                        reps[k].append(hdr[k])
+                if len(reps['stnid']) >= nrep:
+                    break
+            if not reps['stnid']:
+                break
+            table = _burp_table_columns(reps, blks, rows)
+            table['irep'] += irep0
+            irep0 += len(reps['stnid'])
+            if asDataFrame:
+                import pandas as _pd
+                table = _pd.DataFrame(table)
+            yield table
+    finally:
+        if funit is not filename:
+            burp_close(funit)
+
+
+def burp_read_tables(filenames, nproc=None, flags=True, asDataFrame=False,
+                     **kwargs):
+    """
+    Read the observations of many BURP files, concurrently,
+    into one flat columnar table
+
+    Files are read with burp_read_table in a pool of processes
+    (the librmn unit table is global, threads cannot be used);
+    each process hands back its columns in shared memory,
+    the tables are then concatenated in filenames order.
+
+    table = burp_read_tables(filenames)
+    table = burp_read_tables(filenames, nproc)
+
+    Args:
+        filenames   : list of names of the files to read (list of str)
+        nproc       : number of processes (default: os.cpu_count())
+                      if 1, files are read sequentially in this process
+        flags       : if False, do not read the marker blocks
+        asDataFrame : if True return a pandas.DataFrame (requires pandas)
+        **kwargs    : reports selection criteria, see burp_read_table
+    Returns:
+        {
+            'ifile'   : index of the file in filenames   # numpy.ndarray
+            ...       : same columns as burp_read_table
+        }
+        or a pandas.DataFrame with the same columns if asDataFrame
+    Raises:
+        TypeError  on wrong input arg types
+        BurpError  on any other error
+
+    Examples:
+    >>> import os, os.path, glob
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filenames = sorted(glob.glob(os.path.join(ATM_MODEL_DFILES,
+    ...                                           'bcmk_burp', '*.brp')))
+    >>> table = rmn.burp_read_tables(filenames, nproc=4)
+
+    Notes:
+        Requires python >= 3.8 (multiprocessing.shared_memory) for nproc > 1
+
+    See Also:
+        burp_read_table
+        burp_iter
+        rpnpy.librmn.burp_const.BURP_TABLE_COLUMNS
+    """
+    if isinstance(filenames, str) or not all(isinstance(f, str)
+                                             for f in filenames):
+        raise TypeError("burp_read_tables: Expecting a list of str, Got {0}"\
+                        .format(repr(filenames)))
+    filenames = list(filenames)
+    if nproc is None:
+        nproc = os.cpu_count() or 1
+    nproc = max(1, min(int(nproc), len(filenames)))
+    if nproc == 1:
+        tables = [burp_read_table(f, flags, **kwargs) for f in filenames]
+        table = _burp_tables_merge(tables, [t['irep'].size for t in tables])
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=nproc) as pool:
+            jobs = [pool.submit(_burp_read_tables_worker, f, flags, kwargs)
+                    for f in filenames]
+        (results, errors) = ([], [])
+        for job in jobs:
+            try:
+                results.append(job.result())
+            except Exception as e:
+                errors.append(e)
+        # This process owns the workers shared memory blocks from now on
+        shms = _burp_tables_attach_shm(results, errors)
+        try:
+            if errors:
+                raise errors[0]
+            table = _burp_tables_merge_shm(shms, results)
+        finally:
+            _burp_tables_unlink_shm(shms)
+    if asDataFrame:
+        import pandas as _pd
+        return _pd.DataFrame(table)
+    return table
+
+
+def _burp_read_tables_worker(filename, flags, kwargs):
+    """
+    Read a BURP file table and copy its columns into shared memory
+
+    The block is not tracked by this worker's resource_tracker,
+    which would otherwise unlink it when the worker exits,
+    the parent process attaches then unlinks it.
+
+    Return (shared memory name, nrows, [(column, dtype, offset), ...])
+    """
+    from multiprocessing import shared_memory as _shm
+    table = burp_read_table(filename, flags, **kwargs)
+    (layout, nbytes) = ([], 0)
+    for (k, v) in table.items():
+        layout.append((k, v.dtype.str, nbytes))
+        nbytes += (v.nbytes + 7) // 8 * 8
+    if sys.version_info >= (3, 13):
+        shm = _shm.SharedMemory(create=True, size=max(1, nbytes), track=False)
+    else:
+        from multiprocessing import resource_tracker as _rt
+        shm = _shm.SharedMemory(create=True, size=max(1, nbytes))
+        _rt.unregister(shm._name, 'shared_memory')
+    try:
+        for (k, t, o) in layout:
+            v = table[k]
+            _np.ndarray(v.shape, dtype=v.dtype, buffer=shm.buf, offset=o)[:] = v
+        return (shm.name, table['irep'].size, layout)
+    finally:
+        shm.close()
+
+
+def _burp_tables_attach_shm(results, errors):
+    """
+    Attach the workers shared memory blocks, append failures to errors
+    """
+    from multiprocessing import shared_memory as _shm
+    shms = []
+    for (name, nrows, layout) in results:
+        try:
+            shms.append(_shm.SharedMemory(name=name))
+        except (OSError, ValueError) as e:
+            errors.append(e)
+    return shms
+
+
+def _burp_tables_merge_shm(shms, results):
+    """
+    Concatenate per file columns from shared memory into one table
+    """
+    columns = [dict([(k, _np.ndarray((nrows, ), dtype=_np.dtype(t),
+                                     buffer=shm.buf, offset=o))
+                     for (k, t, o) in layout])
+               for (shm, (name, nrows, layout)) in zip(shms, results)]
+    table = _burp_tables_merge(columns, [r[1] for r in results])
+    del columns
+    return table
+
+
+def _burp_tables_unlink_shm(shms):
+    """
+    Close and unlink the attached shared memory blocks, ignore errors
+
+    Unlink is done even if close fails, e.g. with a BufferError
+    when views on the block are still held by a traceback
+    """
+    for shm in shms:
+        try:
+            shm.close()
+        except (OSError, ValueError, BufferError):
+            pass
+        try:
+            shm.unlink()
+        except (OSError, ValueError):
+            pass
+
+
+def _burp_tables_merge(columns, nrows):
+    """
+    Concatenate per file columns into one table with an added ifile column
+    """
+    table = {'ifile': _np.repeat(_np.arange(len(nrows), dtype=_np.int32),
+                                 nrows)}
+    for (k, t) in _rbc.BURP_TABLE_COLUMNS:
+        table[k] = _np.empty(sum(nrows), dtype=t)
+        i0 = 0
+        for (cols, n) in zip(columns, nrows):
+            table[k][i0:i0+n] = cols[k]
+            i0 += n
+    return table
+
+
+def burp_write_table(filename, table, append=False):
+    """
+    Write a flat columnar observations table into a BURP file
+
+    Inverse of burp_read_table: one report per irep, one data block
+    per (irep, iblk) plus a marker block where flags are provided.
+    All values of integer coded blocks are encoded at once
+    (see mrbcvt_encode_many) and a single report buffer,
+    sized for the largest report, is reused.
+
+    nrep = burp_write_table(filename, table)
+    nrep = burp_write_table(funit, table)
+
+    Args:
+        filename : name of the file to write (str)
+        funit    : or unit number of an already opened file (int)
+        table    : dict of columns (or pandas.DataFrame) as returned by
+                   burp_read_table, rows do not need to be sorted;
+                   required columns:
+                       irep, stnid, idtyp, lat, lon, date, time,
+                       iblk, btyp, bfam, element, ilev, igrp, value
+                   optional columns:
+                       flag (-1 for no flag),
+                       datyp (block datyp, default: integer coded),
+                       flgs, idx, idy, ielev, drnd, oars, runn (default 0)
+        append   : if True, append to an existing file (filename only)
+    Returns:
+        int, number of reports written
+    Raises:
+        TypeError  on wrong input arg types
+        KeyError   on missing table columns
+        BurpError  on any other error
+
+    Examples:
+    >>> import os, os.path
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> table = rmn.burp_read_table(filename)
+    >>>
+    >>> # Keep only the temperature observations
+    >>> keep = (table['element'] == 12001)
+    >>> table = dict([(k, v[keep]) for k, v in table.items()])
+    >>> nrep = rmn.burp_write_table('newfile.brp', table)
+    >>> os.unlink('newfile.brp')  # Remove test file
+
+    Notes:
+        Blocks of datyp 6 or 7 (float, double) are written as such,
+        missing (NaN) values as BURP_RVAL_MISSING; other values are written as
+        integer coded blocks (datyp 2 or 4), nbit is set per block
+        from the encoded values range.
+
+    See Also:
+        burp_read_table
+        mrbini
+        mrbadd
+        mrfput
+        mrbcvt_encode_many
+        rpnpy.librmn.burp_const.BURP_TABLE_COLUMNS
+    """
+    if isinstance(filename, str):
+        funit = burp_open(filename, _rbc.BURP_MODE_APPEND if append
+                          else _rbc.BURP_MODE_CREATE)
+    elif isinstance(filename, _integer_types):
+        funit = filename
+    else:
+        raise TypeError("burp_write_table: Expecting arg of type str or int, Got {0}"\
+                        .format(type(filename)))
+    try:
+        return _burp_write_table(funit, table)
+    finally:
+        if funit is not filename:
+            burp_close(funit)
+
+
+def _burp_write_table(funit, table):
+    """
+    Encode and write the table reports to funit, see burp_write_table
+    """
+    cols = dict([(k, _np.asarray(table[k])) for k in
+                 ('irep', 'stnid', 'idtyp', 'lat', 'lon', 'date', 'time',
+                  'iblk', 'btyp', 'bfam', 'element', 'ilev', 'igrp', 'value')])
+    nrows = cols['irep'].size
+    flag = _np.asarray(table['flag']) if 'flag' in table.keys() else \
+        _np.full(nrows, -1, dtype=_np.int32)
+    datyps = _np.asarray(table['datyp']) if 'datyp' in table.keys() else \
+        _np.zeros(nrows, dtype=_np.int32)
+    isfloat = _np.isin(datyps, (_rbc.BURP_DATYP_LIST['float'],
+                                _rbc.BURP_DATYP_LIST['double']))
+    hcols = dict([(k, _np.asarray(table[k]) if k in table.keys() else
+                   _np.zeros(nrows, dtype=_np.int32))
+                  for k in ('flgs', 'idx', 'idy', 'ielev', 'drnd',
+                            'oars', 'runn')])
+    if nrows == 0:
+        return 0
+
+    # Block of each row, element position in its block
+    bkey = (cols['irep'].astype(_np.int64) << 20) + cols['iblk']
+    (ublk, ib) = _np.unique(bkey, return_inverse=True)
+    ekey = (ib.astype(_np.int64) << 24) + cols['element']
+    (uele, efirst, iele) = _np.unique(ekey, return_index=True,
+                                      return_inverse=True)
+    eblk = uele >> 24
+    eorder = _np.lexsort((efirst, eblk))
+    nele = _np.bincount(eblk, minlength=ublk.size)
+    estart = _np.concatenate(([0], _np.cumsum(nele)))
+    epos = _np.empty(uele.size, dtype=_np.intp)
+    epos[eorder] = _np.arange(uele.size) - estart[eblk[eorder]]
+    ie = epos[iele]
+    nval = _np.zeros(ublk.size, dtype=_np.intp)
+    nt = _np.zeros(ublk.size, dtype=_np.intp)
+    _np.maximum.at(nval, ib, cols['ilev'] + 1)
+    _np.maximum.at(nt, ib, cols['igrp'] + 1)
+
+    # Encode all the values at once
+    elements = (uele[eorder] & 0xFFFFFF).astype(_np.int32)
+    (uelements, iuele) = _np.unique(elements, return_inverse=True)
+    ucmcids = _np.asarray(mrbcol(uelements.tolist()), dtype=_np.int32)
+    cmcids = ucmcids[iuele]
+    rcmcids = _np.empty(uele.size, dtype=_np.int32)
+    rcmcids[eorder] = cmcids
+    tblval = _np.zeros(nrows, dtype=_np.int32)
+    isint = ~isfloat
+    if _np.any(isint):
+        tblval[isint] = mrbcvt_encode_many(
+            rcmcids[iele][isint], cols['value'][isint].astype(_np.float64),
+            missing=_np.nan)
+
+    # Rows sorted by block for contiguous per block slices
+    rorder = _np.argsort(ib, kind='mergesort')
+    rstart = _np.searchsorted(ib[rorder], _np.arange(ublk.size + 1))
+    mcmcids = mrbcol((uelements + 200000).tolist())
+    mcmcids = _np.asarray(mcmcids, dtype=_np.int32)[iuele]
+
+    blocks = []
+    for b in range(ublk.size):
+        rows = rorder[rstart[b]:rstart[b+1]]
+        shape = (int(nele[b]), int(nval[b]), int(nt[b]))
+        index = (ie[rows], cols['ilev'][rows], cols['igrp'][rows])
+        if isfloat[rows[0]]:
+            datyp = int(datyps[rows[0]])
+            ftype = _rbc.BURP_DATYP2NUMPY_LIST[datyp]
+            fmissing = ftype(_rbc.BURP_RVAL_MISSING[datyp])
+            bval = _np.full(shape, fmissing, dtype=ftype, order='F')
+            value = cols['value'][rows].astype(ftype)
+            bval[index] = _np.where(_np.isnan(value), fmissing, value)
+        else:
+            bval = _np.full(shape, _rbc.BURP_TBLVAL_MISSING,
+                            dtype=_np.int32, order='F')
+            bval[index] = tblval[rows]
+        bflag = None
+        if _np.any(flag[rows] >= 0):
+            bflag = _np.full(shape, _rbc.BURP_TBLVAL_MISSING,
+                             dtype=_np.int32, order='F')
+            bflag[index] = flag[rows]
+        e0 = estart[b]
+        blocks.append((rows[0], cmcids[e0:e0+shape[0]], bval,
+                       mcmcids[e0:e0+shape[0]], bflag))
+
+    # Write the reports, reusing a buffer sized for the largest one
+    bblk = (ublk >> 20).astype(_np.int64)
+    (urep, bstart) = _np.unique(bblk, return_index=True)
+    bstart = _np.concatenate((bstart, [ublk.size]))
+    lrpt = [_rbc.LRPT(sum(_rbc.LBLK(int(nele[b]), int(nval[b]), int(nt[b]),
+                                    blocks[b][2].itemsize * 8) * 2
+                          for b in range(bstart[r], bstart[r+1])))
+            for r in range(urep.size)]
+    nrpt = int(max(lrpt)) + 1024
+    rpt = _np.empty((nrpt, ), dtype=_np.int32)
+    mbtyps = {}
+    for r in range(urep.size):
+        row0 = blocks[bstart[r]][0]
+        rpt[0] = nrpt
+        hdr = dict([(k, int(v[row0])) for (k, v) in hcols.items()])
+        mrbini(funit, rpt, time=int(cols['time'][row0]), flgs=hdr['flgs'],
+               stnid=str(cols['stnid'][row0]),
+               idtyp=int(cols['idtyp'][row0]),
+               ilat=_rbc.BRP_RLAT2ILAT(float(cols['lat'][row0])),
+               ilon=_rbc.BRP_RLON2ILON(float(cols['lon'][row0])),
+               idx=hdr['idx'], idy=hdr['idy'], ielev=hdr['ielev'],
+               drnd=hdr['drnd'], date=int(cols['date'][row0]),
+               oars=hdr['oars'], runn=hdr['runn'])
+        for b in range(bstart[r], bstart[r+1]):
+            (row0, bcmcids, bval, bmcmcids, bflag) = blocks[b]
+            (btyp, bfam) = (int(cols['btyp'][row0]), int(cols['bfam'][row0]))
+            _burp_write_block(rpt, btyp, bfam, bcmcids, bval)
+            if bflag is not None:
+                if btyp not in mbtyps:
+                    mbtyps[btyp] = _burp_marker_btyp(btyp)
+                _burp_write_block(rpt, mbtyps[btyp], bfam, bmcmcids, bflag)
+        mrfput(funit, 0, rpt)
+    return int(urep.size)
+
+
+def _burp_write_block(rpt, btyp, bfam, cmcids, tblval):
+    """
+    Add a block to rpt, float32/64 tblval as a float/double block,
+    else integer coded with datyp, nbit from tblval range
+    """
+    isfloat = tblval.dtype in (_np.float32, _np.float64)
+    (vmin, vmax) = (int(tblval.min()), int(tblval.max())) \
+        if not isfloat else (0, 0)
+    if tblval.dtype == _np.float32:
+        (datyp, nbit) = (_rbc.BURP_DATYP_LIST['float'], 32)
+    elif tblval.dtype == _np.float64:
+        (datyp, nbit) = (_rbc.BURP_DATYP_LIST['double'], 64)
+    elif vmin < _rbc.BURP_TBLVAL_MISSING:
+        datyp = _rbc.BURP_DATYP_LIST['int']
+        nbit = max(abs(vmin), vmax + 1).bit_length() + 1
+    else:
+        datyp = _rbc.BURP_DATYP_LIST['uint']
+        nbit = max(1, (vmax + 1).bit_length())
+    (nele, nval, nt) = tblval.shape
+    mrbadd(rpt, nele, nval, nt, bfam, 0, btyp, nbit if isfloat else min(nbit, 32),
+           datyp, _np.asfortranarray(cmcids, dtype=_np.int32), tblval)
+
+
+def _burp_marker_btyp(btyp):
+    """
+    Return the btyp of the marker (flags) block matching a data block btyp
+    """
+    params = mrbtyp_decode(btyp)
+    params['bknat'] = mrbtyp_encode_bknat(params['bknat_multi'],
+                                          _rbc.BURP_BKNAT_KIND_IDX['flags'])
+    return mrbtyp_encode(params)
+
+
+def _burp_table_report(rpt, irep, nblk, flags, blks, rows, elements=None):
+    """
+    Append the rows of all the data blocks of a report to blks, rows
+
+    Return True if any block was appended
+    """
+    nblks = len(blks['irep'])
+    blocks = [mrbprm(rpt, iblk + 1) for iblk in range(nblk)]
+    markers = {}
+    if flags:
+        for bhp in blocks:
+            if bhp['bknat_kindd'] == 'flags' and bhp['nele'] > 0:
+                bdata = mrbxtr(rpt, bhp['bkno'])
+                mkey = (bhp['bktyp'], bhp['bkstp'], bhp['nval'], bhp['nt'])
+                markers.setdefault(mkey, []).append(
+                    (mrbdcl(bdata['cmcids']), bdata['tblval']))
+    for bhp in blocks:
+        if bhp['bknat_kindd'] == 'flags' or bhp['nele'] < 1:
+            continue
+        datyp = bhp['datyp']
+        if datyp in (_rbc.BURP_DATYP_LIST['complex'],
+                     _rbc.BURP_DATYP_LIST['dcomplex']):
+            continue
+        if datyp in (_rbc.BURP_DATYP_LIST['float'],
+                     _rbc.BURP_DATYP_LIST['double']):
+            ftype = _rbc.BURP_DATYP2NUMPY_LIST[datyp]
+            bdata = mrbxtr(rpt, bhp['bkno'], dtype=ftype)
+            rval = bdata['tblval']
+            rval = _np.where(rval == ftype(_rbc.BURP_RVAL_MISSING[datyp]),
+                             _np.nan, rval)
+        elif datyp in (_rbc.BURP_DATYP_LIST['uint'],
+                       _rbc.BURP_DATYP_LIST['int']):
+            bdata = mrbxtr(rpt, bhp['bkno'])
+            rval = mrbcvt_decode_many(bdata, missing=_np.nan)
+        else:
+            bdata = mrbxtr(rpt, bhp['bkno'])
+            rval = bdata['tblval'].astype(_np.float32)
+        bufrids = mrbdcl(bdata['cmcids'])
+        (ie, il, ig) = [i.ravel(order='F') for i in _np.indices(rval.shape)]
+        flag = _np.full(ie.shape, -1, dtype=_np.int32)
+        mkey = (bhp['bktyp'], bhp['bkstp'], bhp['nval'], bhp['nt'])
+        if markers.get(mkey, None):
+            (mbufrids, mtblval) = markers[mkey].pop(0)
+            mpos = _np.full(bufrids.shape, -1, dtype=_np.intp)
+            mlist = mbufrids.tolist()
+            for (i, e) in enumerate(bufrids.tolist()):
+                if e + 200000 in mlist:
+                    mpos[i] = mlist.index(e + 200000)
+            has = (mpos[ie] >= 0)
+            flag[has] = mtblval[mpos[ie[has]], il[has], ig[has]]
+        rval = rval.ravel(order='F')
+        if elements is not None:
+            keep = _np.isin(bufrids[ie], elements)
+            if not _np.any(keep):
+                continue
+            (ie, il, ig, rval, flag) = (ie[keep], il[keep], ig[keep],
+                                        rval[keep], flag[keep])
+        rows['ib'].append(_np.full(ie.shape, len(blks['irep']),
+                                   dtype=_np.int32))
+        rows['element'].append(bufrids[ie])
+        rows['ilev'].append(il)
+        rows['igrp'].append(ig)
+        rows['value'].append(rval)
+        rows['flag'].append(flag)
+        blks['irep'].append(irep)
+        blks['iblk'].append(bhp['bkno'])
+        blks['btyp'].append(bhp['btyp'])
+        blks['bfam'].append(bhp['bfam'])
+        blks['datyp'].append(datyp)
+    return len(blks['irep']) > nblks
+
+
+def _burp_table_columns(reps, blks, rows):
+    """
+    Build the table columns from per reports, blocks, rows lists
+    """
+    dtypes = dict(_rbc.BURP_TABLE_COLUMNS)
+    table = {}
+    if rows['ib']:
+        ib = _np.concatenate(rows['ib'])
+    else:
+        ib = _np.zeros(0, dtype=_np.int32)
+    irep = _np.asarray(blks['irep'], dtype=_np.int32)[ib]
+    table['irep'] = irep
+    for k in ('stnid', 'idtyp', 'lat', 'lon', 'date', 'time'):
+        table[k] = _np.asarray(reps[k], dtype=dtypes[k])[irep]
+    table['datetime'] = _burp_datetime(
+        _np.asarray(reps['date'], dtype=_np.int64),
+        _np.asarray(reps['time'], dtype=_np.int64))[irep]
+    for k in ('iblk', 'btyp', 'bfam', 'datyp'):
+        table[k] = _np.asarray(blks[k], dtype=dtypes[k])[ib]
+    for k in ('element', 'ilev', 'igrp', 'value', 'flag'):
+        if rows[k]:
+            table[k] = _np.concatenate(rows[k]).astype(dtypes[k], copy=False)
+        else:
+            table[k] = _np.zeros(0, dtype=dtypes[k])
+    return dict([(k, table[k]) for (k, t) in _rbc.BURP_TABLE_COLUMNS])
+
+
+def _burp_datetime(date, time):
+    """
+    Convert arrays of YYYYMMDD, HHMM into numpy.datetime64[m]
+    """
+    yy = (date // 10000 - 1970).astype('datetime64[Y]')
+    dt = yy.astype('datetime64[M]') + \
+        (date // 100 % 100 - 1).astype('timedelta64[M]')
+    dt = dt.astype('datetime64[D]') + (date % 100 - 1).astype('timedelta64[D]')
+    return dt.astype('datetime64[m]') + \
+        (time // 100 * 60 + time % 100).astype('timedelta64[m]')
+
+
+def mrbcvt_encode(cmcids, rval):
+    """
+    Convert real values to table/BUFR values.
+
+    tblval = mrbcvt_encode(cmcids, rval)
+    tblval = mrbcvt_encode(blkdata)
+
+    Args:
+        cmcids : List of element names in the report in numeric BUFR codes.
+                 See the code desc in the FM 94 BUFR man
+        rval   : Real-valued table data
+                 nint(rval) is used as tblval for mrbcvt_encode for not
+                 converted values
+        blkdata : (dict) Block data as returned by mrbxtr,
+                           must contains 2 keys: 'cmcids', 'rval'
+    Returns
+        array, integer table data, converted rval to tblval
+               missing values equielent to mrfopt("MISSING") will
+               be properly encoded
+               not convertable values will be copied from rval to tblval
+    Raises:
+        TypeError  on wrong input arg types
+        BurpError  on any other error
+
+    Examples:
+    >>> import os, os.path
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> funit  = rmn.burp_open(filename)
+    >>> handle = rmn.mrfloc(funit)
+    >>> rpt    = rmn.mrfget(handle, funit=funit)
+    >>> params = rmn.mrbhdr(rpt)
+    >>> for iblk in range(params['nblk']):
+    ...     blkdata  = rmn.mrbxtr(rpt, iblk+1)
+    ...     tblval0  = blkdata['tblval'].copy()
+    ...     rval     = rmn.mrbcvt_decode(blkdata)
+    ...     tblval   = rmn.mrbcvt_encode(blkdata['cmcids'], rval)
+    ...     if not np.all(tblval == tblval0):
+    ...        print("Problem encoding rval to tblval")
+    >>> rmn.burp_close(funit)
+
+    See Also:
+        mrbcvt_decode
+        mrfopt
+        mrfloc
+        mrfget
+        mrbhdr
+        mrbprm
+        mrbxtr
+        mrbdcl
+        mrbcvt_dict
+        mrfopn
+        mrfcls
+        rpnpy.librmn.base.fnom
         rpnpy.librmn.base.fclos
         rpnpy.librmn.burp_const
     """
@@ -2412,6 +4070,211 @@ def mrbcvt_encode(cmcids, rval):
     return tblval
 
 
+
+def mrbcvt_decode_many(cmcids, tblval=None, datyp=None, missing=None):
+    """
+    Convert table/BUFR values to real values, vectorized NumPy version
+
+    Unlike mrbcvt_decode, the conversion is done in NumPy with the
+    compiled table B arrays (see mrbcvt_table), without librmn calls,
+    for any number of blocks at once, and tblval is not modified.
+
+    rval  = mrbcvt_decode_many(cmcids, tblval)
+    rval  = mrbcvt_decode_many(cmcids, tblval, datyp)
+    rvals = mrbcvt_decode_many(blocks)
+
+    Args:
+        cmcids  : Element CMC codes (ndarray of int),
+                  either of shape (nele,) for tblval of shape (nele, ...)
+                  or of the same shape as tblval (e.g. concatenated
+                  values of many blocks)
+        tblval  : BUFR code values (ndarray of int or float)
+        datyp   : (optional) Data type as obtained from mrbprm (int)
+                  See rpnpy.librmn.burp_const BURP_DATYP_LIST
+                  Default: None, integer coded values (uint, int)
+        missing : (optional) value to use for missing values
+                  Default: mrfopt(BURPOP_MISSING)
+        blocks  : list of blocks data (dict) as returned by mrbxtr,
+                  must contain keys 'cmcids', 'tblval', optionally 'datyp';
+                  all integer coded blocks are converted at once
+    Returns
+        array, converted tblval to rval
+               float32 for integer coded values (float64 for double)
+               uint, int values: rval = (tblval + bias) / 10**scale
+                                 missing where tblval == -1
+               code/flag table and unknown elements are copied as is
+               float, double, complex values are copied as is
+               binary, char, upchar values are copied as is (uint32, uint8)
+        list of array if blocks was provided
+    Raises:
+        KeyError   on missing blkdata keys
+        TypeError  on wrong input arg types
+        ValueError on wrong input arg value
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_burp','2007021900.brp')
+    >>> funit  = rmn.burp_open(filename)
+    >>> handle = rmn.mrfloc(funit)
+    >>> rpt    = rmn.mrfget(handle, funit=funit)
+    >>> params = rmn.mrbhdr(rpt)
+    >>> blocks = [rmn.mrbxtr(rpt, iblk+1) for iblk in range(params['nblk'])]
+    >>> rvals  = rmn.mrbcvt_decode_many(blocks)
+    >>> rmn.burp_close(funit)
+
+    See Also:
+        mrbcvt_decode
+        mrbcvt_encode_many
+        mrbcvt_table
+        rpnpy.librmn.burp_const.BURP_DATYP_LIST
+    """
+    if missing is None:
+        missing = mrfopt(_rbc.BURPOP_MISSING)
+    if isinstance(cmcids, (list, tuple)):
+        return _mrbcvt_many_blocks(cmcids, 'tblval', _rbc.MRBCVT_DECODE,
+                                   missing)
+    if isinstance(cmcids, dict):
+        try:
+            (cmcids, tblval) = (cmcids['cmcids'], cmcids['tblval'])
+        except KeyError:
+            raise KeyError('Provided blkdata should have these 2 keys: cmcids, tblval')
+    if not isinstance(tblval, _np.ndarray):
+        raise TypeError('Provided tblval should be an ndarray')
+    if datyp is not None and datyp not in _rbc.BURP_DATYP_NAMES.keys():
+        raise ValueError('Out of range datyp={0}'.format(datyp))
+    if datyp is not None and _rbc.BURP_DATYP_NAMES[datyp] not in ('uint', 'int'):
+        return tblval.astype(_rbc.BURP_DATYP2NUMPY_LIST[datyp])
+    cmcids = _mrbcvt_many_cmcids(cmcids, tblval.shape)
+    return _mrbcvt_many(cmcids, tblval, _rbc.MRBCVT_DECODE, missing)
+
+
+def mrbcvt_encode_many(cmcids, rval=None, missing=None):
+    """
+    Convert real values to table/BUFR values, vectorized NumPy version
+
+    Inverse of mrbcvt_decode_many for integer coded values.
+
+    tblval  = mrbcvt_encode_many(cmcids, rval)
+    tblvals = mrbcvt_encode_many(blocks)
+
+    Args:
+        cmcids  : Element CMC codes (ndarray of int),
+                  either of shape (nele,) for rval of shape (nele, ...)
+                  or of the same shape as rval
+        rval    : Real-valued table data (ndarray)
+        missing : (optional) rval value of missing values,
+                  NaN are always considered missing
+                  Default: mrfopt(BURPOP_MISSING)
+        blocks  : list of blocks data (dict),
+                  must contain keys 'cmcids', 'rval'
+    Returns
+        array of int32, tblval = nint(rval * 10**scale - bias)
+               -1 for missing values
+               code/flag table and unknown elements: nint(rval)
+        list of array if blocks was provided
+    Raises:
+        KeyError   on missing blkdata keys
+        TypeError  on wrong input arg types
+
+    See Also:
+        mrbcvt_encode
+        mrbcvt_decode_many
+        mrbcvt_table
+    """
+    if missing is None:
+        missing = mrfopt(_rbc.BURPOP_MISSING)
+    if isinstance(cmcids, (list, tuple)):
+        return _mrbcvt_many_blocks(cmcids, 'rval', _rbc.MRBCVT_ENCODE,
+                                   missing)
+    if isinstance(cmcids, dict):
+        try:
+            (cmcids, rval) = (cmcids['cmcids'], cmcids['rval'])
+        except KeyError:
+            raise KeyError('Provided blkdata should have these 2 keys: cmcids, rval')
+    if not isinstance(rval, _np.ndarray):
+        raise TypeError('Provided rval should be an ndarray')
+    cmcids = _mrbcvt_many_cmcids(cmcids, rval.shape)
+    return _mrbcvt_many(cmcids, rval, _rbc.MRBCVT_ENCODE, missing)
+
+
+def _mrbcvt_many_cmcids(cmcids, shape):
+    """
+    Return cmcids broadcastable against values of the given shape
+    """
+    cmcids = _np.asarray(cmcids)
+    if not _np.issubdtype(cmcids.dtype, _np.integer):
+        raise TypeError('cmcids should be of int type, got: {0}'
+                        .format(cmcids.dtype))
+    if cmcids.shape == tuple(shape):
+        return cmcids
+    if cmcids.ndim != 1 or len(shape) < 1 or cmcids.size != shape[0]:
+        raise TypeError('cmcids should be of shape (nele,) or {0}, got: {1}'
+                        .format(tuple(shape), cmcids.shape))
+    return cmcids.reshape((-1, ) + (1, ) * (len(shape) - 1))
+
+
+def _mrbcvt_many_blocks(blocks, vname, mode, missing):
+    """
+    Convert all integer coded blocks values at once, return list of arrays
+    """
+    results = [None] * len(blocks)
+    (icvt, cmcs, vals) = ([], [], [])
+    for (i, blk) in enumerate(blocks):
+        try:
+            (cmcids, val) = (_np.asarray(blk['cmcids']), blk[vname])
+        except KeyError:
+            raise KeyError('Provided blkdata should have these 2 keys: cmcids, {0}'.format(vname))
+        datyp = blk.get('datyp', None)
+        if (mode == _rbc.MRBCVT_DECODE and datyp is not None and
+            _rbc.BURP_DATYP_NAMES.get(datyp, None) not in ('uint', 'int')):
+            results[i] = mrbcvt_decode_many(cmcids, val, datyp, missing)
+            continue
+        cmcids = _mrbcvt_many_cmcids(cmcids, val.shape)
+        icvt.append(i)
+        cmcs.append(_np.broadcast_to(cmcids, val.shape).ravel(order='F'))
+        vals.append(val.ravel(order='F'))
+    if icvt:
+        allval = _mrbcvt_many(_np.concatenate(cmcs), _np.concatenate(vals),
+                              mode, missing)
+        offset = 0
+        for i in icvt:
+            val = blocks[i][vname]
+            results[i] = allval[offset:offset+val.size]\
+                .reshape(val.shape, order='F')
+            offset += val.size
+    return results
+
+
+def _mrbcvt_many(cmcids, values, mode, missing):
+    """
+    Apply table B scale, bias to values, cmcids broadcastable to values
+    """
+    table = mrbcvt_table()
+    cmcids = _np.clip(cmcids, 0, _rbc.BURP_TABLE_B_NCMCID - 1)
+    cvt = (table['error'][cmcids] == 0) & (table['cvt'][cmcids] != 0)
+    factor = 10. ** table['scale'][cmcids]
+    bias = table['bias'][cmcids]
+    if mode == _rbc.MRBCVT_DECODE:
+        dtype = _np.float64 if values.dtype == _np.float64 else _np.float32
+        tblval = values.astype(_np.float64)
+        ismissing = (tblval == _rbc.BURP_TBLVAL_MISSING)
+        # Negative values are shifted by -1 on encoding, -1 being missing
+        tblval = _np.where(tblval < _rbc.BURP_TBLVAL_MISSING, tblval + 1.,
+                           tblval)
+        rval = _np.where(cvt, (tblval + bias) / factor, values)
+        rval[_np.broadcast_to(ismissing, rval.shape)] = missing
+        return _np.asfortranarray(rval.astype(dtype))
+    rval = values.astype(_np.float64)
+    ismissing = _np.isnan(rval) | (rval == missing)
+    rval = _np.where(ismissing, 0., rval)
+    tblval = _np.where(cvt, _np.round(rval * factor - bias), _np.round(rval))
+    tblval = _np.where(tblval < 0, tblval - 1., tblval)
+    tblval[_np.broadcast_to(ismissing, tblval.shape)] = \
+        _rbc.BURP_TBLVAL_MISSING
+    return _np.asfortranarray(tblval.astype(_np.int32))
+
 #TODO?: remove sup, nsup, xaux, nxaux from itf since not supported
 def mrbini(funit, rpt, time=None, flgs=None, stnid=None, idtyp=None, ilat=None,
            ilon=None, idx=None, idy=None, ielev=None, drnd=None, date=None,
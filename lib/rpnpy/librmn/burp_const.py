@@ -106,6 +106,24 @@ MRBCVT_ENCODE = 1
 
 BURP_TABLE_B_FILENAME = 'table_b_bufr_e'
 
+## Persistent reports index (see burp_index)
+## Env.Var. to store index files in a cache dir, enables them when set
+BURP_INDEX_DIR_ENV = 'RPNPY_BURP_INDEX_DIR'
+BURP_INDEX_SUFFIX  = '.rpnpybrpidx.npz'
+BURP_INDEX_VERSION = 1
+## Size (degrees) of the lat-lon cells used for spatial queries
+BURP_INDEX_CELL_DEG = 1.
+## Earth radius (km) used for distance queries
+BURP_EARTH_RADIUS_KM = 6371.22
+
+## Compiled table B lookup arrays (see mrbcvt_table)
+## indexed by cmcid (16 bits), cached on disk as npz files
+## only when a cache dir is set (env var or mrbcvt_table cachedir)
+BURP_TABLE_B_NCMCID = 65536
+BURP_TABLE_B_CACHE_DIR_ENV = 'RPNPY_BURP_TABLE_B_CACHE_DIR'
+BURP_TABLE_B_CACHE_SUFFIX  = '.rpnpytblb.npz'
+BURP_TABLE_B_CACHE_VERSION = 1
+
 BURP_TBLVAL_MISSING = -1
 BURP_RVAL_MISSING0 = -99.99
 BURP_RVAL_MISSING = { #TODO: review
@@ -126,6 +144,32 @@ BURP_RVAL_MISSING = { #TODO: review
 BURP_STNID_STRLEN = 9
 #</source>
 
+#==== Columnar tables (see burp_read_table) ====
+
+#<source lang=python>
+## Columns name and dtype of the flat observations table,
+## one row per (report, block, element, level, group)
+BURP_TABLE_COLUMNS = (
+    ('irep',    _np.int32),    # report number in file (0-based)
+    ('stnid',   'U{0}'.format(BURP_STNID_STRLEN)),
+    ('idtyp',   _np.int32),    # report type
+    ('lat',     _np.float32),  # report latitude (degrees)
+    ('lon',     _np.float32),  # report longitude (degrees, 0-360)
+    ('date',    _np.int32),    # report date (YYYYMMDD)
+    ('time',    _np.int32),    # report time (HHMM)
+    ('datetime', 'datetime64[m]'),
+    ('iblk',    _np.int32),    # block number in report (1-based)
+    ('btyp',    _np.int32),
+    ('bfam',    _np.int32),
+    ('datyp',   _np.int32),    # block data type (see BURP_DATYP_LIST)
+    ('element', _np.int32),    # BUFR element code
+    ('ilev',    _np.int32),    # level index in block (0-based)
+    ('igrp',    _np.int32),    # group index in block (0-based)
+    ('value',   _np.float32),  # decoded value, NaN if missing
+    ('flag',    _np.int32)     # matching marker block flags, -1 if none
+    )
+#</source>
+
 #==== mrfopt (options) ====
 
 #<source lang=python>
@@ -572,6 +616,24 @@ BURP_BKSTP_IDX  = dict(
     [((k[0], k[1], v), int(k[2])) for k, v in BURP_BKSTP_DESC.items()]
     )
 
+## Structured array dtype returned by flags_decode_many
+BURP_FLAGS_DTYPE = (
+    ('flgs',  _np.int32),
+    ('flgsl', _np.int8, (len(BURP_FLAGS_IDX_NAME), ))  # bits, see BURP_FLAGS_IDX
+    )
+
+## Structured array dtype returned by mrbtyp_decode_many
+BURP_BTYP_DTYPE = (
+    ('btyp',        _np.int32),
+    ('bknat',       _np.int32),
+    ('bknat_multi', _np.int32),  # see BURP_BKNAT_MULTI_DESC
+    ('bknat_kind',  _np.int32),  # see BURP_BKNAT_KIND_DESC
+    ('bktyp',       _np.int32),
+    ('bktyp_alt',   _np.int32),  # see BURP_BKTYP_ALT_DESC
+    ('bktyp_kind',  _np.int32),  # see BURP_BKTYP_KIND_DESC
+    ('bkstp',       _np.int32)   # see BURP_BKSTP_DESC
+    )
+
 #</source>
 ##DETAILS_END
 
@@ -196,6 +196,59 @@ FST_RDE_META_DEFAULT = {
     'xtra2' : 0,
     'xtra3' : 0
 }
+
+## Numpy structured dtype of the record metadata as returned by fstprm_many
+## One field per fstprm dict key (less 'shape'), strings are fixed width
+FST_RDE_META_DTYPE = _np.dtype([
+    ('key',    _np.int32),
+    ('dateo',  _np.int32),
+    ('datev',  _np.int32),
+    ('deet',   _np.int32),
+    ('npas',   _np.int32),
+    ('ni',     _np.int32),
+    ('nj',     _np.int32),
+    ('nk',     _np.int32),
+    ('nbits',  _np.int32),
+    ('datyp',  _np.int32),
+    ('ip1',    _np.int32),
+    ('ip2',    _np.int32),
+    ('ip3',    _np.int32),
+    ('typvar', 'U{0}'.format(FST_TYPVAR_LEN)),
+    ('nomvar', 'U{0}'.format(FST_NOMVAR_LEN)),
+    ('etiket', 'U{0}'.format(FST_ETIKET_LEN)),
+    ('grtyp',  'U{0}'.format(FST_GRTYP_LEN)),
+    ('ig1',    _np.int32),
+    ('ig2',    _np.int32),
+    ('ig3',    _np.int32),
+    ('ig4',    _np.int32),
+    ('swa',    _np.int32),
+    ('lng',    _np.int32),
+    ('dltf',   _np.int32),
+    ('ubc',    _np.int32),
+    ('xtra1',  _np.int32),
+    ('xtra2',  _np.int32),
+    ('xtra3',  _np.int32)
+    ])
+
+## Persistent record directory index (see fstindex)
+## Env.Var. to store index files in a cache dir, enables them when set
+FST_INDEX_DIR_ENV = 'RPNPY_FST_INDEX_DIR'
+FST_INDEX_SUFFIX  = '.rpnpyidx.npz'
+FST_INDEX_VERSION = 1
+
+## Memory mapped access to uncompressed records (see fstmmap)
+## XDF file signature found at byte 8 of FST files
+FST_XDF_SIGNATURE = b'XDF0STDR'
+## Size in bytes of the record header (xdf header + primary keys)
+## preceding the data of each record
+FST_RECORD_HEADER_NBYTES = 72
+## Map of datyp/nbits of records that can be memory mapped
+## to the numpy dtype of their on-disk (big endian) data
+FST_MMAP_DTYPES = {
+    (5, 32) : _np.dtype('>f4'),
+    (2, 32) : _np.dtype('>u4'),
+    (4, 32) : _np.dtype('>i4')
+    }
 #</source>
 
 #==== Data types ====
@@ -363,6 +416,9 @@ EZ_CLOUD_INTERP_LINEAR = 'LINEAR'
 
 EZ_OPT_USE_1SUBGRID = 'USE_1SUBGRID'
 ## YES or NO
+
+## Default max number of grids kept in the readGrid cache
+EZ_GRID_CACHE_SIZE = 64
 #</source>
 ##DETAILS_END
 
@@ -26,11 +26,13 @@ import os
 import sys
 import ctypes as _ct
 import glob as _glob
+import threading as _threading
 import numpy  as _np
 import numpy.ctypeslib as _npc
 from rpnpy.librmn import proto as _rp
 from rpnpy.librmn import const as _rc
 from rpnpy.librmn import base as _rb
+from rpnpy.librmn import npzcache as _npzc
 from rpnpy.librmn import RMNError
 from rpnpy import integer_types as _integer_types
 from rpnpy import C_WCHAR2CHAR as _C_WCHAR2CHAR
@@ -51,6 +53,49 @@ _IS_LIST = lambda x: isinstance(x, (list, tuple))
 _IS_LIST.__doc__ = 'lambda function to test if x is list or tuple'
 
 _linkedUnits = {}
+_unitPaths = {}
+_unitFindex = {}
+_unitIds = {}
+_unitIndex = {}
+
+## Record handle bits holding the file index, see MAKE_RND_HANDLE in xdf98
+_FST_HANDLE_FINDEX_MASK = 0x3FF
+
+## New style ip encoding, see c_ConvertIp:
+##   kind (bits 24-27), exponent (bits 20-23), mantissa (bits 0-19)
+##   value = mantissa / 10**(exponent - 4)
+_CONVIP_OLD_MAX = 32767
+_CONVIP_MANT_MAX = 1000000
+_CONVIP_FLOAT_KINDS = (_rc.KIND_ABOVE_SEA, _rc.KIND_SIGMA, _rc.KIND_PRESSURE,
+                       _rc.KIND_ARBITRARY, _rc.KIND_ABOVE_GND,
+                       _rc.KIND_HYBRID, _rc.KIND_THETA, _rc.KIND_HOURS)
+## Kinds sharing their code with another one over an exclusive range
+_CONVIP_SHARED_KINDS = (_rc.KIND_SIGMA, _rc.KIND_HYBRID)
+
+_c_fstluk_protos = {}
+_c_fstluk_protos_lock = _threading.Lock()
+
+def _c_fstluk_proto(dtype):
+    """
+    Return a c_fstluk ctypes function for data of type dtype
+
+    One distinct function object is created per dtype, its argtypes are
+    never redefined afterward, making it safe to use concurrently
+    """
+    dtype = _np.dtype(dtype)
+    try:
+        return _c_fstluk_protos[dtype]
+    except KeyError:
+        pass
+    with _c_fstluk_protos_lock:
+        if dtype not in _c_fstluk_protos:
+            cfunc = _rp.librmn['c_fstluk']
+            cfunc.argtypes = (_npc.ndpointer(dtype=dtype), _ct.c_int,
+                              _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int),
+                              _ct.POINTER(_ct.c_int))
+            cfunc.restype = _ct.c_int
+            _c_fstluk_protos[dtype] = cfunc
+    return _c_fstluk_protos[dtype]
 
 class FSTDError(RMNError):
     """
@@ -305,6 +350,8 @@ def fstopenall(paths, filemode=_rc.FST_RO, verbose=None):
             try:
                 fstouv(funit, filemode)
                 iunitlist.append(funit)
+                if filemode == _rc.FST_RO:
+                    _unitPaths[funit] = os.path.abspath(myfile)
                 if verbose:
                     print("(fstopenall) Opening: {0} {1}".format(myfile, funit))
             except Exception as e:
@@ -377,6 +424,10 @@ def fstcloseall(iunit, verbose=None):
     istat = 0
     elist = []
     for iunit1 in iunitlist:
+        _unitPaths.pop(iunit1, None)
+        _unitFindex.pop(iunit1, None)
+        _unitIds.pop(iunit1, None)
+        _unitIndex.pop(iunit1, None)
         try:
             fstfrm(iunit1)
             istat = _rb.fclos(iunit1)
@@ -1024,7 +1075,7 @@ def fstinfx(key, iunit, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
 
 
 def fstinl(iunit, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
-           typvar=' ', nomvar=' ', nrecmax=-1):
+           typvar=' ', nomvar=' ', nrecmax=-1, withMeta=False):
     """
     Locate all the record matching the research keys
 
@@ -1044,9 +1095,12 @@ def fstinl(iunit, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
         typvar  : type of field
         nomvar  : variable name
         nrecmax : maximum number or record to find (-1 = all)
+        withMeta: if True, return the records metadata as with fstprm_many
     Returns:
         list of matching records keys
         empty list ([]) if no matching record found
+        if withMeta, numpy.ndarray of dtype FST_RDE_META_DTYPE
+        (see fstprm_many)
     Raises:
         TypeError  on wrong input arg types
         ValueError on invalid input arg value
@@ -1074,6 +1128,7 @@ def fstinl(iunit, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
         fstinf
         fstinfx
         fstprm
+        fstprm_many
         fstluk
         fstopenall
         fstcloseall
@@ -1103,6 +1158,8 @@ def fstinl(iunit, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
                          creclist, cnfound, nrecmax)
     ## if istat < 0:
     ##     raise FSTDError('fstinl: Problem searching record list')
+    if withMeta:
+        return fstprm_many(creclist[0:max(0, cnfound.value)])
     if cnfound.value <= 0:
         return []
     return creclist[0:cnfound.value].tolist()
@@ -1477,6 +1534,8 @@ def fstluk(key, dtype=None, rank=None, dataArray=None):
         fstinl
         fstopenall
         fstcloseall
+        fstluk_many
+        fstmmap
     """
     if isinstance(key, dict):
         key = key['key']
@@ -1491,9 +1550,7 @@ def fstluk(key, dtype=None, rank=None, dataArray=None):
     (cni, cnj, cnk) = (_ct.c_int(), _ct.c_int(), _ct.c_int())
     if dtype is None:
         dtype = dtype_fst2numpy(params['datyp'], params['nbits'])
-    _rp.c_fstluk.argtypes = (_npc.ndpointer(dtype=dtype), _ct.c_int,
-                             _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int),
-                             _ct.POINTER(_ct.c_int))
+    c_fstluk = _c_fstluk_proto(dtype)
     wantrank = 1 if rank is None else rank
     minrank = 3
     if params['shape'][2] <= 1:
@@ -1522,14 +1579,288 @@ def fstluk(key, dtype=None, rank=None, dataArray=None):
     else:
         raise TypeError('Expecting dataArray of type ndarray, got: {0}'.
                         format(repr(type(dataArray))))
-    istat = _rp.c_fstluk(data, key, _ct.byref(cni), _ct.byref(cnj),
-                         _ct.byref(cnk))
+    istat = c_fstluk(data, key, _ct.byref(cni), _ct.byref(cnj),
+                     _ct.byref(cnk))
     if istat < 0:
         raise FSTDError()
     params['d'] = data
     return params
 
 
+def fstluk_many(keys, dtype=None, dataArray=None):
+    """
+    Read the records at positions given by a list of keys into one array
+
+    Records are decoded directly into consecutive slices of the
+    Fortran ordered result array, without intermediate copies.
+
+    records = fstluk_many(keys)
+    records = fstluk_many(keys, dtype, dataArray)
+
+    Args:
+        keys  : list of positioning information to the records,
+                obtained with fstinl, ... (list of int or dict)
+                all records must have the same dimensions
+        dtype : array type of the returned data
+                Default is determined from records' datyp
+                (must then be the same for all records)
+        dataArray (ndarray): (optional) allocated array where to put the data
+                F_CONTIGUOUS, of size ni*nj*nk*len(keys)
+                e.g. of shape (ni, nj, len(keys)) or (ni, nj, nk, nt)
+                where the keys are ordered with k varying fastest
+    Returns:
+        {
+            'd'    : data,  # records data as a numpy.ndarray, F order
+                            # of shape (ni, nj, len(keys)) if nk == 1
+                            # or (ni, nj, nk, len(keys)) otherwise
+                            # or dataArray.shape if provided
+            'meta' : meta   # records metadata as returned by fstprm_many
+        }
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        FSTDError  on any other error
+
+    Notes:
+        Records are read sequentially: librmn keeps global unlocked
+        state (unit and buffer tables), c_fstluk must not be called
+        concurrently.
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+    >>>
+    >>> # Open existing file in Rear Only mode
+    >>> funit = rmn.fstopenall(filename, rmn.FST_RO)
+    >>>
+    >>> # Read all TT levels into a single 3D array
+    >>> keys = rmn.fstinl(funit, nomvar='TT')
+    >>> tt   = rmn.fstluk_many(keys)
+    >>> print("# TT shape={0}".format(tt['d'].shape))
+    # TT shape=(200, 100, 80)
+    >>> rmn.fstcloseall(funit)
+
+    See Also:
+        fstluk
+        fstprm_many
+        fstinl
+        fstopenall
+        fstcloseall
+    """
+    if not isinstance(keys, (list, tuple, _np.ndarray)):
+        raise TypeError("fstluk_many: Expecting a list of keys, Got {0}"\
+                        .format(type(keys)))
+    if len(keys) == 0:
+        raise ValueError("fstluk_many: must provide at least one key")
+    meta = fstprm_many(keys)
+    (ni, nj, nk) = (max(1, int(meta['ni'][0])), max(1, int(meta['nj'][0])),
+                    max(1, int(meta['nk'][0])))
+    if not (_np.all(_np.maximum(1, meta['ni']) == ni) and
+            _np.all(_np.maximum(1, meta['nj']) == nj) and
+            _np.all(_np.maximum(1, meta['nk']) == nk)):
+        raise FSTDError("fstluk_many: all records must have the same shape")
+    if dtype is None:
+        dtypes = set([_np.dtype(dtype_fst2numpy(int(datyp), int(nbits)))
+                      for (datyp, nbits) in
+                      set(zip(meta['datyp'].tolist(), meta['nbits'].tolist()))])
+        if len(dtypes) != 1:
+            raise FSTDError("fstluk_many: records have different data types" +
+                            ", please provide dtype: {0}".format(dtypes))
+        dtype = dtypes.pop()
+    dtype = _np.dtype(dtype)
+    npts = ni * nj * nk
+    if dataArray is None:
+        shape = [ni, nj, len(keys)] if nk == 1 else [ni, nj, nk, len(keys)]
+        data = _np.empty(shape, dtype=dtype, order='F')
+    elif isinstance(dataArray, _np.ndarray):
+        if not dataArray.flags['F_CONTIGUOUS']:
+            raise TypeError('Provided dataArray should be F_CONTIGUOUS')
+        if dtype != dataArray.dtype:
+            raise TypeError('Expecting dataArray of type {0}, got: {1}'.
+                            format(repr(dtype), repr(dataArray.dtype)))
+        if dataArray.size != npts * len(keys):
+            raise TypeError('Provided dataArray has wrong size, expecting: ' +
+                            '{0}, got: {1}'.format(npts * len(keys),
+                                                   dataArray.size))
+        data = dataArray
+    else:
+        raise TypeError('Expecting dataArray of type ndarray, got: {0}'.
+                        format(repr(type(dataArray))))
+    (dataptr, nbytes) = (data.ctypes.data, npts * dtype.itemsize)
+    (cni, cnj, cnk) = (_ct.c_int(), _ct.c_int(), _ct.c_int())
+    (cnip, cnjp, cnkp) = (_ct.byref(cni), _ct.byref(cnj), _ct.byref(cnk))
+    for (i, key) in enumerate(meta['key'].tolist()):
+        istat = _rp.c_fstluk_p(dataptr + i * nbytes, key, cnip, cnjp, cnkp)
+        if istat < 0:
+            raise FSTDError("fstluk_many: Problem reading key={0}"\
+                            .format(key))
+    return {
+        'd'    : data,
+        'meta' : meta
+        }
+
+
+def fstmmap(key):
+    """
+    Return a read-only memory map of the record's data in the file
+
+    The returned data is a numpy.memmap on the record data in the file,
+    no data is read until accessed; only available for uncompressed records
+    (datyp=5 IEEE, 2 and 4 integers, with nbits=32)
+    of files opened with fstopenall in FST_RO mode.
+
+    record = fstmmap(key)
+
+    Args:
+        key   : positioning information to the record,
+                obtained with fstinf or fstinl, ...
+    Returns:
+        {
+            'd'   : data,       # read-only numpy.memmap, F order
+                                # of shape (ni, nj) if nk == 1
+                                # or (ni, nj, nk) otherwise
+                                # with a big endian dtype,
+                                # use data.astype(native_dtype) for a copy
+            'path': path,       # path of the file holding the record
+            'offset' : offset,  # offset in bytes of the data in the file
+            ...                 # same params list as fstprm
+        }
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        FSTDError  on any other error, including records
+                   that cannot be memory mapped (compressed, packed, ...)
+
+    Examples:
+    >>> import os
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>>
+    >>> # Write an uncompressed IEEE 32 bits record
+    >>> funit = rmn.fstopenall('newfile.fst', rmn.FST_RW)
+    >>> data  = np.arange(200*100, dtype=np.float32).reshape((200, 100), order='F')
+    >>> rmn.fstecr(funit, data, {'nomvar':'ZZ', 'datyp':5, 'nbits':32})
+    >>> rmn.fstcloseall(funit)
+    >>>
+    >>> # Get a view of the record, only point (10, 20) is read from disk
+    >>> funit = rmn.fstopenall('newfile.fst', rmn.FST_RO)
+    >>> rec = rmn.fstmmap(rmn.fstinf(funit, nomvar='ZZ'))
+    >>> print("# ZZ(10,20)={0}".format(float(rec['d'][10, 20])))
+    # ZZ(10,20)=4010.0
+    >>> del rec
+    >>> rmn.fstcloseall(funit)
+    >>> os.unlink('newfile.fst')  # Remove test file
+
+    See Also:
+        fstluk
+        fstprm
+        fstopenall
+        rpnpy.librmn.const
+    """
+    if isinstance(key, dict):
+        key = key['key']
+    if not isinstance(key, _integer_types):
+        raise TypeError("fstmmap: Expecting arg of type int, Got {0}"\
+                        .format(type(key)))
+    if key < 0:
+        raise ValueError("fstmmap: must provide a valid key: {0}".format(key))
+    params = fstprm(key)
+    try:
+        dtype = _rc.FST_MMAP_DTYPES[(params['datyp'], params['nbits'])]
+    except KeyError:
+        raise FSTDError("fstmmap: Cannot memory map record with datyp={0}, nbits={1}, key={2}".format(params['datyp'], params['nbits'], key))
+    path = _fstkey_path(key, params)
+    if path is None:
+        raise FSTDError("fstmmap: Cannot find file of key={0}, file must be opened with fstopenall in FST_RO mode".format(key))
+    offset = (params['swa'] - 1) * 4
+    _fstmmap_check(path, offset, params)
+    shape = (params['ni'], params['nj'])
+    if params['nk'] > 1:
+        shape += (params['nk'], )
+    params['d'] = _np.memmap(path, dtype=dtype, mode='r', order='F',
+                             offset=offset + _rc.FST_RECORD_HEADER_NBYTES,
+                             shape=shape)
+    params['path'] = path
+    params['offset'] = offset + _rc.FST_RECORD_HEADER_NBYTES
+    return params
+
+
+def _fstkey_path(key, params):
+    """
+    Return the path of the file holding the record, None if not known
+
+    The file index of units opened with fstopenall is found on first use,
+    from the files holding a record header matching params at its address;
+    the units search context (fstsui) is left untouched unless
+    several files have a matching header at that address.
+    """
+    findex = key & _FST_HANDLE_FINDEX_MASK
+    for (iunit1, findex1) in list(_unitFindex.items()):
+        if findex1 is not None and findex1 == findex:
+            return _unitPaths.get(iunit1, None)
+    offset = (params['swa'] - 1) * 4
+    found = []
+    for (iunit1, path) in list(_unitPaths.items()):
+        if iunit1 in _unitFindex:
+            continue
+        try:
+            if _fstmmap_match(path, offset, params):
+                found.append(iunit1)
+        except FSTDError:
+            pass
+    if len(found) > 1:
+        for iunit1 in found:
+            key1 = fstinf(iunit1)
+            _unitFindex[iunit1] = (None if key1 is None else
+                                   key1['key'] & _FST_HANDLE_FINDEX_MASK)
+        found = [iunit1 for iunit1 in found if _unitFindex[iunit1] == findex]
+    if len(found) != 1:
+        return None
+    _unitFindex[found[0]] = findex
+    return _unitPaths.get(found[0], None)
+
+
+def _fstmmap_check(path, offset, params):
+    """
+    Check that the file is XDF and the record header matches its params
+    """
+    if not _fstmmap_match(path, offset, params):
+        raise FSTDError("fstmmap: Unexpected record header in {0} for key={1}".format(path, params['key']))
+    nbytes = params['ni'] * params['nj'] * params['nk'] * params['nbits'] // 8
+    if _rc.FST_RECORD_HEADER_NBYTES + nbytes > params['lng'] * 4:
+        raise FSTDError("fstmmap: Record too short in {0} for key={1}".format(path, params['key']))
+
+
+def _fstmmap_match(path, offset, params):
+    """
+    Return True if the file is XDF and the record header matches its params
+    """
+    nsig = len(_rc.FST_XDF_SIGNATURE)
+    try:
+        with open(path, 'rb') as fd:
+            sig = fd.read(8 + nsig)[8:]
+            fd.seek(offset)
+            header = _np.frombuffer(fd.read(_rc.FST_RECORD_HEADER_NBYTES),
+                                    dtype='>u4')
+    except (IOError, OSError) as e:
+        raise FSTDError("fstmmap: Problem reading {0}: {1}".format(path, e))
+    # Record header is a copy of the directory entry (stdf_dir_keys), 32b words
+    #   0: deleted:1, select:7, lng:24 (64b words)   1: addr:32 (64b words)
+    #   2: deet:24, nbits:8    3: ni:24, gtyp:8
+    #   4: nj:24, datyp:8      5: nk:20, ubc:12
+    return (sig == _rc.FST_XDF_SIGNATURE and
+            header.size * 4 == _rc.FST_RECORD_HEADER_NBYTES and
+            int(header[0] & 0xFFFFFF) * 2 == params['lng'] and
+            int(header[1]) == offset // 8 + 1 and
+            int(header[2] & 0xFF) == params['nbits'] and
+            int(header[3] >> 8) == params['ni'] and
+            int(header[4] >> 8) == params['nj'] and
+            int(header[4] & 0xFF) == params['datyp'] and
+            int(header[5] >> 12) == params['nk'])
+
+
 #TODO: fstmsq
 
 def fstnbr(iunit):
@@ -1841,6 +2172,7 @@ def fstprm(key):
     >>> rmn.fstcloseall(funit)
 
     See Also:
+        fstprm_many
         fstluk
         fstinf
         fstinl
@@ -1920,6 +2252,521 @@ def fstprm(key):
         }
 
 
+def fstprm_many(keys):
+    """
+    Get all the description informations of a list of records at once.
+
+    meta = fstprm_many(keys)
+
+    Args:
+        keys : list of positioning information to the records,
+               obtained with fstinl, ... (list of int or dict)
+    Returns:
+        numpy.ndarray of dtype FST_RDE_META_DTYPE, one row per key
+        with the same fields as fstprm (less 'shape')
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        FSTDError  on any other error
+
+    Notes:
+        Records of units already indexed with fstindex (or fstinventory)
+        are taken from that index, without calling c_fstprm.
+        The ctypes arguments are allocated once for the whole list and
+        datev is computed once per distinct (dateo, deet*npas) pair.
+        Strings are fixed width and stripped, they can be compared directly
+        (e.g. meta['nomvar'] == 'TT').
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk')
+    >>>
+    >>> # Open existing file in Rear Only mode
+    >>> funit = rmn.fstopenall(filename, rmn.FST_RO)
+    >>>
+    >>> # Get the metadata of all records and count the VF records
+    >>> meta = rmn.fstprm_many(rmn.fstinl(funit))
+    >>> print("# Found {0} VF records".format((meta['nomvar'] == 'VF').sum()))
+    # Found 26 VF records
+    >>>
+    >>> rmn.fstcloseall(funit)
+
+    See Also:
+        fstprm
+        fstinl
+        fstluk
+        rpnpy.librmn.const.FST_RDE_META_DTYPE
+    """
+    if not isinstance(keys, (list, tuple, _np.ndarray)):
+        raise TypeError("fstprm_many: Expecting a list of keys, Got {0}"\
+                        .format(type(keys)))
+    meta = _np.zeros(len(keys), dtype=_rc.FST_RDE_META_DTYPE)
+    if len(keys) == 0:
+        return meta
+    (cni, cnj, cnk)        = (_ct.c_int(), _ct.c_int(), _ct.c_int())
+    (cdateo, cdeet, cnpas) = (_ct.c_int(), _ct.c_int(), _ct.c_int())
+    (cnbits, cdatyp)       = (_ct.c_int(), _ct.c_int())
+    (cip1, cip2, cip3)     = (_ct.c_int(), _ct.c_int(), _ct.c_int())
+    ctypvar                = _C_MKSTR(' '*_rc.FST_TYPVAR_LEN)
+    cnomvar                = _C_MKSTR(' '*_rc.FST_NOMVAR_LEN)
+    cetiket                = _C_MKSTR(' '*_rc.FST_ETIKET_LEN)
+    cgrtyp                 = _C_MKSTR(' '*_rc.FST_GRTYP_LEN)
+    (cig1, cig2, cig3, cig4)  = (_ct.c_int(), _ct.c_int(),
+                                 _ct.c_int(), _ct.c_int())
+    (cswa, clng, cdltf, cubc) = (_ct.c_int(), _ct.c_int(),
+                                 _ct.c_int(), _ct.c_int())
+    (cxtra1, cxtra2, cxtra3)  = (_ct.c_int(), _ct.c_int(), _ct.c_int())
+    cargs = (_ct.byref(cdateo), _ct.byref(cdeet), _ct.byref(cnpas),
+             _ct.byref(cni), _ct.byref(cnj), _ct.byref(cnk),
+             _ct.byref(cnbits), _ct.byref(cdatyp),
+             _ct.byref(cip1), _ct.byref(cip2), _ct.byref(cip3),
+             ctypvar, cnomvar, cetiket,
+             cgrtyp, _ct.byref(cig1), _ct.byref(cig2),
+             _ct.byref(cig3), _ct.byref(cig4),
+             _ct.byref(cswa), _ct.byref(clng), _ct.byref(cdltf),
+             _ct.byref(cubc),
+             _ct.byref(cxtra1), _ct.byref(cxtra2), _ct.byref(cxtra3))
+    found = _fstindex_lookup(keys, meta)
+    for i, key in enumerate(keys):
+        if found[i]:
+            continue
+        if isinstance(key, dict):
+            key = key['key']
+        if not isinstance(key, _integer_types + (_np.integer,)):
+            raise TypeError("fstprm_many: Expecting a key of type int, " +
+                            "Got {0} : {1}".format(type(key), repr(key)))
+        if key < 0:
+            raise ValueError("fstprm_many: must provide a valid key: {0}"\
+                             .format(key))
+        istat = _rp.c_fstprm(int(key), *cargs)
+        if _C_TOINT(istat) < 0:
+            raise FSTDError("fstprm_many: Problem getting meta for key={0}"\
+                            .format(key))
+        meta[i] = (key, cdateo.value, cdateo.value, cdeet.value, cnpas.value,
+                   cni.value, cnj.value, cnk.value,
+                   cnbits.value, cdatyp.value,
+                   cip1.value, cip2.value, cip3.value,
+                   _C_CHAR2WCHAR(ctypvar.value).strip(),
+                   _C_CHAR2WCHAR(cnomvar.value).strip(),
+                   _C_CHAR2WCHAR(cetiket.value).strip(),
+                   _C_CHAR2WCHAR(cgrtyp.value).strip(),
+                   cig1.value, cig2.value, cig3.value, cig4.value,
+                   cswa.value, clng.value, cdltf.value, cubc.value,
+                   cxtra1.value, cxtra2.value, cxtra3.value)
+    todo = ~found
+    meta['datev'][todo] = _datev_many(meta['dateo'][todo], meta['deet'][todo],
+                                      meta['npas'][todo])
+    return meta
+
+
+def _fstindex_lookup(keys, meta):
+    """
+    Fill the rows of meta for keys found in the fstindex of opened units
+
+    Return a bool array, True where the row was filled
+    """
+    found = _np.zeros(len(keys), dtype=bool)
+    if not _unitIndex:
+        return found
+    keys = [key['key'] if isinstance(key, dict) else key for key in keys]
+    if not all([isinstance(key, _integer_types + (_np.integer,))
+                for key in keys]):
+        return found
+    keys = _np.asarray(keys, dtype=_np.int64)
+    for (index, skeys, sorder) in list(_unitIndex.values()):
+        if skeys.size == 0:
+            continue
+        pos = _np.minimum(_np.searchsorted(skeys, keys), skeys.size - 1)
+        hit = (skeys[pos] == keys) & ~found
+        meta[hit] = index[sorder[pos[hit]]]
+        found |= hit
+    return found
+
+
+def _datev_many(dateo, deet, npas):
+    """
+    Compute datev (dateo + deet * npas) for arrays of dateo, deet, npas
+
+    Same rules as in fstprm, datev is set to -1 if it cannot be computed
+    """
+    datev = _np.array(dateo, dtype=_np.int32)
+    nsec  = _np.asarray(deet, dtype=_np.int64) * _np.asarray(npas, dtype=_np.int64)
+    mask  = (datev != 0) & (nsec != 0)
+    if not mask.any():
+        return datev
+    mdatev = _rb.incdatr_many(datev[mask], nsec[mask] / 3600., missing=-1)
+    if _np.any(mdatev == -1):
+        sys.stderr.write("(fstprm) Problem computing datev for {0} records"\
+                         .format(int(_np.sum(mdatev == -1))))
+    datev[mask] = mdatev
+    return datev
+
+
+def fstindex(iunit, cache=None, cachedir=None, verbose=None):
+    """
+    Get the metadata of all the records in a file, optionally using
+    a persistent index
+
+    When asked for, the record directory of each file opened with
+    fstopenall in read only mode is saved in a sidecar index file the
+    first time it is scanned. Further calls, even from another process,
+    reuse it as long as the file path, size and modification time
+    are unchanged.
+
+    meta = fstindex(iunit)
+    meta = fstindex(iunit, cachedir=mydir)
+
+    Args:
+        iunit    : unit number associated to the file
+                   obtained with fstopenall
+        cache    : True to read/write index files,
+                   False to never read nor write index files,
+                   None to use index files only if cachedir is provided
+                   or the RPNPY_FST_INDEX_DIR Env.Var. is defined
+                   Default: None
+        cachedir : directory where to store the index files
+                   Default: RPNPY_FST_INDEX_DIR Env.Var. if defined,
+                   otherwise next to the FST file (hidden file)
+        verbose  : Print some info when true
+    Returns:
+        numpy.ndarray of dtype FST_RDE_META_DTYPE, one row per record
+        for all files linked to iunit (see fstprm_many)
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        FSTDError  on any other error
+
+    Notes:
+        Index files are only used for files opened with fstopenall
+        in FST_RO mode, other units are scanned every time.
+        Failures to write an index file (e.g. read only dir) are ignored.
+        The index of FST_RO units is also kept in memory until
+        fstcloseall; fstprm_many (thus fstinl with withMeta=True)
+        then take the records metadata from it.
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk')
+    >>>
+    >>> # Open existing file in Rear Only mode
+    >>> funit = rmn.fstopenall(filename, rmn.FST_RO)
+    >>>
+    >>> # Get all records metadata, then select the VF records keys
+    >>> meta = rmn.fstindex(funit, cachedir='.')
+    >>> vfkeys = meta['key'][meta['nomvar'] == 'VF']
+    >>> print("# Found {0} VF records".format(len(vfkeys)))
+    # Found 26 VF records
+    >>>
+    >>> rmn.fstcloseall(funit)
+
+    See Also:
+        fstprm_many
+        fstinl
+        fstopenall
+        rpnpy.librmn.const.FST_RDE_META_DTYPE
+    """
+    if not isinstance(iunit, _integer_types):
+        raise TypeError("fstindex: Expecting arg of type int, Got {0}"\
+                        .format(type(iunit)))
+    if iunit < 0:
+        raise ValueError("fstindex: must provide a valid iunit: {0}"\
+                         .format(iunit))
+    if cachedir is None:
+        cachedir = os.getenv(_rc.FST_INDEX_DIR_ENV, None)
+    if cache is None:
+        cache = bool(cachedir)
+    try:
+        iunitlist = _linkedUnits[str(iunit)]
+    except KeyError:
+        iunitlist = (iunit,)
+    metalist = []
+    missing  = []
+    for iunit1 in iunitlist:
+        if iunit1 in _unitIndex:
+            metalist.append(_unitIndex[iunit1][0].copy())
+            continue
+        if _rp.c_fstnbrv(iunit1) <= 0:
+            continue
+        key1 = fstinf(iunit1)
+        if key1 is None:
+            continue
+        findex = key1['key'] & _FST_HANDLE_FINDEX_MASK
+        path = _unitPaths.get(iunit1, None) if cache else None
+        meta = _fstindex_load(path, cachedir, key1['key'], verbose)
+        if meta is None:
+            missing.append((len(metalist), findex, path))
+        else:
+            meta['key'] = ((meta['key'] & ~_FST_HANDLE_FINDEX_MASK) | findex)
+        metalist.append((iunit1, meta))
+    if missing:
+        allmeta = fstinl(iunit, withMeta=True)
+        allfindex = allmeta['key'] & _FST_HANDLE_FINDEX_MASK
+        for (i, findex, path) in missing:
+            metalist[i] = (metalist[i][0], allmeta[allfindex == findex])
+            _fstindex_save(path, cachedir, metalist[i][1], verbose)
+    for (i, item) in enumerate(metalist):
+        if not isinstance(item, tuple):
+            continue
+        (iunit1, meta) = item
+        # Read only files do not change while opened, keep their index
+        # for fstprm_many (and fstinl withMeta) lookups
+        if iunit1 in _unitPaths:
+            sorder = _np.argsort(meta['key'], kind='mergesort')
+            _unitIndex[iunit1] = (meta, meta['key'][sorder].astype(_np.int64),
+                                  sorder)
+            meta = meta.copy()
+        metalist[i] = meta
+    if not metalist:
+        return _np.zeros(0, dtype=_rc.FST_RDE_META_DTYPE)
+    return _np.concatenate(metalist)
+
+
+def _fstindex_load(path, cachedir, key1, verbose=None):
+    """
+    Load the index file for the FST file path
+
+    Return None if there is no valid index for the file in its current state
+    """
+    if not path:
+        return None
+    # Make sure the records handles are still the same, less the file index
+    check = lambda data: (
+        data['key'].size > 0 and
+        ((int(data['key'][0]) ^ key1) & ~_FST_HANDLE_FINDEX_MASK) == 0)
+    data = _npzc.npzcache_load(
+        _npzc.npzcache_path(path, cachedir, _rc.FST_INDEX_SUFFIX), path,
+        _rc.FST_INDEX_VERSION, 'fstindex', check, verbose)
+    if data is None:
+        return None
+    meta = _np.empty(data['key'].size, dtype=_rc.FST_RDE_META_DTYPE)
+    for name in meta.dtype.names:
+        meta[name] = data[name]
+    return meta
+
+
+def _fstindex_save(path, cachedir, meta, verbose=None):
+    """
+    Save the index file for the FST file path, ignore errors
+    """
+    if not path:
+        return
+    columns = dict([(name, meta[name]) for name in meta.dtype.names])
+    _npzc.npzcache_save(
+        _npzc.npzcache_path(path, cachedir, _rc.FST_INDEX_SUFFIX), path,
+        _rc.FST_INDEX_VERSION, columns, 'fstindex', verbose)
+
+
+def fstinventory(iunit, cache=None, cachedir=None, asDataFrame=False,
+                 verbose=None):
+    """
+    Get the inventory of all the records in a file as a columnar table
+
+    Same as fstindex with decoded ip1, ip2, ip3 and records size added.
+    ip1, ip2, ip3 are decoded together, as DecodeIp does (e.g. old style
+    ip2 are hours, ranges are decoded), once per distinct triplet.
+
+    inv = fstinventory(iunit)
+
+    Args:
+        iunit       : unit number associated to the file
+                      obtained with fnom+fstouv or fstopenall
+        cache       : use index files, Default: only if a cachedir is set
+                      (see fstindex)
+        cachedir    : directory where to store the index files
+                      (see fstindex)
+        asDataFrame : if True return a pandas.DataFrame (requires pandas)
+        verbose     : Print some info when true
+    Returns:
+        {
+            'key'    : records key/handle,         # numpy.ndarray
+            ...      : same columns as fstprm_many # numpy.ndarray
+            'ip1v'   : decoded ip1 value           # numpy.ndarray(float32)
+            'ip1v2'  : decoded ip1 range 2nd value # numpy.ndarray(float32)
+            'ip1k'   : decoded ip1 kind            # numpy.ndarray(int32)
+            'ip2v'   : decoded ip2 value           # numpy.ndarray(float32)
+            'ip2v2'  : decoded ip2 range 2nd value # numpy.ndarray(float32)
+            'ip2k'   : decoded ip2 kind            # numpy.ndarray(int32)
+            'ip3v'   : decoded ip3 value           # numpy.ndarray(float32)
+            'ip3v2'  : decoded ip3 range 2nd value # numpy.ndarray(float32)
+            'ip3k'   : decoded ip3 kind            # numpy.ndarray(int32)
+            'nbytes' : record size in the file, bytes # numpy.ndarray(int64)
+        }
+        or the equivalent pandas.DataFrame if asDataFrame
+    Raises:
+        TypeError   on wrong input arg types
+        ValueError  on invalid input arg value
+        FSTDError   on any other error
+        ImportError if asDataFrame and pandas is not available
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk')
+    >>>
+    >>> # Open existing file in Rear Only mode
+    >>> funit = rmn.fstopenall(filename, rmn.FST_RO)
+    >>>
+    >>> # List the TT pressure levels in the file
+    >>> inv = rmn.fstinventory(funit, cache=False)
+    >>> sel = (inv['nomvar'] == 'TT') & (inv['ip1k'] == rmn.LEVEL_KIND_PMB)
+    >>> levels = sorted(set(inv['ip1v'][sel].tolist()))
+    >>>
+    >>> rmn.fstcloseall(funit)
+
+    See Also:
+        fstindex
+        fstprm_many
+        DecodeIp
+        rpnpy.librmn.const.FST_RDE_META_DTYPE
+    """
+    meta = fstindex(iunit, cache=cache, cachedir=cachedir, verbose=verbose)
+    inv = dict([(name, meta[name]) for name in meta.dtype.names])
+    inv.update(_decodeIp_many(meta['ip1'], meta['ip2'], meta['ip3']))
+    # lng is in 32 bits words
+    inv['nbytes'] = meta['lng'].astype(_np.int64) * 4
+    if asDataFrame:
+        import pandas as _pd
+        return _pd.DataFrame(inv)
+    return inv
+
+
+def _decodeIp_many(ip1s, ip2s, ip3s):
+    """
+    Decode arrays of ip1, ip2, ip3 as DecodeIp does,
+    calling it once per distinct (ip1, ip2, ip3) triplet
+
+    Each ip of triplets DecodeIp cannot decode is decoded with convertIp,
+    value and kind are set to -1 if this fails too.
+
+    Return a dict of numpy arrays: ip1v, ip1v2, ip1k, ip2v, ... ip3k
+    """
+    ips = _np.stack([_np.ravel(ip1s), _np.ravel(ip2s), _np.ravel(ip3s)],
+                    axis=1).astype(_np.int64)
+    (uips, uinv) = _np.unique(ips, axis=0, return_inverse=True)
+    uinv = _np.ravel(uinv)
+    uvalues = _np.empty((uips.shape[0], 3, 2), dtype=_np.float32)
+    ukinds  = _np.empty((uips.shape[0], 3), dtype=_np.int32)
+    for (i, ip123) in enumerate(uips.tolist()):
+        try:
+            rps = DecodeIp(*ip123)
+            for j in range(3):
+                uvalues[i, j] = (rps[j].v1, rps[j].v2)
+                ukinds[i, j] = rps[j].kind
+        except FSTDError:
+            for j in range(3):
+                try:
+                    (v, k) = convertIp(_rc.CONVIP_DECODE, ip123[j])
+                except FSTDError:
+                    (v, k) = (-1., -1)
+                uvalues[i, j] = (v, v)
+                ukinds[i, j] = k
+    columns = {}
+    for (j, name) in enumerate(('ip1', 'ip2', 'ip3')):
+        columns[name+'v']  = uvalues[uinv, j, 0]
+        columns[name+'v2'] = uvalues[uinv, j, 1]
+        columns[name+'k']  = ukinds[uinv, j]
+    return columns
+
+
+def _convertIp_decode_many(ips, mode=_rc.CONVIP_DECODE):
+    """
+    Decode an array of ip, see convertIp_many
+
+    New style ip of float kinds are decoded with numpy,
+    others with convertIp, calling it once per distinct value
+
+    Return (values, kinds) as numpy arrays of float32, int32
+    """
+    ips = _np.asarray(ips)
+    if not (ips.dtype.kind in 'iu' or ips.size == 0):
+        raise TypeError("convertIp_many: Expecting ip values of type int, " +
+                        "Got {0}".format(ips.dtype))
+    ips = ips.astype(_np.int64)
+    kinds = ((ips >> 24) & 0xf).astype(_np.int32)
+    iexp = (ips >> 20) & 0xf
+    mant = ips & 0xfffff
+    values = (mant / 10.**(iexp - 4)).astype(_np.float32)
+    fast = ((ips > _CONVIP_OLD_MAX) & (ips < (1 << 28)) &
+            (mant < _CONVIP_MANT_MAX) &
+            _np.isin(kinds, _CONVIP_FLOAT_KINDS) &
+            ~(_np.isin(kinds, _CONVIP_SHARED_KINDS) & (values > 1.)))
+    if mode != _rc.CONVIP_DECODE:
+        fast[...] = False
+    if not _np.all(fast):
+        slow = ~fast
+        (uips, uinv) = _np.unique(ips[slow], return_inverse=True)
+        uvalues = _np.empty(uips.size, dtype=_np.float32)
+        ukinds  = _np.empty(uips.size, dtype=_np.int32)
+        for i, ip in enumerate(uips.tolist()):
+            (uvalues[i], ukinds[i]) = convertIp(mode, ip)
+        uinv = _np.ravel(uinv)
+        values[slow] = uvalues[uinv]
+        kinds[slow] = ukinds[uinv]
+    return (values, kinds)
+
+
+def _convertIp_encode_many(mode, values, kinds):
+    """
+    Encode arrays of values, kinds, see convertIp_many
+
+    New style encoding of float kinds is done with numpy,
+    following the c_ConvertIp normalization steps in float32,
+    others with convertIp, calling it once per distinct value
+
+    Return ips as a numpy array of int32
+    """
+    values = _np.asarray(values)
+    kinds = _np.asarray(kinds)
+    if not (values.dtype.kind in 'iuf' or values.size == 0):
+        raise TypeError("convertIp_many: Expecting values of type float, " +
+                        "Got {0}".format(values.dtype))
+    if not (kinds.dtype.kind in 'iu' or kinds.size == 0):
+        raise TypeError("convertIp_many: Expecting kind of type int, " +
+                        "Got {0}".format(kinds.dtype))
+    (values, kinds) = _np.broadcast_arrays(values.astype(_np.float32),
+                                           kinds.astype(_np.int32))
+    temp = values.copy()
+    iexp = _np.full(temp.shape, 4, dtype=_np.int32)
+    # Normalize the mantissa to [100000, 1000000[ with exponent in [0, 15]
+    while True:
+        sel = (temp < 100000.) & (iexp < 15)
+        if not _np.any(sel):
+            break
+        temp[sel] = (temp[sel] * 10.).astype(_np.float32)
+        iexp[sel] += 1
+    while True:
+        sel = (temp >= 1000000.) & (iexp > 0)
+        if not _np.any(sel):
+            break
+        temp[sel] = (temp[sel] / 10.).astype(_np.float32)
+        iexp[sel] -= 1
+    with _np.errstate(invalid='ignore'):
+        mant = _np.floor(temp.astype(_np.float64) + 0.5)
+        fast = (_np.isfinite(values) & (values >= 0.) &
+                (mant < _CONVIP_MANT_MAX) &
+                _np.isin(kinds, _CONVIP_FLOAT_KINDS) &
+                ~(_np.isin(kinds, _CONVIP_SHARED_KINDS) & (values > 1.)))
+    if mode != _rc.CONVIP_ENCODE:
+        fast[...] = False
+    mant = _np.where(fast, mant, 0.).astype(_np.int32)
+    ips = (kinds << 24) | (iexp << 20) | mant
+    if not _np.all(fast):
+        (fvalues, fkinds, fips) = (values.ravel(), kinds.ravel(),
+                                   ips.reshape(-1))
+        cache = {}
+        for i in _np.flatnonzero(~fast).tolist():
+            key = (float(fvalues[i]), int(fkinds[i]))
+            if key not in cache:
+                cache[key] = convertIp(mode, key[0], key[1])
+            fips[i] = cache[key]
+    return ips
+
+
 def fstsui(iunit):
     """
     Finds the next record that matches the last search criterias
@@ -1983,6 +2830,65 @@ def fstsui(iunit):
         }
 
 
+def fstunitid(iunit):
+    """
+    Return an identifier of the file(s) opened with fstopenall on iunit
+
+    The identifier is made of the path, size and modification time
+    of each file, it is taken on first call and kept until fstcloseall;
+    it can be used to key caches of what is read from the unit.
+
+    unitid = fstunitid(iunit)
+
+    Args:
+        iunit : unit number associated to the file(s)
+                obtained with fstopenall
+    Returns:
+        tuple of (path, size, mtime) for each file,
+        None if iunit was not opened with fstopenall in FST_RO mode
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+    >>> funit = rmn.fstopenall(filename, rmn.FST_RO)
+    >>> unitid = rmn.fstunitid(funit)
+    >>> rmn.fstcloseall(funit)
+
+    See Also:
+        fstopenall
+        fstcloseall
+    """
+    if not isinstance(iunit, _integer_types):
+        raise TypeError("fstunitid: Expecting arg of type int, Got {0}"\
+                        .format(type(iunit)))
+    if iunit < 0:
+        raise ValueError("fstunitid: must provide a valid iunit: {0}"\
+                         .format(iunit))
+    unitid = _unitIds.get(iunit, None)
+    if unitid is not None:
+        return unitid
+    try:
+        iunitlist = _linkedUnits[str(iunit)]
+    except KeyError:
+        iunitlist = (iunit,)
+    paths = [_unitPaths.get(iunit1, None) for iunit1 in iunitlist]
+    if None in paths:
+        return None
+    try:
+        stats = [os.stat(path) for path in paths]
+    except OSError:
+        return None
+    unitid = tuple([(path, stat.st_size, stat.st_mtime)
+                    for (path, stat) in zip(paths, stats)])
+    _unitIds[iunit] = unitid
+    return unitid
+
+
 def fstvoi(iunit, options=' '):
     """
     Prints out the directory content of a RPN standard file
@@ -2442,6 +3348,7 @@ def convertIp(mode, v, k=0):
     >>> (val, kind) = rmn.convertIp(rmn.CONVIP_DECODE, ip1)
 
     See Also:
+        convertIp_many
         ip1_val
         ip2_val
         ip3_val
@@ -2481,6 +3388,57 @@ def convertIp(mode, v, k=0):
         return (cp.value, ckind.value)
 
 
+def convertIp_many(mode, v, k=0):
+    """
+    Codage/Decodage P, kind <-> IP pour des tableaux de IP1, IP2, IP3
+
+    ips       = convertIp_many(mode, p, kind) #if mode > 0
+    (p, kind) = convertIp_many(mode, ips)     #if mode <= 0
+
+    Array version of convertIp, new style ip (CONVIP_ENCODE, CONVIP_DECODE)
+    of float kinds are converted with numpy, without calling librmn;
+    old style ip and special cases are converted with convertIp,
+    once per distinct value.
+
+    Args:
+        ips  : Encoded values (array-like of int)
+        p    : Real Values (array-like of float)
+        kind : Level encoding kind/code (int or array-like of int,
+               broadcasted against p)
+        mode : Conversion mode (int), see convertIp
+    Returns:
+        numpy.ndarray of int32, ip Encoded values, if mode > 0
+        (numpy.ndarray of float32, numpy.ndarray of int32),
+            (pvalues, kinds) Decoded values, if mode <= 0
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        FSTDError  on any other error
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> ip1s = rmn.convertIp_many(rmn.CONVIP_ENCODE, [1000., 850., 500.],
+    ...                           rmn.KIND_PRESSURE)
+    >>> (vals, kinds) = rmn.convertIp_many(rmn.CONVIP_DECODE, ip1s)
+    >>> print("# {} {}".format(vals.tolist(), kinds.tolist()))
+    # [1000.0, 850.0, 500.0] [2, 2, 2]
+
+    See Also:
+        convertIp
+        fstinventory
+        rpnpy.librmn.const
+    """
+    if not isinstance(mode, _integer_types):
+        raise TypeError("convertIp_many: " +
+                        "Expecting mode to be of type int, Got {0} : {1}"\
+                        .format(type(mode), repr(mode)))
+    if mode < -1 or mode > 3:
+        raise ValueError("convertIp_many: must provide a valid mode: {0}".format(mode))
+    if mode > 0:
+        return _convertIp_encode_many(mode, v, k)
+    return _convertIp_decode_many(v, mode)
+
+
 def convertIPtoPK(ip1, ip2, ip3):
     """
     Convert/decode ip1, ip2, ip3 to their kind + real value conterparts
@@ -22,6 +22,8 @@ See Also:
     rpnpy.librmn.interp
     rpnpy.librmn.const
 """
+import threading as _threading
+from collections import OrderedDict as _OrderedDict
 import numpy  as _np
 from math import sqrt as _sqrt
 from rpnpy.librmn import const as _rc
@@ -33,6 +35,10 @@ from rpnpy.librmn import RMNError
 from rpnpy import integer_types as _integer_types
 from rpnpy import range as _range
 
+_gridCache = _OrderedDict()
+_gridCacheLock = _threading.Lock()
+_gridCacheSize = _rc.EZ_GRID_CACHE_SIZE
+
 _list2ftnf32 = lambda x: x if isinstance(x, _np.ndarray) \
                            else _np.asfortranarray(x, dtype=_np.float32)
 
@@ -520,11 +526,17 @@ def getIgTags(params):
             )
 
 
-def readGrid(funit, params):
+def readGrid(funit, params, cache=False):
     """
     Create a new grid with its parameters from provided params
     Read grid descriptors from file if need be
 
+    With cache=True, decoded grids are kept in a process wide LRU cache
+    keyed on the grid tags and dimensions, plus the file(s) identity
+    (see fstunitid) for Z, #, Y, U grids whose ig1-4 identify
+    the >>, ^^ (or ^>) positional records in the file(s),
+    other calls for the same grid are a dictionary lookup.
+
     Args:
         funit  (int) :
         params (dict): grid parameters given as a dictionary (dict)
@@ -535,6 +547,11 @@ def readGrid(funit, params):
             'ig3'    : third grid descriptor
             'ig4'    : fourth grid descriptor
             }
+        cache  (bool): use the grid cache (default False)
+                       The grid id of a cached grid is shared with other
+                       callers, do not gdrls it yourself.
+                       Z, #, Y, U grids are only cached when the file was
+                       opened with fstopenall in FST_RO mode
     Returns:
         {
             'id'    : grid id, same as input arg
@@ -574,17 +591,140 @@ def readGrid(funit, params):
     See Also:
         writeGrid
         decodeGrid
+        readGridCacheSize
+        readGridCacheClear
         rpnpy.librmn.interp.ezqkdef
         rpnpy.librmn.fstd98.fstopenall
+        rpnpy.librmn.fstd98.fstunitid
         rpnpy.librmn.fstd98.fstlir
         rpnpy.librmn.fstd98.fstcloseall
     """
     params['iunit'] = funit
+    cachekey = _readGrid_cachekey(funit, params) \
+        if cache and _gridCacheSize > 0 else None
+    if cachekey is not None:
+        with _gridCacheLock:
+            params2 = _gridCache.get(cachekey, None)
+            if params2 is not None:
+                _gridCache.move_to_end(cachekey)
+        if params2 is not None:
+            params['id'] = params2['id']
+            return _readGridCache_copy(params2)
     params['id'] = _ri.ezqkdef(params)
     params2 = decodeGrid(params)
+    if cachekey is not None:
+        with _gridCacheLock:
+            _gridCache[cachekey] = _readGridCache_copy(params2)
+            _readGridCache_trim(_gridCacheSize)
     return params2
 
 
+def readGridCacheSize(size=None):
+    """
+    Get or set the max number of grids kept in the readGrid cache
+
+    size = readGridCacheSize()
+    readGridCacheSize(size)
+
+    Args:
+        size (int): new max number of grids, 0 to disable the cache,
+                    when None the size is not changed
+    Returns:
+        int, the max number of grids kept in the cache
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> size = rmn.readGridCacheSize()
+    >>> size = rmn.readGridCacheSize(256)
+
+    See Also:
+        readGrid
+        readGridCacheClear
+        rpnpy.librmn.const.EZ_GRID_CACHE_SIZE
+    """
+    global _gridCacheSize
+    if size is not None:
+        if not isinstance(size, _integer_types):
+            raise TypeError("readGridCacheSize: Expecting arg of type int, Got {0}"\
+                            .format(type(size)))
+        if size < 0:
+            raise ValueError("readGridCacheSize: size must be >= 0, Got {0}"\
+                             .format(size))
+        with _gridCacheLock:
+            _gridCacheSize = size
+            _readGridCache_trim(_gridCacheSize)
+    return _gridCacheSize
+
+
+def readGridCacheClear():
+    """
+    Remove all grids from the readGrid cache
+
+    Grid ids are not released, they may still be used by readGrid callers
+
+    readGridCacheClear()
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>> rmn.readGridCacheClear()
+
+    See Also:
+        readGrid
+        readGridCacheSize
+    """
+    with _gridCacheLock:
+        _readGridCache_trim(0)
+
+
+def _readGridCache_trim(size):
+    """
+    Evict least recently used grids above size, lock must be held
+
+    Evicted grid ids are not released (gdrls): ezqkdef returns the same id
+    to anyone defining the same grid in the process (readGrid without cache,
+    ezqkdef, defGrid_*) and callers keep it as a plain int (grid['id']),
+    ezscint has no reference count, so the cache cannot tell when
+    an id is no longer used; re-reading an evicted grid gets its id back
+    """
+    while len(_gridCache) > size:
+        _gridCache.popitem(last=False)
+
+
+def _readGridCache_copy(params):
+    """
+    Return a copy of params with its own copy of the arrays
+    """
+    return dict([(k, v.copy() if isinstance(v, _np.ndarray) else v)
+                 for (k, v) in params.items()])
+
+
+def _readGrid_cachekey(funit, params):
+    """
+    Return the readGrid cache key for params, None if not cachable
+
+    For Z, #, Y, U grids the ig1-4 identify the positional records,
+    the file(s) they are read from is identified with fstunitid
+    """
+    try:
+        grtyp = params['grtyp'].strip()
+        key = (grtyp, ) + tuple([int(params[k]) for k in
+                                 ('ig1', 'ig2', 'ig3', 'ig4', 'ni', 'nj')])
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+    if grtyp not in ('Z', '#', 'Y', 'U'):
+        return key
+    try:
+        unitid = _rf.fstunitid(funit)
+    except (TypeError, ValueError):
+        return None
+    if unitid is None:
+        return None
+    return key + (unitid, )
+
+
 def writeGrid(funit, params):
     """
     Write the grid descriptors to file if need be
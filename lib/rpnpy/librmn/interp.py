@@ -28,6 +28,7 @@ from rpnpy.librmn import proto as _rp
 from rpnpy.librmn  import const as _rc
 from rpnpy.librmn  import RMNError
 from rpnpy import integer_types as _integer_types
+from rpnpy import range as _range
 from rpnpy import C_WCHAR2CHAR as _C_WCHAR2CHAR
 from rpnpy import C_CHAR2WCHAR as _C_CHAR2WCHAR
 from rpnpy import C_MKSTR as _C_MKSTR
@@ -1532,6 +1533,8 @@ def ezsint(gdidout, gdidin, zin, zout=None):
                   Dict with key 'id' is accepted from version 2.0.rc1
         zin     : data to interpolate (numpy.ndarray or dict)
                   Dict with key 'd' is accepted from version 2.0.rc1
+                  of shape (ni, nj) or (ni, nj, ...) to interpolate
+                  all levels/times in one call
         zout    : optional, interp.result array (numpy.ndarray or dict)
                   Dict with key 'd' is accepted from version 2.0.rc1
     Returns:
@@ -1540,6 +1543,10 @@ def ezsint(gdidout, gdidin, zin, zout=None):
         TypeError    on wrong input arg types
         EzscintError on any other error
 
+    Notes:
+        Levels of a 3D/4D zin are interpolated sequentially,
+        ezscint keeps global (unlocked) state and is not thread safe.
+
     Examples:
     >>> import os, os.path
     >>> import rpnpy.librmn.all as rmn
@@ -1560,6 +1567,13 @@ def ezsint(gdidout, gdidin, zin, zout=None):
     >>> # Interpolate ME linearly
     >>> rmn.ezsetopt(rmn.EZ_OPT_INTERP_DEGREE, rmn.EZ_INTERP_LINEAR)
     >>> me = rmn.ezsint(outGrid['id'], inGrid['id'], meRec['d'])
+    >>>
+    >>> # Interpolate a stack of fields in one call
+    >>> import numpy as np
+    >>> me3 = np.dstack([meRec['d']] * 3)
+    >>> me3 = rmn.ezsint(outGrid['id'], inGrid['id'], me3)
+    >>> print("# me3.shape = {0}".format(me3.shape))
+    # me3.shape = (200, 100, 3)
 
     See Also:
         ezuvint
@@ -1579,18 +1593,25 @@ def ezsint(gdidout, gdidin, zin, zout=None):
     gridsetid = ezdefset(gdidout, gdidin)
     gridParams = ezgxprm(gdidin)
     zin  = _ftnf32(zin)
-    if zin.shape != gridParams['shape']:
+    if zin.ndim < 2 or zin.shape[0:2] != gridParams['shape']:
         raise TypeError("Provided zin array have inconsistent " +
                         "shape compared to the input grid")
-    dshape = ezgprm(gdidout)['shape']
+    dshape = ezgprm(gdidout)['shape'] + zin.shape[2:]
     zout = _ftnOrEmpty(zout, dshape, zin.dtype)
     if not (isinstance(zout, _np.ndarray) and zout.shape == dshape):
         raise TypeError("Wrong type,shape for zout: {0}, {1}"\
                         .format(type(zout), repr(dshape)))
-    istat = _rp.c_ezsint(zout, zin)
-    if istat >= 0:
-        return zout
-    raise EzscintError()
+    if zin.ndim == 2:
+        istat = _rp.c_ezsint(zout, zin)
+        if istat >= 0:
+            return zout
+        raise EzscintError()
+    zin3  = zin.reshape(gridParams['shape'] + (-1, ), order='F')
+    zout3 = zout.reshape(dshape[0:2] + (-1, ), order='F')
+    for k in _range(zin3.shape[2]):
+        if _rp.c_ezsint(zout3[:, :, k], zin3[:, :, k]) < 0:
+            raise EzscintError()
+    return zout
 
 
 #TODO: ezuvint, when given dict for grids, return dict then (would need new fn)?
@@ -1620,6 +1641,12 @@ def ezuvint(gdidout, gdidin, uuin, vvin, uuout=None, vvout=None):
         TypeError    on wrong input arg types
         EzscintError on any other error
 
+    Notes:
+        uuin, vvin can be of shape (ni, nj) or (ni, nj, ...)
+        to interpolate all levels/times in one call.
+        Levels are interpolated sequentially, ezscint keeps
+        global (unlocked) state and is not thread safe.
+
     Examples:
     >>> import os, os.path
     >>> import rpnpy.librmn.all as rmn
@@ -1662,10 +1689,11 @@ def ezuvint(gdidout, gdidin, uuin, vvin, uuout=None, vvout=None):
     gridParams = ezgxprm(gdidin)
     uuin  = _ftnf32(uuin)
     vvin  = _ftnf32(vvin)
-    if uuin.shape != gridParams['shape'] or vvin.shape != gridParams['shape']:
+    if (uuin.ndim < 2 or uuin.shape[0:2] != gridParams['shape'] or
+        vvin.shape != uuin.shape):
         raise TypeError("ezuvint: Provided uuin, vvin array have " +
                         "inconsistent shape compared to the input grid")
-    dshape = ezgprm(gdidout)['shape']
+    dshape = ezgprm(gdidout)['shape'] + uuin.shape[2:]
     uuout = _ftnOrEmpty(uuout, dshape, uuin.dtype)
     vvout = _ftnOrEmpty(vvout, dshape, uuin.dtype)
     if not (isinstance(uuout, _np.ndarray) and
@@ -1675,10 +1703,250 @@ def ezuvint(gdidout, gdidin, uuin, vvin, uuout=None, vvout=None):
     if uuout.shape != dshape or vvout.shape != dshape:
         raise TypeError("ezuvint: Provided uuout, vvout array have " +
                         "inconsistent shape compered to the output grid")
-    istat = _rp.c_ezuvint(uuout, vvout, uuin, vvin)
-    if istat >= 0:
-        return (uuout, vvout)
-    raise EzscintError()
+    if uuin.ndim == 2:
+        istat = _rp.c_ezuvint(uuout, vvout, uuin, vvin)
+        if istat >= 0:
+            return (uuout, vvout)
+        raise EzscintError()
+    (shape3, dshape3) = (gridParams['shape'] + (-1, ), dshape[0:2] + (-1, ))
+    (uuin3, vvin3) = (uuin.reshape(shape3, order='F'),
+                      vvin.reshape(shape3, order='F'))
+    (uuout3, vvout3) = (uuout.reshape(dshape3, order='F'),
+                        vvout.reshape(dshape3, order='F'))
+    for k in _range(uuin3.shape[2]):
+        if _rp.c_ezuvint(uuout3[:, :, k], vvout3[:, :, k],
+                         uuin3[:, :, k], vvin3[:, :, k]) < 0:
+            raise EzscintError()
+    return (uuout, vvout)
+
+
+class EzInterpPlan(object):
+    """
+    Precomputed horizontal interpolation from one grid to another
+
+    The destination points positions on the source grid and the
+    interpolation indices/weights are computed once, then applied
+    to any number of fields, or stacks of fields, with numpy.
+
+    plan = EzInterpPlan(gdidout, gdidin)
+    plan = EzInterpPlan(gdidout, gdidin, interp)
+    zout = plan.ezsint(zin)
+    (uuout, vvout) = plan.ezuvint(uuin, vvin)
+
+    Args:
+        gdidout : output grid id (int or dict)
+        gdidin  : grid id describing zin grid (int or dict)
+        interp  : interpolation type, one of
+                  EZ_INTERP_NEAREST, EZ_INTERP_LINEAR
+                  Default: current EZ_OPT_INTERP_DEGREE option value
+    Raises:
+        TypeError    on wrong input arg types
+        EzscintError on any other error
+
+    Notes:
+        Weights are precomputed for NEAREST and LINEAR interpolation
+        from non 'Y', non 'U' source grids to non 'U' destination grids
+        when all destination points are inside the source grid
+        (source A and G grids are considered periodic along x).
+        For other cases (CUBIC, cloud points, super grids, points
+        needing extrapolation or polar handling, like the polar caps
+        of global A and G grids) the plan falls back on ezsint/ezuvint
+        with its interp type and the current EXTRAP_DEGREE/EXTRAP_VALUE
+        ezscint options.
+        Vectors are interpolated as 2 scalars when the 2 grids are
+        aligned with the geographic axes (A, B, G, L grids, Z grids
+        with L grref), otherwise the plan falls back on ezuvint.
+
+    Examples:
+    >>> import rpnpy.librmn.all as rmn
+    >>>
+    >>> # Define source and destination grids
+    >>> inGrid  = rmn.defGrid_G(90, 45)
+    >>> outGrid = rmn.defGrid_L(200, 100, 35., 265., 0.25, 0.25)
+    >>>
+    >>> # Compute the interpolation plan once
+    >>> plan = rmn.EzInterpPlan(outGrid, inGrid, rmn.EZ_INTERP_LINEAR)
+    >>>
+    >>> # Interpolate a stack of 80 levels in one call
+    >>> import numpy as np
+    >>> zin  = np.ones((90, 45, 80), dtype=np.float32, order='F')
+    >>> zout = plan.ezsint(zin)
+    >>> print("# zout.shape = {0}".format(zout.shape))
+    # zout.shape = (200, 100, 80)
+
+    See Also:
+        ezsint
+        ezuvint
+        gdxyfll
+        ezsetopt
+        rpnpy.librmn.const
+    """
+
+    def __init__(self, gdidout, gdidin, interp=None):
+        self.gdidout = _getCheckArg(int, gdidout, gdidout, 'id')
+        self.gdidin  = _getCheckArg(int, gdidin, gdidin, 'id')
+        if interp is None:
+            interp = ezgetopt(_rc.EZ_OPT_INTERP_DEGREE, vtype=str)
+        if not isinstance(interp, str):
+            raise TypeError("EzInterpPlan: Expecting interp of type str, " +
+                            "Got {0}".format(type(interp)))
+        self.interp = interp.strip().upper()
+        self.gridin  = ezgxprm(self.gdidin)
+        self.gridout = ezgxprm(self.gdidout)
+        self.index   = None
+        self.weights = None
+        if (self.interp in (_rc.EZ_INTERP_NEAREST, _rc.EZ_INTERP_LINEAR) and
+            self.gridin['grtyp'] not in ('Y', 'U') and
+            self.gridout['grtyp'] != 'U'):
+            self._set_weights()
+
+
+    def _set_weights(self):
+        """
+        Compute the destination points source indices and weights
+
+        Leave index and weights to None if any destination point
+        is outside of the source grid, ezscint extrapolation
+        and polar handling is then needed
+        """
+        (ni, nj) = self.gridin['shape']
+        lalo = gdll(self.gdidout)
+        xy   = gdxyfll(self.gdidin, lalo['lat'].ravel(order='F'),
+                       lalo['lon'].ravel(order='F'))
+        # Fortran (1 based) to C (0 based) positions
+        x = xy['x'].astype(_np.float64) - 1.
+        y = xy['y'].astype(_np.float64) - 1.
+        periodic = self.gridin['grtyp'] in ('A', 'G')
+        eps = 1.e-4
+        inside = (y >= -eps) & (y <= nj - 1. + eps)
+        if not periodic:
+            inside &= (x >= -eps) & (x <= ni - 1. + eps)
+        if not _np.all(inside):
+            return
+        if self.interp == _rc.EZ_INTERP_NEAREST:
+            i = _np.floor(x + 0.5).astype(_np.intp)
+            j = _np.clip(_np.floor(y + 0.5).astype(_np.intp), 0, nj - 1)
+            i = i % ni if periodic else _np.clip(i, 0, ni - 1)
+            self.index   = (i + j * ni)[:, None]
+            self.weights = _np.ones(self.index.shape, dtype=_np.float32)
+            return
+        if not periodic:
+            x = _np.clip(x, 0., ni - 1.)
+        y = _np.clip(y, 0., nj - 1.)
+        i0 = _np.floor(x).astype(_np.intp)
+        j0 = _np.minimum(_np.floor(y).astype(_np.intp), max(0, nj - 2))
+        (dx, dy) = (x - i0, y - j0)
+        i1 = i0 + 1
+        if periodic:
+            (i0, i1) = (i0 % ni, i1 % ni)
+        else:
+            i0 = _np.minimum(i0, max(0, ni - 2))
+            (i1, dx) = (_np.minimum(i0 + 1, ni - 1), x - i0)
+        j1 = _np.minimum(j0 + 1, nj - 1)
+        self.index = _np.stack((i0 + j0 * ni, i1 + j0 * ni,
+                                i0 + j1 * ni, i1 + j1 * ni), axis=1)
+        self.weights = _np.stack(((1. - dx) * (1. - dy), dx * (1. - dy),
+                                  (1. - dx) * dy, dx * dy),
+                                 axis=1).astype(_np.float32)
+
+
+    def _apply(self, zin, zout):
+        """
+        Apply precomputed weights to zin[ni, nj, ...]
+        """
+        (ni, nj) = self.gridin['shape']
+        dshape = self.gridout['shape'] + zin.shape[2:]
+        zin2 = zin.reshape((ni * nj, -1), order='F')
+        zout2 = self.weights[:, 0:1] * zin2[self.index[:, 0], :]
+        for k in _range(1, self.index.shape[1]):
+            zout2 += self.weights[:, k:k+1] * zin2[self.index[:, k], :]
+        if zout is None:
+            return _np.asfortranarray(zout2.reshape(dshape, order='F'),
+                                      dtype=zin.dtype)
+        zout[...] = zout2.reshape(dshape, order='F')
+        return zout
+
+
+    def _check(self, name, zin, zout):
+        zin = _getCheckArg(_np.ndarray, zin, zin, 'd')
+        zout = _getCheckArg(None, zout, zout, 'd')
+        if zin.shape[0:2] != self.gridin['shape']:
+            raise TypeError("EzInterpPlan: Provided {0} array have ".format(name) +
+                            "inconsistent shape compared to the input grid")
+        dshape = self.gridout['shape'] + zin.shape[2:]
+        if not (zout is None or
+                (isinstance(zout, _np.ndarray) and zout.shape == dshape)):
+            raise TypeError("EzInterpPlan: Wrong type,shape for {0}out: {1}, {2}"\
+                            .format(name, type(zout), repr(dshape)))
+        return (_ftnf32(zin), zout)
+
+
+    def ezsint(self, zin, zout=None):
+        """
+        Scalar horizontal interpolation of one or a stack of fields
+
+        zout = plan.ezsint(zin)
+        zout = plan.ezsint(zin, zout)
+
+        Args:
+            zin  : data to interpolate, of shape (ni, nj) or (ni, nj, ...)
+                   (numpy.ndarray or dict)
+            zout : optional, interp.result array (numpy.ndarray or dict)
+        Returns:
+            numpy.ndarray, interpolation result
+        Raises:
+            TypeError    on wrong input arg types
+            EzscintError on any other error
+        """
+        (zin, zout) = self._check('z', zin, zout)
+        if self.index is not None:
+            return self._apply(zin, zout)
+        return self._ezint(ezsint, zin, zout)
+
+
+    def ezuvint(self, uuin, vvin, uuout=None, vvout=None):
+        """
+        Vectorial horizontal interpolation of one or a stack of fields
+
+        (uuout, vvout) = plan.ezuvint(uuin, vvin)
+        (uuout, vvout) = plan.ezuvint(uuin, vvin, uuout, vvout)
+
+        Args:
+            uuin  : data x-part to interpolate (numpy.ndarray or dict)
+                    of shape (ni, nj) or (ni, nj, ...)
+            vvin  : data y-part to interpolate (numpy.ndarray or dict)
+            uuout : interp.result array x-part (numpy.ndarray or dict)
+            vvout : interp.result array y-part (numpy.ndarray or dict)
+        Returns:
+            interpolation result (numpy.ndarray, numpy.ndarray)
+        Raises:
+            TypeError    on wrong input arg types
+            EzscintError on any other error
+        """
+        (uuin, uuout) = self._check('uu', uuin, uuout)
+        (vvin, vvout) = self._check('vv', vvin, vvout)
+        if uuin.shape != vvin.shape:
+            raise TypeError("EzInterpPlan: uuin, vvin must have the same shape")
+        geo = lambda g: (g['grtyp'] in ('A', 'B', 'G', 'L') or
+                         (g['grtyp'] in ('Z', '#') and g['grref'] == 'L'))
+        if (self.index is not None and
+            geo(self.gridin) and geo(self.gridout)):
+            return (self._apply(uuin, uuout), self._apply(vvin, vvout))
+        return self._ezint(ezuvint, uuin, vvin, uuout, vvout)
+
+
+    def _ezint(self, func, *args):
+        """
+        Fall back on ezsint/ezuvint with the plan interp type
+        """
+        interp = ezgetopt(_rc.EZ_OPT_INTERP_DEGREE, vtype=str).strip().upper()
+        if interp != self.interp:
+            ezsetopt(_rc.EZ_OPT_INTERP_DEGREE, self.interp)
+        try:
+            return func(self.gdidout, self.gdidin, *args)
+        finally:
+            if interp != self.interp:
+                ezsetopt(_rc.EZ_OPT_INTERP_DEGREE, interp)
 
 
 def gdllsval(gdid, lat, lon, zin, zout=None):
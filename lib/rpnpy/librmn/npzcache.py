@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright: LGPL 2.1
+
+"""
+Module librmn.npzcache contains helpers to cache on disk, as npz files,
+arrays derived from a file (FST index, BURP index, table B)
+
+The cache file is valid as long as the file it was made from keeps the
+same path, size and modification time.
+This module is used internally by rpnpy.librmn modules,
+it is not part of rpnpy.librmn.all
+
+See Also:
+    rpnpy.librmn.fstd98.fstindex
+    rpnpy.librmn.burp.burp_index
+    rpnpy.librmn.burp.mrbcvt_table
+"""
+import os      as _os
+import hashlib as _hashlib
+import numpy   as _np
+
+def npzcache_path(path, cachedir, suffix):
+    """
+    Return the cache file name for file path, in cachedir or next to path
+    """
+    if cachedir:
+        pathid = _hashlib.sha1(path.encode('utf-8')).hexdigest()[0:16]
+        return _os.path.join(cachedir, '{0}.{1}{2}'.format(
+            _os.path.basename(path), pathid, suffix))
+    return _os.path.join(_os.path.dirname(path),
+                         '.' + _os.path.basename(path) + suffix)
+
+
+def npzcache_load(cpath, path, version, caller, check=None, verbose=None):
+    """
+    Load the arrays of cache file cpath made from file path
+
+    The cache is valid if made with the same version from path
+    in its current state (size, mtime) and check(arrays) is True.
+    Return the dict of arrays, None if there is no valid cache
+    """
+    if not _os.path.isfile(cpath):
+        return None
+    try:
+        fstat = _os.stat(path)
+        with _np.load(cpath, allow_pickle=False) as data:
+            if (int(data['_version']) != version or
+                str(data['_path']) != path or
+                int(data['_size']) != fstat.st_size or
+                int(data['_mtime']) != fstat.st_mtime_ns):
+                if verbose:
+                    print("({0}) Ignoring outdated cache: {1}".format(caller, cpath))
+                return None
+            arrays = dict([(k, data[k]) for k in data.files
+                           if not k.startswith('_')])
+    except Exception as e:
+        if verbose:
+            print("({0}) Ignoring unreadable cache: {1} ({2})"\
+                  .format(caller, cpath, repr(e)))
+        return None
+    if check is not None and not check(arrays):
+        if verbose:
+            print("({0}) Ignoring inconsistent cache: {1}".format(caller, cpath))
+        return None
+    if verbose:
+        print("({0}) Using cache: {1}".format(caller, cpath))
+    return arrays
+
+
+def npzcache_save(cpath, path, version, arrays, caller, verbose=None):
+    """
+    Save the arrays made from file path into cache file cpath, ignore errors
+
+    The file is written under a temporary name then renamed, concurrent
+    readers never see a partial file
+    """
+    tmppath = '{0}.{1}.tmp.npz'.format(cpath, _os.getpid())
+    try:
+        cachedir = _os.path.dirname(cpath)
+        if cachedir and not _os.path.isdir(cachedir):
+            _os.makedirs(cachedir)
+        fstat = _os.stat(path)
+        _np.savez(tmppath, _version=version, _path=path, _size=fstat.st_size,
+                  _mtime=fstat.st_mtime_ns, **arrays)
+        _os.replace(tmppath, cpath)
+        if verbose:
+            print("({0}) Saved cache: {1}".format(caller, cpath))
+    except Exception as e:
+        if verbose:
+            print("({0}) Cannot save cache: {1} ({2})"\
+                  .format(caller, cpath, repr(e)))
+        try:
+            _os.unlink(tmppath)
+        except OSError:
+            pass
+
+
+# -*- Mode: C; tab-width: 4; indent-tabs-mode: nil -*-
+# vim: set expandtab ts=4 sw=4:
+# kate: space-indent on; indent-mode cstyle; indent-width 4; mixedindent off;
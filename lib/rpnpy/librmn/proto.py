@@ -504,6 +504,13 @@ Details:
             To read other data types you will need to redefine it with the
             appropriate type
 
+    c_fstluk_p(field, handle, ni, nj, nk)
+        Same as c_fstluk but field is a raw data pointer (_ct.c_void_p)
+        Note:
+            This is a distinct ctypes function object, its argtypes are
+            never redefined; the caller is responsible for providing
+            a buffer of the appropriate type and size
+
     c_fstmsq(field, iun, ni, nj, nk, datev, etiket,
              ip1, ip2, ip3, typvar, nomvar)
         Mask a portion of the research keys
@@ -1798,6 +1805,13 @@ librmn.c_fstluk.argtypes = (
 librmn.c_fstluk.restype  = _ct.c_int
 c_fstluk = librmn.c_fstluk
 
+c_fstluk_p = librmn['c_fstluk']
+c_fstluk_p.argtypes = (
+    _ct.c_void_p, _ct.c_int,
+    _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int)
+    )
+c_fstluk_p.restype  = _ct.c_int
+
 
 librmn.c_fstmsq.argtypes = (
     _ct.c_int,
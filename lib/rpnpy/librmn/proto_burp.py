@@ -190,6 +190,33 @@ Details:
         Returns:
             int, zero if successful, non-zero otherwise
 
+    c_mrfprm(handle, stnid, idtyp, lat, lon, dx, dy, date, temps, flgs,
+             sup, nsup, lng)
+        Get the main parameters of the report referenced by handle
+        without reading it.
+        Proto:
+            int c_mrfprm(handle,stnid,idtyp,lat,lon,dx,dy,date,temps,flgs,
+                         sup,nsup,lng)
+            int handle,*idtyp,*lat,*lon,*date,*temps,*flgs,sup[],nsup,*lng;
+            int *dx, *dy;
+            char stnid[10];
+        Args:
+            handle (int)   : (I) Report handle
+            stnid  (str)   : (O) Station ID
+            idtyp  (int)   : (O) Report Type
+            lat    (int)   : (O) Station latitude (1/100 of degrees)
+            lon    (int)   : (O) Station longitude (1/100 of degrees)
+            dx     (int)   : (O) Width of a box for regrouped data
+            dy     (int)   : (O) Height of a box for regrouped data
+            date   (int)   : (O) Report valid date (YYYYMMDD)
+            temps  (int)   : (O) Observation time/hour (HHMM)
+            flgs   (int)   : (O) Global flags
+            sup    (array) : (O) Additional search keys
+            nsup   (int)   : (I) number of sup (must be 0)
+            lng    (int)   : (O) Length of the report in host words
+        Returns:
+            int, zero if successful, non-zero otherwise
+
     c_mrfput(iun, handle, buffer)
         Write a report to the file.
         If handle != 0, record referenced by handle is written at end of file.
@@ -611,7 +638,6 @@ Details:
 ## char stnid[];
 
 
-#TODO: c_mrfprm
 ## ***S/P MRFPRM - OBTENIR LES PARAMETRES PRINCIPAUX D'UN RAPPORT
 ##       FUNCTION MRFPRM(HANDLE, STNID, IDTYP, LAT, LON, DX, DY, DATE,
 ##      X                TEMPS,  FLGS,  SUP,   NSUP,     LONENR)
@@ -709,6 +735,16 @@ librmn.c_mrfget.argtypes = (_ct.c_int, _npc.ndpointer(dtype=_np.int32))
 librmn.c_mrfget.restype  = _ct.c_int
 c_mrfget = librmn.c_mrfget
 
+librmn.c_mrfprm.argtypes = (_ct.c_int, _ct.c_char_p,
+                            _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int),
+                            _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int),
+                            _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int),
+                            _ct.POINTER(_ct.c_int), _ct.POINTER(_ct.c_int),
+                            _npc.ndpointer(dtype=_np.int32), _ct.c_int,
+                            _ct.POINTER(_ct.c_int))
+librmn.c_mrfprm.restype  = _ct.c_int
+c_mrfprm = librmn.c_mrfprm
+
 librmn.c_mrfput.argtypes = (_ct.c_int, _ct.c_int,
                             _npc.ndpointer(dtype=_np.int32))
 librmn.c_mrfput.restype  = _ct.c_int
@@ -834,6 +870,10 @@ c_mrbadd_argtypes_float = (_npc.ndpointer(dtype=_np.int32), _ct.POINTER(_ct.c_in
     _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int,
     _ct.POINTER(_ct.c_int), _ct.c_int, _npc.ndpointer(dtype=_np.int32),
     _npc.ndpointer(dtype=_np.float32))
+c_mrbadd_argtypes_double = (_npc.ndpointer(dtype=_np.int32), _ct.POINTER(_ct.c_int),
+    _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int, _ct.c_int,
+    _ct.POINTER(_ct.c_int), _ct.c_int, _npc.ndpointer(dtype=_np.int32),
+    _npc.ndpointer(dtype=_np.float64))
 librmn.c_mrbadd.restype = _ct.c_int
 def c_mrbadd(buf, bkno, nele, nval, nt, bfam, bdesc, btyp, nbit, bit0,
              datyp, lstele, tblval):
@@ -841,6 +881,8 @@ def c_mrbadd(buf, bkno, nele, nval, nt, bfam, bdesc, btyp, nbit, bit0,
         librmn.c_mrbadd.argtypes = c_mrbadd_argtypes_int
     elif tblval.dtype == _np.dtype('float32'):
         librmn.c_mrbadd.argtypes = c_mrbadd_argtypes_float
+    elif tblval.dtype == _np.dtype('float64'):
+        librmn.c_mrbadd.argtypes = c_mrbadd_argtypes_double
     return librmn.c_mrbadd(buf, bkno, nele, nval, nt, bfam, bdesc, btyp, nbit,
                            bit0, datyp, lstele, tblval)
 
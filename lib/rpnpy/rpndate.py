@@ -11,6 +11,7 @@ RPN Standard Files date format
 """
 import datetime
 import pytz
+import numpy as _np
 
 #import rpnpy_version
 import rpnpy.librmn.all as _rmn
@@ -410,6 +411,8 @@ class RPNDateRange(object):
     # RPNDate(20030424, 11453500) ; RPNDate(20030423, 11453500, dt=  3600.0, nstep=    24.0)
     # RPNDate(20030424, 23453500) ; RPNDate(20030423, 11453500, dt=  3600.0, nstep=    36.0)
     # RPNDate(20030425, 11453500) ; RPNDate(20030423, 11453500, dt=  3600.0, nstep=    48.0)
+    >>> print('# {0}'.format(dr.stamps().tolist()))
+    # [307091383, 307102183, 307112983, 307123783, 307134583]
 
     See Also:
         RPNDate
@@ -460,6 +463,22 @@ class RPNDateRange(object):
         """
         return abs(self.dateFin-self.now)
 
+    def stamps(self):
+        """
+        Return all the dates in the range (step of delta hours) at once
+
+        Returns:
+            numpy.ndarray of int, CMC date time stamps of the range dates
+        Raises:
+            ValueError if delta is 0
+        """
+        if self.delta == 0:
+            raise ValueError('RPNDateRange: cannot list dates with delta=0')
+        nsteps = int(_np.floor((self.dateFin - self.dateDebut) /
+                               float(self.delta)))
+        nhours = _np.arange(max(nsteps, -1) + 1) * float(self.delta)
+        return _rmn.incdatr_many(self.dateDebut.datev, nhours)
+
     def next(self):
         """
         Return the next date/time in the range (step of delta hours)
@@ -12,12 +12,14 @@
   
  The rpnpy.utils python module includes
  - RPN STD files 3D fields read / write tool
+ - RPN STD files lazy dataset view
  - burbfile class
  - tdpack thermodynamic constants and functions
  - grid coor. rotation / transformation functions
 
  See also:
      rpnpy.utils.fstd3d
+     rpnpy.utils.fstdataset
      rpnpy.utils.burpfile
      rpnpy.utils.thermoconsts
      rpnpy.utils.thermofunc
@@ -27,7 +29,7 @@
 
 from rpnpy.version import *
 
-__SUBMODULES__ = ['fstd3d', 'burpfile', 'thermoconsts', 'thermofunc', 'llacar']
+__SUBMODULES__ = ['fstd3d', 'fstdataset', 'burpfile', 'thermoconsts', 'thermofunc', 'llacar']
 __all__ = __SUBMODULES__
 
 
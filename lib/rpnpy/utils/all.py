@@ -8,6 +8,7 @@ Short hand to load all rpnpy.utils submodules in the same namespace
  See also:
      rpnpy.utils
      rpnpy.utils.fstd3d
+     rpnpy.utils.fstdataset
      rpnpy.utils.burpfile
      rpnpy.utils.tdpack_consts
      rpnpy.utils.tdpack
@@ -17,6 +18,7 @@ Short hand to load all rpnpy.utils submodules in the same namespace
 
 from . import *
 from .fstd3d import *
+from .fstdataset import *
 from .burpfile import *
 from .tdpack_consts import *
 from .tdpack import *
@@ -38,7 +38,7 @@ def sort_ip1(ip1s):
 
     See Also:
         get_levels_keys
-        rpnpy.librmn.fstd98.convertIp
+        rpnpy.librmn.fstd98.convertIp_many
     """
     if isinstance(ip1s, (list, tuple)):
         if not all([(isinstance(i, _integer_types) and i >= 0) for i in ip1s]):
@@ -53,17 +53,18 @@ def sort_ip1(ip1s):
     # Remove duplicate ip1
     ip1s = sorted(list(set(ip1s)))
 
+    # Get real values
+    (values, kinds) = _rmn.convertIp_many(_rmn.CONVIP_DECODE, ip1s)
+    lvls = list(zip(ip1s, values.tolist()))
+
     # Check sort order
     n2 = (len(ip1s)-1)//2
-    lvlType = _rmn.convertIp(_rmn.CONVIP_DECODE, ip1s[n2])[1]
+    lvlType = int(kinds[n2])
     reverse = True
     if lvlType in (_rmn.LEVEL_KIND_MSL, _rmn.LEVEL_KIND_ANY,
                    _rmn.LEVEL_KIND_MGL):
         reverse = False
 
-    # Get real values
-    lvls = [(i, _rmn.convertIp(_rmn.CONVIP_DECODE, i)[0]) for i in ip1s]
-
     # Sort
     ip1s = [i for i,l in sorted(lvls, key=lambda l: l[1], reverse=reverse)]
 
@@ -243,6 +244,14 @@ def get_levels_press(fileId, vptr, shape, ip1list,
         }
 
 
+def _ip1_new_style(ip1s):
+    """
+    Return the ip1s (list or array) re-encoded in the new style
+    """
+    (lval, lkind) = _rmn.convertIp_many(_rmn.CONVIP_DECODE, ip1s)
+    return _rmn.convertIp_many(_rmn.CONVIP_ENCODE, lval, lkind)
+
+
 #TODO: get arbitrary list of levels as well
 def get_levels_keys(fileId, nomvar, datev=-1, ip2=-1, ip3=-1,
                     typvar=' ', etiket=' ',
@@ -274,6 +283,7 @@ def get_levels_keys(fileId, nomvar, datev=-1, ip2=-1, ip3=-1,
         'typvar' : typvar,  # type of field
         'etiket' : etiket,  # label
         'vptr'   : vptr,    # vertical grid descriptor as returned by vgd_read
+                            # (from vgd_read_cached if not provided)
         'ip1keys': vipkeys  # list of ip1 and corresponding FSTD rec key as
                             # ((ip1,key1), (ip1b, key2), ...)
         }
@@ -303,22 +313,24 @@ def get_levels_keys(fileId, nomvar, datev=-1, ip2=-1, ip3=-1,
     See Also:
         get_levels_press
         fst_read_3d
-        rpnpy.librmn.fstd98.fstinf
-        rpnpy.librmn.fstd98.fstprm
+        rpnpy.librmn.fstd98.fstinl
+        rpnpy.librmn.fstd98.fstprm_many
         rpnpy.librmn.fstd98.fstopenall
         rpnpy.librmn.fstd98.fstcloseall
-        rpnpy.vgd.base.vgd_read
+        rpnpy.vgd.base.vgd_read_cached
     """
     #TODO: try to get the sorted ip1 list w/o vgrid, because vgrid doesn;t support 2 different vertical coor in the same file (or list of linked files)
 
     # Get the vgrid definition present in the file
+    vip = None
     if vptr is None:
         if verbose:
             print("Getting vertical grid description")
         _vgd.vgd_put_opt('ALLOW_SIGMA', _vgd.VGD_ALLOW_SIGMA)
-        vptr = _vgd.vgd_read(fileId)
-
-    vip = _vgd.vgd_get(vptr, thermoMom)
+        vgrid = _vgd.vgd_read_cached(fileId)
+        (vptr, vip) = (vgrid['vptr'], vgrid.get(thermoMom, None))
+    if vip is None:
+        vip = _vgd.vgd_get(vptr, thermoMom)
     if verbose:
         vkind = _vgd.vgd_get(vptr, 'KIND')
         vver  = _vgd.vgd_get(vptr, 'VERS')
@@ -327,23 +339,32 @@ def get_levels_keys(fileId, nomvar, datev=-1, ip2=-1, ip3=-1,
 
     # Trim the list of ip1 to actual levels in files for nomvar
     # since the vgrid in the file is a super set of all levels
-    # and get their "key"
+    # and get their "key"; records are found with a single fstinl and
+    # matched on their ip1 re-encoded in the new style, like ip1_all
     vipkeys = []
-    for ip1 in vip:
-        (lval, lkind) = _rmn.convertIp(_rmn.CONVIP_DECODE, ip1)
-        key = _rmn.fstinf(fileId, nomvar=nomvar, datev=datev, ip2=ip2, ip3=ip3,
-                         ip1=_rmn.ip1_all(lval, lkind),
-                         typvar=typvar, etiket=etiket)
-        if key is not None:
-            vipkeys.append((ip1, key['key']))
-            if (datev == -1 or ip2 == -1 or ip3 == -1 or typvar.strip() == ''
-                or etiket.strip() == ''):
-                meta   = _rmn.fstprm(key)
-                datev  = meta['datev']
-                ip2    = meta['ip2']
-                ip3    = meta['ip3']
-                typvar = meta['typvar']
-                etiket = meta['etiket']
+    keys = _rmn.fstinl(fileId, nomvar=nomvar, datev=datev, ip2=ip2, ip3=ip3,
+                       typvar=typvar, etiket=etiket)
+    if keys and len(vip):
+        meta = _rmn.fstprm_many(keys)
+        rip1 = _ip1_new_style(meta['ip1'])
+        select = _np.ones(meta.size, dtype=bool)
+        for (ip1, nip1) in zip(vip, _ip1_new_style(vip).tolist()):
+            i = _np.flatnonzero(select & (rip1 == nip1))
+            if i.size == 0:
+                continue
+            i = int(i[0])
+            vipkeys.append((ip1, int(meta['key'][i])))
+            if (datev == -1 or ip2 == -1 or ip3 == -1 or
+                typvar.strip() == '' or etiket.strip() == ''):
+                datev  = int(meta['datev'][i])
+                ip2    = int(meta['ip2'][i])
+                ip3    = int(meta['ip3'][i])
+                typvar = str(meta['typvar'][i])
+                etiket = str(meta['etiket'][i])
+                select = ((meta['datev'] == datev) & (meta['ip2'] == ip2) &
+                          (meta['ip3'] == ip3) &
+                          (meta['typvar'] == typvar) &
+                          (meta['etiket'] == etiket))
     return {
         'nomvar' : nomvar,
         'datev'  : datev,
@@ -633,7 +654,8 @@ def vgrid_read(fileId, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
 
     if ip1 == -1 and (ip1keys is None or len(ip1keys) == 0):
         keys = _rmn.fstinl(fileId, datev, etiket, ip1, ip2, ip3, typvar, nomvar)
-        ip1keysdict = dict([(_rmn.fstprm(k)['ip1'], k) for k in keys])
+        meta = _rmn.fstprm_many(keys)
+        ip1keysdict = dict(zip(meta['ip1'].tolist(), meta['key'].tolist()))
         ip1keys = [(i, ip1keysdict[i]) for i in
                    sort_ip1(list(ip1keysdict.keys()))]
         vptr = None
@@ -680,7 +702,7 @@ def vgrid_read(fileId, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
                 if not r and not (datev == -1 and ip2 == -1):
                     r = _rmn.fstlir(fileId, nomvar=rfldname)
                 if r:
-                    r['hgrid'] = _rmn.readGrid(fileId, r)
+                    r['hgrid'] = _rmn.readGrid(fileId, r, cache=True)
                     rlfds[rfl] = r
     v = vgrid_new(ip1s, vptr=vptr, rfld=rlfds['RFLD'], rlfs=rlfds['RFLS'])
     v['keys'] = [k for i,k in ip1keys]
@@ -724,6 +746,7 @@ def fst_read_3d(fileId, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
         {
             'd'    : 3d field data (numpy.ndarray), Fortran order
             'hgrid': horizontal grid info as returned by readGrid
+                     with cache=True (do not gdrls its grid id)
             'vgrid': vertical grid info as returned by vgrid_read
                 {
                 'ip1s'  : List of ip1 [list of int]
@@ -795,10 +818,23 @@ def fst_read_3d(fileId, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
 
     ip1keys = list(zip(vGrid['ip1s'], vGrid['keys']))
 
-    # Read all 2d records and copy to 3d array
+    # Read all 2d records directly into the 3d array when all keys are known,
+    # otherwise read each 2d record and copy to 3d array
     r3d = None
     r2d = {'d' : None}
     k = 0
+    if all([key is not None for ip1, key in ip1keys]):
+        if verbose:
+            print("Read {0} records for {1}".format(len(ip1keys), nomvar))
+        rmany = _rmn.fstluk_many(vGrid['keys'], dtype, dataArray)
+        r3d = _rmn.fstprm(ip1keys[0][1])
+        r3d['d'] = rmany['d']
+        if r3d['d'].ndim != 3:
+            raise _rmn.RMNError("Wrong shape for input data.")
+        r3d['hgrid'] = _rmn.readGrid(fileId, r3d.copy(), cache=True)
+        if verbose:
+            print("Read the horizontal grid descriptors for {nomvar}".format(**r3d))
+        ip1keys = []
     for ip1, key in ip1keys:
         if key is None:
             r2d = _rmn.fstlir(fileId, datev, etiket, ip1, ip2, ip3, typvar,
@@ -820,7 +856,7 @@ def fst_read_3d(fileId, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
                     r3d['d'] = dataArray
                 else:
                     raise TypeError('Provided dataArray is not the right type or shape')
-            r3d['hgrid'] = _rmn.readGrid(fileId, r2d)
+            r3d['hgrid'] = _rmn.readGrid(fileId, r2d, cache=True)
             if verbose:
                 print("Read the horizontal grid descriptors for {nomvar}".format(**r2d))
         if r2d['d'].shape[0:2] != r3d['d'].shape[0:2]:
@@ -828,7 +864,7 @@ def fst_read_3d(fileId, datev=-1, etiket=' ', ip1=-1, ip2=-1, ip3=-1,
         r3d['d'][:, :, k] = r2d['d'][:, :]
         k += 1
 
-    ip1list = [x[0] for x in ip1keys]
+    ip1list = vGrid['ip1s']
 
     r3d.update({
         'shape' : r3d['d'].shape,
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright: LGPL 2.1
+
+"""
+Lazy dataset view over RPNSTD files
+
+Variables are exposed as (time, level, j, i) arrays indexed by
+their records datev and ip1; data is only read, with fstluk,
+for the records selected when the variable is sliced.
+
+See Also:
+    rpnpy.utils.fstd3d
+    rpnpy.librmn.fstd98.fstinventory
+    rpnpy.librmn.fstd98.fstluk_many
+"""
+
+import numpy  as _np
+
+import rpnpy.librmn.all as _rmn
+from rpnpy.utils.fstd3d import sort_ip1 as _sort_ip1
+
+## Records that are not data fields (grid and vertical descriptors)
+_FST_DATASET_SKIP = ('>>', '^^', '^>', '!!', 'HY', '!!SF')
+
+class FstDataset(object):
+    """
+    Lazy dataset view over RPNSTD files
+
+    ds = FstDataset(paths)
+    ds = FstDataset(paths, typvar, etiket)
+
+    Args:
+        paths  : path/name of the file(s) or dir(s) to open (str or list)
+        typvar : only consider records with this typvar (str)
+        etiket : only consider records with this etiket (str)
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+        FSTDError  on any other error
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> from rpnpy.utils.fstdataset import FstDataset
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> filename = os.path.join(ATM_MODEL_DFILES,'bcmk')
+    >>>
+    >>> with FstDataset(filename) as ds:
+    ...     tt = ds['TT']
+    ...     # Only the records of the first time and level are read
+    ...     tt0 = tt[0, 0]
+    ...     # Read only the records of the last level, all times
+    ...     ttb = tt.sel(ip1=tt.ip1[-1])
+    >>> print("# TT {0} {1}".format(tt0.shape, tt.dims))
+    # TT (100, 200) ('time', 'level', 'j', 'i')
+
+    See Also:
+        FstVariable
+        rpnpy.utils.fstd3d.fst_read_3d
+        rpnpy.librmn.fstd98.fstinventory
+    """
+
+    def __init__(self, paths, typvar=' ', etiket=' '):
+        self.paths = paths
+        self.funit = _rmn.fstopenall(paths, _rmn.FST_RO)
+        inv = _rmn.fstinventory(self.funit)
+        select = _np.ones(inv['key'].size, dtype=bool)
+        for (name, value) in (('typvar', typvar), ('etiket', etiket)):
+            if value.strip():
+                select &= (_np.char.strip(inv[name]) == value.strip())
+        self._inventory = dict([(k, v[select]) for (k, v) in inv.items()])
+        self._inventory['nomvar'] = _np.char.strip(self._inventory['nomvar'])
+        self._variables = {}
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def __contains__(self, nomvar):
+        return nomvar in self.keys()
+
+
+    def __getitem__(self, nomvar):
+        """
+        Return the variable, no data is read
+
+        Args:
+            nomvar : name of the variable (str)
+        Returns:
+            FstVariable
+        Raises:
+            KeyError   if no such variable
+            FSTDError  if the file was closed
+        """
+        if self.funit is None:
+            raise _rmn.FSTDError("FstDataset: file was closed")
+        try:
+            return self._variables[nomvar]
+        except KeyError:
+            pass
+        if nomvar not in self:
+            raise KeyError("FstDataset: no such variable {0}".format(nomvar))
+        select = (self._inventory['nomvar'] == nomvar)
+        inv = dict([(k, v[select]) for (k, v) in self._inventory.items()])
+        self._variables[nomvar] = FstVariable(self, nomvar, inv)
+        return self._variables[nomvar]
+
+
+    def __str__(self):
+        return "<FstDataset {0}: {1}>".format(self.paths, self.keys())
+
+
+    def keys(self):
+        """
+        Return the sorted list of variable names
+
+        Returns:
+            list of str
+        """
+        return [k for k in sorted(set(self._inventory['nomvar'].tolist()))
+                if k not in _FST_DATASET_SKIP]
+
+
+    def close(self):
+        """
+        Close the files, data can no longer be read after this
+        """
+        if self.funit is not None:
+            _rmn.fstcloseall(self.funit)
+            self.funit = None
+
+
+class FstVariable(object):
+    """
+    Lazy (time, level, j, i) array view of a variable records
+
+    Obtained from an FstDataset, data is read only when sliced.
+
+    var = ds[nomvar]
+    data = var[it, ik, j, i]
+    data = var.sel(datev=datev, ip1=ip1)
+
+    Attributes:
+        nomvar : name of the variable
+        dims   : names of the dimensions ('time', 'level', 'j', 'i')
+        shape  : (ntimes, nlevels, nj, ni)
+        dtype  : numpy dtype of the returned data
+        datev  : valid date stamps of the time dimension, ascending
+        ip1    : encoded ip1 of the level dimension, in vertical order
+        levels : decoded ip1 values of the level dimension
+        kind   : decoded ip1 kind of the level dimension
+        keys   : records keys of shape (ntimes, nlevels), -1 where missing
+        meta   : fstprm of the first record
+    Raises:
+        FSTDError  if the records do not have all the same shape,
+                   are 3D records (nk > 1)
+                   or several records share the same datev and ip1
+                   (use FstDataset typvar/etiket to select only one)
+
+    See Also:
+        FstDataset
+    """
+
+    dims = ('time', 'level', 'j', 'i')
+
+    def __init__(self, dataset, nomvar, inv):
+        self._dataset = dataset
+        self.nomvar = nomvar
+        (ni, nj, nk) = (inv['ni'], inv['nj'], inv['nk'])
+        if _np.any(ni != ni[0]) or _np.any(nj != nj[0]) or _np.any(nk != 1):
+            raise _rmn.FSTDError("FstVariable: all {0} records must be 2D and of the same shape".format(nomvar))
+        self.datev = _np.unique(inv['datev'])
+        (uip1, ifirst) = _np.unique(inv['ip1'], return_index=True)
+        self.ip1 = _np.array(_sort_ip1(uip1.tolist()), dtype=_np.int32)
+        iuip1 = _np.searchsorted(uip1, self.ip1)
+        self.levels = inv['ip1v'][ifirst][iuip1]
+        self.kind = inv['ip1k'][ifirst][iuip1]
+        ilevel = _np.empty(uip1.size, dtype=_np.intp)
+        ilevel[iuip1] = _np.arange(uip1.size)
+        it = _np.searchsorted(self.datev, inv['datev'])
+        ik = ilevel[_np.searchsorted(uip1, inv['ip1'])]
+        (_, idx, cnt) = _np.unique(it * self.ip1.size + ik,
+                                   return_index=True, return_counts=True)
+        if _np.any(cnt > 1):
+            i = int(idx[cnt > 1][0])
+            raise _rmn.FSTDError("FstVariable: {0} has {1} records with datev={2}, ip1={3} (differing etiket/typvar/ip2/ip3/grid), select one with FstDataset typvar/etiket".format(nomvar, int(cnt[cnt > 1][0]), int(inv['datev'][i]), int(inv['ip1'][i])))
+        self.keys = _np.full((self.datev.size, self.ip1.size), -1,
+                             dtype=_np.int32)
+        self.keys[it, ik] = inv['key']
+        self.shape = (self.datev.size, self.ip1.size, int(nj[0]), int(ni[0]))
+        self.meta = _rmn.fstprm(int(inv['key'][0]))
+        self.dtype = _np.dtype(_rmn.dtype_fst2numpy(self.meta['datyp'],
+                                                    self.meta['nbits']))
+
+
+    def __len__(self):
+        return self.shape[0]
+
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+
+    @property
+    def values(self):
+        """
+        Read and return all the variable data
+        """
+        return self[...]
+
+
+    def __str__(self):
+        return "<FstVariable {0} {1}: {2}>".format(self.nomvar, self.dims,
+                                                    self.shape)
+
+
+    def __getitem__(self, index):
+        """
+        Read the records needed for the selection and return the data
+
+        Args:
+            index : int, slice, list or boolean arrays for each dimension,
+                    numpy style
+        Returns:
+            numpy.ndarray
+        Raises:
+            IndexError on invalid index
+            FSTDError  on missing records for non float data or read error
+        """
+        if not isinstance(index, tuple):
+            index = (index, )
+        if any(i is Ellipsis for i in index):
+            iell = [i is Ellipsis for i in index].index(True)
+            nfill = self.ndim - len(index) + 1
+            index = index[:iell] + (slice(None), ) * nfill + index[iell+1:]
+        if len(index) > self.ndim:
+            raise IndexError("FstVariable: too many indices")
+        index = tuple(index) + (slice(None), ) * (self.ndim - len(index))
+        it = _np.arange(self.shape[0])[index[0]]
+        ik = _np.arange(self.shape[1])[index[1]]
+        data = self._read(_np.atleast_1d(it), _np.atleast_1d(ik))
+        index2 = (0 if _np.ndim(it) == 0 else slice(None),
+                  0 if _np.ndim(ik) == 0 else slice(None)) + index[2:]
+        return data[index2]
+
+
+    def sel(self, datev=None, ip1=None, j=slice(None), i=slice(None)):
+        """
+        Read the records for the given datev, ip1 and return the data
+
+        Args:
+            datev : date stamp or list of date stamps, all times if None
+            ip1   : encoded ip1 or list of ip1, all levels if None
+            j, i  : numpy style index of the horizontal dimensions
+        Returns:
+            numpy.ndarray
+        Raises:
+            KeyError   if a datev or ip1 is not found
+        """
+        return self[self._sel_index(self.datev, datev, 'datev'),
+                    self._sel_index(self.ip1, ip1, 'ip1'), j, i]
+
+
+    def _sel_index(self, coord, values, name):
+        if values is None:
+            return slice(None)
+        index = [_np.nonzero(coord == v)[0] for v in _np.atleast_1d(values)]
+        if not all(len(i) for i in index):
+            raise KeyError("FstVariable: {0} not found: {1}".format(name, values))
+        index = [int(i[0]) for i in index]
+        return index[0] if _np.ndim(values) == 0 else index
+
+
+    def _read(self, it, ik):
+        """
+        Read records of it times and ik levels into a (nt, nk, nj, ni) array
+        """
+        funit = self._dataset.funit
+        if funit is None:
+            raise _rmn.FSTDError("FstVariable: file was closed")
+        keys = self.keys[it[:, None], ik[None, :]]
+        data = _np.empty((it.size, ik.size) + self.shape[2:], dtype=self.dtype)
+        if keys.size == 0:
+            return data
+        if _np.all(keys >= 0):
+            # data.T is F ordered (ni, nj, nk, nt), with k varying fastest
+            _rmn.fstluk_many(keys.ravel().tolist(), self.dtype, data.T)
+            return data
+        if not _np.issubdtype(self.dtype, _np.inexact):
+            raise _rmn.FSTDError("FstVariable: missing {0} records".format(self.nomvar))
+        for (t, k) in zip(*_np.nonzero(keys >= 0)):
+            _rmn.fstluk(int(keys[t, k]), dtype=self.dtype,
+                        dataArray=data[t, k].T)
+        data[keys < 0] = _np.nan
+        return data
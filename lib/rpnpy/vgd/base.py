@@ -15,6 +15,8 @@ See Also:
     rpnpy.vgd.proto
     rpnpy.vgd.const
 """
+import threading as _threading
+from collections import OrderedDict as _OrderedDict
 import ctypes as _ct
 import numpy  as _np
 # import numpy.ctypeslib as _npc
@@ -30,6 +32,10 @@ from rpnpy import C_MKSTR as _C_MKSTR
 
 _MB2PA = 100.
 
+_vgdCache = _OrderedDict()
+_vgdCacheLock = _threading.Lock()
+_vgdCacheSize = _vc.VGD_CACHE_SIZE
+
 ## VGD_TYPE_CODE(kind, version): Compute VGD type code from kind and version.
 VGD_TYPE_CODE = lambda k, v: int(k) * 1000 + int(v)
 
@@ -915,6 +921,195 @@ def vgd_read(fileId, ip1=-1, ip2=-1, kind=-1, version=-1):
     return vgd_ptr
 
 
+def vgd_read_cached(fileId, ip1=-1, ip2=-1, kind=-1, version=-1):
+    """
+    Get a vgrid descriptor and its ip1 lists from a RPN standard file,
+    reusing the descriptor already parsed from the same !! record(s)
+
+    Descriptors are cached on the file, position and metadata of the
+    matching !! records (their data is only read on a cache miss),
+    the ip1, ip2, kind, version selection and the ALLOW_SIGMA option;
+    the least recently used ones are freed with vgd_free when more than
+    vgd_read_cache_size() descriptors are cached.
+    The returned descriptor is always the caller's own (a vgd_copy of the
+    cached one) and should be freed with vgd_free when no longer needed.
+
+    vgrid = vgd_read_cached(fileId)
+
+    Args:
+        fileId   (int)  : Opened RPN Std file unit number
+        ip1      (int)  : Ip1 of the vgrid record to find, use -1 for any (I)
+        ip2      (int)  : Ip2 of the vgrid record to find, use -1 for any (I)
+        kind     (int)  : Kind of vertical coor
+        version  (int)  : Version of vertical coor
+    Returns:
+        {
+            'vptr' : vptr,  # VGridDescriptor ref, as returned by vgd_read
+                            # owned by the caller
+            'VIPM' : vipm,  # momentum levels ip1 (tuple of int)
+            'VIPT' : vipt,  # thermodynamic levels ip1 (tuple of int)
+            'VIPW' : vipw   # vertical velocity levels ip1 (tuple of int)
+                            # None if not defined for this vgrid
+        }
+    Raises:
+        TypeError
+        VGDError
+
+    Notes:
+        Descriptors constructed without a !! record (e.g. from HY or
+        sigma levels) or from files not opened with fstopenall
+        are not cached.
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> import rpnpy.vgd.all as vgd
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> fileName = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+    >>> fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+    >>> vgrid0 = vgd.vgd_read_cached(fileId)
+    >>> vgrid1 = vgd.vgd_read_cached(fileId)
+    >>> rmn.fstcloseall(fileId)
+    >>> print(vgd.vgd_cmp(vgrid0['vptr'], vgrid1['vptr']))
+    True
+    >>> vgd.vgd_free(vgrid0['vptr'])
+    >>> vgd.vgd_free(vgrid1['vptr'])
+
+    See Also:
+        vgd_read
+        vgd_read_cache_size
+        vgd_read_cache_clear
+        rpnpy.vgd.const.VGD_CACHE_SIZE
+    """
+    cachekey = _vgd_cache_key(fileId, ip1, ip2, kind, version) \
+        if _vgdCacheSize > 0 else None
+    if cachekey is not None:
+        with _vgdCacheLock:
+            vgrid = _vgdCache.get(cachekey, None)
+            if vgrid is not None:
+                _vgdCache.move_to_end(cachekey)
+                return _vgd_cache_copy(vgrid)
+    vptr = vgd_read(fileId, ip1, ip2, kind, version)
+    vgrid = {'vptr' : vptr}
+    for key in ('VIPM', 'VIPT', 'VIPW'):
+        vip = vgd_get(vptr, key, defaultOnFail=True)
+        vgrid[key] = None if vip is None else tuple(vip)
+    if cachekey is None:
+        return vgrid
+    with _vgdCacheLock:
+        vgrid2 = _vgdCache.get(cachekey, None)
+        if vgrid2 is None:
+            _vgdCache[cachekey] = vgrid
+            vgrid2 = _vgd_cache_copy(vgrid)
+            _vgd_cache_trim(_vgdCacheSize)
+            return vgrid2
+        vgrid2 = _vgd_cache_copy(vgrid2)
+    vgd_free(vptr)
+    return vgrid2
+
+
+def vgd_read_cache_size(size=None):
+    """
+    Get or set the max number of descriptors kept in the vgd_read_cached cache
+
+    size = vgd_read_cache_size()
+    vgd_read_cache_size(size)
+
+    Args:
+        size (int): new max number of descriptors, 0 to disable the cache,
+                    when None the size is not changed
+    Returns:
+        int, the max number of descriptors kept in the cache
+    Raises:
+        TypeError  on wrong input arg types
+        ValueError on invalid input arg value
+
+    Examples:
+    >>> import rpnpy.vgd.all as vgd
+    >>> size = vgd.vgd_read_cache_size()
+    >>> size = vgd.vgd_read_cache_size(64)
+
+    See Also:
+        vgd_read_cached
+        vgd_read_cache_clear
+        rpnpy.vgd.const.VGD_CACHE_SIZE
+    """
+    global _vgdCacheSize
+    if size is not None:
+        if not isinstance(size, _integer_types):
+            raise TypeError("vgd_read_cache_size: Expecting arg of type int, Got {0}"\
+                            .format(type(size)))
+        if size < 0:
+            raise ValueError("vgd_read_cache_size: size must be >= 0, Got {0}"\
+                             .format(size))
+        with _vgdCacheLock:
+            _vgdCacheSize = size
+            _vgd_cache_trim(_vgdCacheSize)
+    return _vgdCacheSize
+
+
+def vgd_read_cache_clear():
+    """
+    Remove all descriptors from the vgd_read_cached cache, freeing them
+
+    vgd_read_cache_clear()
+
+    Examples:
+    >>> import rpnpy.vgd.all as vgd
+    >>> vgd.vgd_read_cache_clear()
+
+    See Also:
+        vgd_read_cached
+        vgd_read_cache_size
+    """
+    with _vgdCacheLock:
+        _vgd_cache_trim(0)
+
+
+def _vgd_cache_copy(vgrid):
+    """
+    Return a copy of a cached entry with the caller's own vptr, lock must be held
+    """
+    vgrid = vgrid.copy()
+    vgrid['vptr'] = vgd_copy(vgrid['vptr'])
+    return vgrid
+
+
+def _vgd_cache_trim(size):
+    """
+    Free least recently used descriptors above size, lock must be held
+    """
+    while len(_vgdCache) > size:
+        (cachekey, vgrid) = _vgdCache.popitem(last=False)
+        vgd_free(vgrid['vptr'])
+
+
+def _vgd_cache_key(fileId, ip1, ip2, kind, version):
+    """
+    Return the vgd_read_cached key, None if not cachable
+
+    The !! records are identified by the file(s) identity (fstunitid),
+    their position and metadata (fstinl+fstprm), their data is not read
+    """
+    try:
+        unitid = _rmn.fstunitid(fileId)
+        if unitid is None:
+            return None
+        keys = _rmn.fstinl(fileId, nomvar='!!', ip1=ip1, ip2=ip2)
+        if not keys:
+            return None
+        cachekey = [unitid, int(ip1), int(ip2), int(kind), int(version),
+                    vgd_get_opt('ALLOW_SIGMA')]
+        for key in keys:
+            rec = _rmn.fstprm(key)
+            cachekey += [rec[k] for k in ('swa', 'lng', 'ip1', 'ip2', 'ip3',
+                                          'ig1', 'ig2', 'ig3', 'ig4', 'datyp',
+                                          'dateo', 'etiket')]
+    except (_rmn.FSTDError, TypeError, ValueError):
+        return None
+    return tuple(cachekey)
+
+
 def vgd_write(vgd_ptr, fileId):
     """
     Write a vgrid descriptor in a previously opened RPN standard file.
@@ -1501,6 +1696,23 @@ def vgd_levels(vgd_ptr, rfld=None, ip1list='VIPM', in_log=_vc.VGD_DIAG_PRES,
                        in_log, dpidpis, double_precision)
 
 
+def _vgd_ip1list_array(vgd_ptr, ip1list):
+    """
+    Return the ip1list as an int32 array, getting it from vgd_ptr if a str
+    """
+    if isinstance(ip1list, str):
+        ip1list0 = vgd_get(vgd_ptr, ip1list)
+        return _np.array(ip1list0, dtype=_np.int32, order='F')
+    elif isinstance(ip1list, _integer_types):
+        return _np.array([ip1list], dtype=_np.int32, order='F')
+    elif isinstance(ip1list, (list, tuple)):
+        return _np.array(ip1list, dtype=_np.int32, order='F')
+    elif isinstance(ip1list, _np.ndarray):
+        return _np.array(ip1list.flatten(), dtype=_np.int32, order='F')
+    raise TypeError('ip1list should be string, list or int: {0}'.
+                    format(str(type(ip1list))))
+
+
 def vgd_levels2(vgd_ptr, rfld=None, rfls=None, ip1list='VIPM',
                 in_log=_vc.VGD_DIAG_PRES, dpidpis=_vc.VGD_DIAG_DPIS,
                 double_precision=False):
@@ -1568,18 +1780,7 @@ def vgd_levels2(vgd_ptr, rfld=None, rfls=None, ip1list='VIPM',
         vgd_free
         vgd_get
     """
-    if isinstance(ip1list, str):
-        ip1list0 = vgd_get(vgd_ptr, ip1list)
-        ip1list1 = _np.array(ip1list0, dtype=_np.int32, order='F')
-    elif isinstance(ip1list, _integer_types):
-        ip1list1 = _np.array([ip1list], dtype=_np.int32, order='F')
-    elif isinstance(ip1list, (list, tuple)):
-        ip1list1 = _np.array(ip1list, dtype=_np.int32, order='F')
-    elif isinstance(ip1list, _np.ndarray):
-        ip1list1 = _np.array(ip1list.flatten(), dtype=_np.int32, order='F')
-    else:
-        raise TypeError('ip1list should be string, list or int: {0}'.
-                        format(str(type(ip1list))))
+    ip1list1 = _vgd_ip1list_array(vgd_ptr, ip1list)
     nip1 = ip1list1.size
     ip1list = ip1list1.ctypes.data_as(_ct.POINTER(_ct.c_int))
 
@@ -1678,6 +1879,345 @@ def vgd_levels2(vgd_ptr, rfld=None, rfls=None, ip1list='VIPM',
     return levels8
 
 
+def vgd_levels_many(vgd_ptr, rfld, rfls=None, ip1list='VIPM',
+                    in_log=_vc.VGD_DIAG_PRES, dpidpis=_vc.VGD_DIAG_DPIS,
+                    double_precision=False, levels=None):
+    """
+    Compute level positions for a stack of reference surface fields
+
+    Same as vgd_levels2 for each rfld[t], but the ip1list and descriptor
+    info are resolved once and levels for all times are computed into
+    a single (possibly preallocated) array.
+
+    levels = vgd_levels_many(vgd_ptr, rfld)
+    levels = vgd_levels_many(vgd_ptr, rfld, rfls, ip1list, levels=levels)
+
+    Args:
+        vgd_ptr (VGridDescriptor ref):
+                           Reference/Pointer to the VGridDescriptor
+        rfld (ndarray)   : Stack of reference surface fields, SI units,
+                           of shape (nt, nj, ni) (or any (nt, ...) shape)
+                           not copied if already C_CONTIGUOUS and of the
+                           computation precision (float32 or float64)
+        rfls (ndarray)   : Stack of reference surface fields (large scale),
+                           same shape as rfld, only used if the vgd has a RFLS
+        ip1list (mixed)  : ip1 list of destination levels
+                           (str) : get the ip1 list form the vgd object
+                                   possible value: 'VIPM' or 'VIPT'
+                           (int) or (list): ip1 values
+        in_log   (int)   : VGD_DIAG_LOGP or VGD_DIAG_PRES
+        dpidpis  (int)   : VGD_DIAG_DPI or VGD_DIAG_DPIS
+        double_precision (bool) : True for double precision computations
+        levels (ndarray) : (optional) allocated array where to put the levels
+                           C_CONTIGUOUS, of shape (nt, nip1, nj, ni)
+                           and of the computation precision
+    Returns:
+        ndarray : levels of shape (nt, len(ip1list)) + rfld.shape[1:]
+                  i.e. (time, level, j, i), C order
+    Raises:
+        TypeError
+        VGDError
+
+    Notes:
+        A C ordered (nt, nj, ni) array is, for each time, a Fortran
+        ordered (ni, nj) field; levels[t] is thus the Fortran ordered
+        (ni, nj, nip1) array of vgd_levels2, computed in place.
+        Times are computed sequentially, libvgd is not known
+        to be thread safe.
+
+    Examples:
+    >>> import os, os.path
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> import rpnpy.vgd.all as vgd
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> fileName = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+    >>> fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+    >>> myvgd = vgd.vgd_read(fileId)
+    >>> keys  = rmn.fstinl(fileId, nomvar='P0')
+    >>> p0    = rmn.fstluk_many(keys)['d'].T * 100.  # (nt, nj, ni) in Pa
+    >>> rmn.fstcloseall(fileId)
+    >>> levels = vgd.vgd_levels_many(myvgd, p0)
+    >>> print("# {0}".format(levels.shape[0]))
+    # 1
+
+    See Also:
+        vgd_levels2
+        rpnpy.vgd.const.VGD_DIAG_LOGP
+        rpnpy.vgd.const.VGD_DIAG_PRES
+        rpnpy.vgd.const.VGD_DIAG_DPI
+        rpnpy.vgd.const.VGD_DIAG_DPIS
+        vgd_read
+        rpnpy.librmn.fstd98.fstluk_many
+    """
+    ip1list1 = _vgd_ip1list_array(vgd_ptr, ip1list)
+    nip1 = ip1list1.size
+    ip1list = ip1list1.ctypes.data_as(_ct.POINTER(_ct.c_int))
+    rfls_nomvar = vgd_get(vgd_ptr, 'RFLS', defaultOnFail=True)
+
+    dtype = _np.dtype(_np.float64 if double_precision else _np.float32)
+    if not isinstance(rfld, _np.ndarray):
+        raise TypeError('rfld should be ndarray: {0}'.
+                        format(str(type(rfld))))
+    if rfld.ndim < 1:
+        raise TypeError('rfld should be of shape (nt, ...), got: {0}'.
+                        format(rfld.shape))
+    rfld8 = _np.ascontiguousarray(rfld, dtype=dtype)
+    if rfls_nomvar:
+        if not isinstance(rfls, _np.ndarray):
+            raise TypeError('RFLS needs to be provided as ndarray: {0}'.
+                            format(str(type(rfls))))
+        if rfls.shape != rfld.shape:
+            raise TypeError('rfls should be of same shape as rfld: {0}, {1}'.
+                            format(rfls.shape, rfld.shape))
+        rfls8 = _np.ascontiguousarray(rfls, dtype=dtype)
+
+    nt = rfld8.shape[0]
+    npts = rfld8.size // nt if nt else 0
+    shape = (nt, nip1) + rfld8.shape[1:]
+    if levels is None:
+        levels = _np.empty(shape, dtype=dtype, order='C')
+    elif isinstance(levels, _np.ndarray):
+        if not levels.flags['C_CONTIGUOUS']:
+            raise TypeError('Provided levels should be C_CONTIGUOUS')
+        if levels.dtype != dtype:
+            raise TypeError('Expecting levels of type {0}, got: {1}'.
+                            format(repr(dtype), repr(levels.dtype)))
+        if levels.shape != shape:
+            raise TypeError('Provided levels has wrong shape, expecting: ' +
+                            '{0}, got: {1}'.format(shape, levels.shape))
+    else:
+        raise TypeError('Expecting levels of type ndarray, got: {0}'.
+                        format(repr(type(levels))))
+
+    if double_precision:
+        (diag, diag2) = (_vp.c_vgd_diag_withref_8,
+                         _vp.c_vgd_diag_withref_2ref_8)
+    else:
+        (diag, diag2) = (_vp.c_vgd_diag_withref, _vp.c_vgd_diag_withref_2ref)
+
+    for t in range(nt):
+        if rfls_nomvar is None:
+            ok = diag(vgd_ptr, npts, 1, nip1, ip1list, levels[t],
+                      rfld8[t], in_log, dpidpis)
+        else:
+            ok = diag2(vgd_ptr, npts, 1, nip1, ip1list, levels[t],
+                       rfld8[t], rfls8[t], in_log, dpidpis)
+        if ok != _vc.VGD_OK:
+            raise VGDError('Problem computing levels.')
+    return levels
+
+
+def vgd_coefs(vgd_ptr, ip1list='VIPM'):
+    """
+    Get the levels coefficients tables of a vgd for the given ip1 list
+
+    The returned dict only holds numpy arrays and scalars;
+    it can be pickled, sent to worker processes and used with
+    vgd_levels_coefs after the vgd is freed.
+
+    coefs = vgd_coefs(vgd_ptr)
+    coefs = vgd_coefs(vgd_ptr, 'VIPT')
+
+    Args:
+        vgd_ptr (VGridDescriptor ref):
+                           Reference/Pointer to the VGridDescriptor
+        ip1list (mixed)  : ip1 list of destination levels
+                           (str) : get the ip1 list form the vgd object
+                                   possible value: 'VIPM', 'VIPT' or 'VIPW'
+                           (int) or (list): ip1 values
+    Returns:
+        {
+            'vcode' : vcode,  # VGD type code, kind*1000+version (int)
+            'ip1'   : ip1,    # ip1 of the levels (ndarray of int32)
+            'a'     : a,      # A coefficients (ndarray of float64)
+            'b'     : b,      # B coefficients (ndarray of float64)
+            'c'     : c,      # C coefficients (ndarray of float64)
+                              # zeros if not a SLEVE coordinate
+            'pref'  : pref,   # reference pressure [Pa] (float), None if n/a
+            'logp'  : logp,   # True if A, B, C give log(p)
+            'press' : press,  # True if a pressure coordinate, heights otherwise
+            'rfld'  : rfld,   # name of the reference field (str), None if n/a
+            'rfls'  : rfls    # name of the large scale reference field (str)
+                              # None if n/a
+        }
+    Raises:
+        TypeError on wrong input arg types
+        VGDError  on unsupported vgd type or ip1 not in the vgd
+
+    Examples:
+    >>> import os, os.path
+    >>> import rpnpy.librmn.all as rmn
+    >>> import rpnpy.vgd.all as vgd
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> fileName = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+    >>> fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+    >>> myvgd = vgd.vgd_read(fileId)
+    >>> rmn.fstcloseall(fileId)
+    >>> coefs = vgd.vgd_coefs(myvgd, 'VIPT')
+    >>> vgd.vgd_free(myvgd)
+    >>> levels = vgd.vgd_levels_coefs(coefs, 100130.)
+
+    See Also:
+        vgd_levels_coefs
+        vgd_levels2
+        vgd_get
+        rpnpy.vgd.const.VGD_COEF_VCODES
+    """
+    vkind = vgd_get(vgd_ptr, 'KIND')
+    vcode = VGD_TYPE_CODE(vkind, vgd_get(vgd_ptr, 'VERS'))
+    if vcode not in _vc.VGD_COEF_VCODES:
+        raise VGDError('vgd_coefs: unsupported vgd type code: {0}'.
+                       format(vcode))
+    ip1s = _vgd_ip1list_array(vgd_ptr, ip1list)
+    # Momentum levels coef take precedence, as in libvgd
+    table = {}
+    for stag in ('W', 'T', 'M'):
+        vip1 = vgd_get(vgd_ptr, 'VIP' + stag, defaultOnFail=True)
+        ca = vgd_get(vgd_ptr, 'CA_' + stag, defaultOnFail=True)
+        if not (vip1 and ca):
+            continue
+        cb = vgd_get(vgd_ptr, 'CB_' + stag)
+        cc = vgd_get(vgd_ptr, 'CC_' + stag, defaultOnFail=True)
+        if not cc:
+            cc = [0.] * len(ca)
+        table.update(zip(vip1, zip(ca, cb, cc)))
+    try:
+        abc = _np.array([table[ip1] for ip1 in ip1s.tolist()],
+                        dtype=_np.float64).reshape(-1, 3)
+    except KeyError as e:
+        raise VGDError('vgd_coefs: ip1 not found in vgd: {0}'.format(e))
+    return {
+        'vcode' : vcode,
+        'ip1'   : ip1s,
+        'a'     : abc[:, 0].copy(),
+        'b'     : abc[:, 1].copy(),
+        'c'     : abc[:, 2].copy(),
+        'pref'  : vgd_get(vgd_ptr, 'PREF', defaultOnFail=True),
+        'logp'  : bool(vgd_get(vgd_ptr, 'LOGP', defaultOnFail=True,
+                               defaultValue=0)),
+        'press' : vgd_is_press_kind(vkind),
+        'rfld'  : vgd_get(vgd_ptr, 'RFLD', defaultOnFail=True) or None,
+        'rfls'  : vgd_get(vgd_ptr, 'RFLS', defaultOnFail=True) or None
+        }
+
+
+def vgd_levels_coefs(coefs, rfld=None, rfls=None, in_log=_vc.VGD_DIAG_PRES,
+                     double_precision=False, levels=None):
+    """
+    Compute level positions from coefficients tables, with NumPy only
+
+    Same results as vgd_levels2, without calling libvgd,
+    for coefficients obtained with vgd_coefs.
+
+    levels = vgd_levels_coefs(coefs, rfld)
+    levels = vgd_levels_coefs(coefs, rfld, rfls, levels=levels)
+
+    Args:
+        coefs (dict)     : levels coefficients, as returned by vgd_coefs
+        rfld  (mixed)    : Reference surface field, SI units
+                           (float), (list) or (ndarray) of values
+        rfls  (mixed)    : Reference surface field (large scale)
+                           (float), (list) or (ndarray) of values
+                           only used for SLEVE coordinates
+        in_log   (int)   : VGD_DIAG_LOGP or VGD_DIAG_PRES
+        double_precision (bool) : True for a float64 result
+        levels (ndarray) : (optional) allocated array where to put the levels
+                           of shape rfld.shape + (nip1, )
+    Returns:
+        ndarray : levels of shape rfld.shape + (len(coefs['ip1']), ),
+                  F order
+    Raises:
+        TypeError on wrong input arg types
+        VGDError  on invalid in_log for a height coordinate
+
+    Notes:
+        Levels are computed as
+            v = a + b * s + c * sls
+        where s (and sls) is the reference field for heights and
+        pressure coordinates with logp False or log(rfld/pref) otherwise;
+        the result is exp(v) for pressure when logp is True.
+        Computation is done one level at a time in float64 with a single
+        temporary array of the size of rfld.
+        The derivative (dpidpis) is not provided, use vgd_levels2.
+
+    Examples:
+    >>> import os, os.path
+    >>> import numpy as np
+    >>> import rpnpy.librmn.all as rmn
+    >>> import rpnpy.vgd.all as vgd
+    >>> ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+    >>> fileName = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+    >>> fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+    >>> myvgd = vgd.vgd_read(fileId)
+    >>> p0    = rmn.fstlir(fileId, nomvar='P0')['d'] * 100.
+    >>> rmn.fstcloseall(fileId)
+    >>> coefs = vgd.vgd_coefs(myvgd)
+    >>> levels = vgd.vgd_levels_coefs(coefs, p0)
+    >>> print(np.allclose(levels, vgd.vgd_levels2(myvgd, p0), rtol=1e-5))
+    True
+
+    See Also:
+        vgd_coefs
+        vgd_levels2
+        rpnpy.vgd.const.VGD_DIAG_LOGP
+        rpnpy.vgd.const.VGD_DIAG_PRES
+    """
+    (a, b, c) = (coefs['a'], coefs['b'], coefs['c'])
+    (press, logp) = (coefs['press'], coefs['logp'])
+    if in_log == _vc.VGD_DIAG_LOGP and not press:
+        raise VGDError('vgd_levels_coefs: in_log only valid for pressure')
+    if rfld is None:
+        if coefs['rfld']:
+            raise TypeError('RFLD needs to be provided for vcode={0}'.
+                            format(coefs['vcode']))
+        rfld = 0.
+    rfld = _np.asarray(rfld)
+    if coefs['rfls']:
+        if rfls is None:
+            raise TypeError('RFLS needs to be provided for vcode={0}'.
+                            format(coefs['vcode']))
+        rfls = _np.asarray(rfls)
+        if rfls.shape != rfld.shape:
+            raise TypeError('rfls should be of same shape as rfld: {0}, {1}'.
+                            format(rfls.shape, rfld.shape))
+    else:
+        rfls = None
+
+    dtype = _np.dtype(_np.float64 if double_precision else _np.float32)
+    shape = rfld.shape + (a.size, )
+    if levels is None:
+        levels = _np.empty(shape, dtype=dtype, order='F')
+    elif not isinstance(levels, _np.ndarray):
+        raise TypeError('Expecting levels of type ndarray, got: {0}'.
+                        format(repr(type(levels))))
+    elif levels.shape != shape:
+        raise TypeError('Provided levels has wrong shape, expecting: ' +
+                        '{0}, got: {1}'.format(shape, levels.shape))
+
+    rfld = rfld.astype(_np.float64)
+    if rfls is not None:
+        rfls = rfls.astype(_np.float64)
+    if logp:
+        rfld = _np.log(rfld / coefs['pref'])
+        if rfls is not None:
+            rfls = _np.log(rfls / coefs['pref'])
+    if rfls is None:
+        rfls = rfld
+    tmp = _np.empty(rfld.shape, dtype=_np.float64)
+    for k in range(a.size):
+        _np.multiply(rfld, b[k], out=tmp)
+        tmp += a[k]
+        if c[k] != 0.:
+            tmp += c[k] * rfls
+        if press and logp and in_log != _vc.VGD_DIAG_LOGP:
+            _np.exp(tmp, out=tmp)
+        elif press and not logp and in_log == _vc.VGD_DIAG_LOGP:
+            _np.log(tmp, out=tmp)
+        levels[..., k] = tmp
+    return levels
+
+
 def vgd_stda76_temp(vgd_ptr, ip1list='VIPM'):
     """
     Get the standard atmosphere 1976 temperature
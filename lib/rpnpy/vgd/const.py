@@ -115,6 +115,14 @@ VGD_NOT_PRESS_KIND = [
     VGD_HYBH_KIND, VGD_HYBHS_KIND, VGD_HYBHL_KIND, VGD_HYBHLS_KIND
     ]
 
+## Type codes (kind*1000+version) supported by vgd_coefs/vgd_levels_coefs,
+## where levels are a + b*s [+ c*sls] with s the (log of) reference field
+VGD_COEF_VCODES = (1001, 1002, 2001, 5001, 5002, 5003, 5004, 5005, 5100,
+                   21001, 21002)
+
+## Default max number of descriptors kept in the vgd_read_cached cache
+VGD_CACHE_SIZE = 16
+
 VGD_OPR_KEYS = {
     'get_char'      : ["ETIK", "NAME", "RFLD", "RFLS"],
     'put_char'      : ["ETIK"],
@@ -349,6 +349,36 @@ class RpnPyBurpc(unittest.TestCase):
                 i += 1
             self.assertEqual(len(bfile), i)
 
+    def test_brp_BurpcFile_iterlite(self):
+        """brp_BurpcFile_iterlite should give same values as iter"""
+        brp.brp_opt(rmn.BURPOP_MSGLVL, rmn.BURPOP_MSG_SYSTEM)
+        mypath, itype, iunit = self.knownValues[0]
+        mypath = self.getFN(mypath)
+        with brp.BurpcFile(mypath) as bfile:
+            i = 0
+            for rpt in bfile.iterlite():
+                if i == 0:
+                    rpt0 = bfile[0]
+                    self.assertEqual(rpt.stnid, rpt0.stnid)
+                    self.assertEqual(rpt.handle, rpt0.handle)
+                    self.assertEqual(rpt.nblk, rpt0.nblk)
+                    self.assertEqual(rpt.lat, rpt0.lat)
+                    blk0 = rpt0[0]
+                    blk = rpt[0]
+                    self.assertEqual(blk.btyp, blk0.btyp)
+                    arrays = blk.as_arrays()
+                    self.assertEqual(arrays['tblval'].shape,
+                                     (blk0.nele, blk0.nval, blk0.nt))
+                    self.assertTrue(np.all(arrays['tblval'] == blk0.tblval))
+                    self.assertTrue(np.all(arrays['dlstele'] == blk0.dlstele))
+                    ele0 = blk0[0]
+                    ele = blk[0]
+                    self.assertEqual(ele.e_bufrid, ele0.e_bufrid)
+                    self.assertEqual(ele.e_desc, ele0.e_desc)
+                    self.assertTrue(np.all(ele.e_rval == ele0.e_rval))
+                i += 1
+            self.assertEqual(len(bfile), i)
+
     def test_brp_BurpcFile_indexError(self):
         """brp_BurpcFile_iter  """
         brp.brp_opt(rmn.BURPOP_MSGLVL, rmn.BURPOP_MSG_SYSTEM)
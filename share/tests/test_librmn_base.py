@@ -294,6 +294,58 @@ class LibrmnIncdateKnownValues(unittest.TestCase):
             self.assertEqual(nhours2,nhours,repr(nhours2)+' != '+repr(nhours))
 
 
+class LibrmnNewdateManyKnownValues(unittest.TestCase):
+
+    def _stamps(self):
+        stamps = [rmn.newdate(rmn.NEWDATE_PRINT2STAMP, yyyymmdd, hhmmsshh)
+                  for yyyymmdd in (19750312, 19800101, 19960229, 20120228,
+                                   20150102, 20161231)
+                  for hhmmsshh in (0, 13141500, 23595500)]
+        return np.array(stamps, dtype=np.int32)
+
+    def testIncdatrManyKnownValues(self):
+        """incdatr_many, difdatr_many should give the same as incdatr, difdatr"""
+        stamps = self._stamps()
+        for nhours in (0., 1.5, 24., -30.25, 8760., 1./720.):
+            idates = rmn.incdatr_many(stamps, nhours)
+            for idate1, idate2 in zip(stamps.tolist(), idates.tolist()):
+                self.assertEqual(idate2, rmn.incdatr(idate1, nhours))
+            nhours2 = rmn.difdatr_many(idates, stamps)
+            for idate1, idate2, nh in zip(stamps.tolist(), idates.tolist(),
+                                          nhours2.tolist()):
+                self.assertEqual(nh, rmn.difdatr(idate2, idate1))
+        idates = rmn.incdatr_many(stamps[4], np.arange(0., 48., 6.))
+        self.assertEqual(idates.shape, (8, ))
+        self.assertRaises(TypeError, rmn.incdatr_many, [1.5], 1.)
+        self.assertRaises(ValueError, rmn.incdatr_many, [-1], 1.)
+
+    def testStamp2Datetime64KnownValues(self):
+        """stamp2datetime64, datetime642stamp should match newdate"""
+        stamps = self._stamps()
+        for opt in (rmn.NEWDATE_OPT_GREGORIAN, rmn.NEWDATE_OPT_365DAYS):
+            rmn.newdate_options_set(opt)
+            try:
+                for nhours in (0., 24., 72.):
+                    idates = rmn.incdatr_many(stamps, nhours)
+                    dates = rmn.stamp2datetime64(idates)
+                    for idate, date in zip(idates.tolist(), dates):
+                        (yyyymmdd, hhmmsshh) = rmn.newdate(
+                            rmn.NEWDATE_STAMP2PRINT, idate)
+                        self.assertEqual(str(date), '{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}'.format(
+                            yyyymmdd // 10000, (yyyymmdd // 100) % 100,
+                            yyyymmdd % 100, hhmmsshh // 1000000,
+                            (hhmmsshh // 10000) % 100, (hhmmsshh // 100) % 100))
+                    sel = (dates >= np.datetime64('1980-01-01'))
+                    self.assertTrue(np.all(rmn.datetime642stamp(dates[sel]) ==
+                                           idates[sel]))
+            finally:
+                rmn.newdate_options_set(rmn.NEWDATE_OPT_GREGORIAN)
+        date = rmn.stamp2datetime64([399367913])[0]
+        self.assertEqual(date, np.datetime64('2015-01-02T13:14:15'))
+        self.assertRaises(ValueError, rmn.datetime642stamp,
+                          [np.datetime64('NaT')])
+
+
 if __name__ == "__main__":
     unittest.main()
 
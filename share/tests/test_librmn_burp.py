@@ -331,6 +331,44 @@ class RpnPyLibrmnBurp(unittest.TestCase):
 
             rmn.burp_close(funit)
 
+    def testmrbtypdecodemany(self):
+        """mrbtyp_decode_many should give the same as mrbtyp_decode"""
+        rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+        for mypath, itype, iunit in self.knownValues:
+            table = rmn.burp_read_table(self.getFN(mypath))
+            btyps = _np.unique(table['btyp'])
+            params = rmn.mrbtyp_decode_many(btyps)
+            self.assertEqual(params.shape, btyps.shape)
+            for i, btyp in enumerate(btyps.tolist()):
+                params0 = rmn.mrbtyp_decode(btyp)
+                for k in params.dtype.names:
+                    self.assertEqual(params[k][i], params0[k], k)
+        btyps = _np.arange(2**15).reshape(2, -1)
+        params = rmn.mrbtyp_decode_many(btyps)
+        self.assertEqual(params.shape, btyps.shape)
+        btyp1 = (((params['bknat_multi'] * 4 + params['bknat_kind']) << 11) +
+                 ((params['bktyp_alt'] * 64 + params['bktyp_kind']) << 4) +
+                 params['bkstp'])
+        self.assertTrue(_np.all(btyp1 == btyps))
+        for btyp in (9326, 1326, 19*16+8):
+            params0 = rmn.mrbtyp_decode(btyp)
+            for k in params.dtype.names:
+                self.assertEqual(params.ravel()[btyp][k], params0[k], k)
+        self.assertRaises(TypeError, rmn.mrbtyp_decode_many, [1.5])
+        self.assertRaises(ValueError, rmn.mrbtyp_decode_many, [1, -1])
+
+    def testflagsdecodemany(self):
+        """flags_decode_many should give the same as flags_decode"""
+        iflgs = [0, 1024, 1025, 2**24-1, 2**23+4]
+        flags = rmn.flags_decode_many(iflgs)
+        for i, iflg in enumerate(iflgs):
+            flags0 = rmn.flags_decode(iflg)
+            self.assertEqual(flags['flgs'][i], flags0['flgs'])
+            self.assertEqual(flags['flgsl'][i].tolist(), flags0['flgsl'])
+        self.assertEqual(rmn.flags_decode_many(1024)['flgsl'].shape,
+                         (len(rmn.BURP_FLAGS_IDX_NAME), ))
+        self.assertRaises(TypeError, rmn.flags_decode_many, ['a'])
+
     ## def testmrbprm2KnownValues(self):
     ##     """mrbprm should give known result with known input"""
     ##     for mypath, itype, iunit in self.knownValues:
@@ -613,6 +651,275 @@ class RpnPyLibrmnBurp(unittest.TestCase):
             rmn.burp_close(funit)
 
 
+    def testburpreadtable(self):
+        """burp_read_table should give same values as mrb_prm_xtr_dcl_cvt"""
+        for mypath, itype, iunit in self.knownValues:
+            rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+            table = rmn.burp_read_table(self.getFN(mypath))
+            names = [k for k, t in rmn.BURP_TABLE_COLUMNS]
+            self.assertEqual(list(table.keys()), names)
+            n = table['irep'].size
+            for k in names:
+                self.assertEqual(table[k].size, n)
+            funit  = rmn.burp_open(self.getFN(mypath))
+            self.assertEqual(table['irep'].max()+1, rmn.mrfnbr(funit))
+            handle = rmn.mrfloc(funit, 0)
+            buf    = rmn.mrfget(handle, None, funit)
+            params = rmn.mrbhdr(buf)
+            rep0 = (table['irep'] == 0)
+            self.assertTrue(_np.all(table['stnid'][rep0] == params['stnid']))
+            for iblk in range(params['nblk']):
+                blkdata = rmn.mrb_prm_xtr_dcl_cvt(buf, iblk+1)
+                if blkdata['bknat_kindd'] == 'flags':
+                    self.assertFalse(_np.any(table['iblk'][rep0] == iblk+1))
+                    continue
+                sel = rep0 & (table['iblk'] == iblk+1)
+                self.assertEqual(sel.sum(), blkdata['rval'].size)
+                ele = _np.tile(blkdata['bufrids'],
+                               blkdata['nval']*blkdata['nt'])
+                self.assertTrue(_np.all(table['element'][sel] == ele))
+            rmn.burp_close(funit)
+
+    def testburpiter(self):
+        """burp_iter should return the selected reports in file order"""
+        for mypath, itype, iunit in self.knownValues:
+            rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+            filename = self.getFN(mypath)
+            funit  = rmn.burp_open(filename)
+            nrep   = rmn.mrfnbr(funit)
+            handle = rmn.mrfloc(funit, 0)
+            prm    = rmn.mrfprm(handle)
+            buf    = rmn.mrfget(handle, None, funit)
+            params = rmn.mrbhdr(buf)
+            rmn.burp_close(funit)
+            for k in ('stnid', 'idtyp', 'lat', 'lon', 'date', 'time'):
+                self.assertEqual(prm[k], params[k])
+            reps = list(rmn.burp_iter(filename, decode=False))
+            self.assertEqual(len(reps), nrep)
+            self.assertEqual(reps[0]['stnid'], params['stnid'])
+            rpt0 = next(rmn.burp_iter(filename))
+            self.assertEqual(len(rpt0['blocks']), params['nblk'])
+            stnid = params['stnid']
+            for rpt in rmn.burp_iter(filename, stnid=stnid, decode=False):
+                self.assertEqual(rpt['stnid'], stnid)
+            lat = params['lat']
+            for rpt in rmn.burp_iter(filename, latlon=(lat-1., lat+1., 0., 360.),
+                                     decode=False):
+                self.assertTrue(lat-1. <= rpt['lat'] <= lat+1.)
+            t0 = params['date'] * 10000 + params['time']
+            n = 0
+            for rpt in rmn.burp_iter(filename, timewindow=(t0, t0)):
+                self.assertEqual(rpt['date'], params['date'])
+                self.assertEqual(rpt['time'], params['time'])
+                n += 1
+            self.assertTrue(n >= 1)
+            n = 0
+            for rpt in rmn.burp_iter(filename, elements=[12004]):
+                for blk in rpt['blocks']:
+                    self.assertTrue(_np.any(_np.isin(blk['bufrids'],
+                                                     [12004, 212004])))
+                n += 1
+            reps = list(rmn.burp_iter(filename, elements=[12004],
+                                      decode=False))
+            self.assertEqual(len(reps), n)
+            for rpt in reps:
+                self.assertTrue(len(rpt['blocks']) > 0)
+                self.assertFalse('rval' in rpt['blocks'][0])
+            table = rmn.burp_read_table(filename, elements=[12004])
+            self.assertEqual(len(_np.unique(table['irep'])), n)
+            self.assertTrue(_np.all(table['element'] == 12004))
+            reps = list(rmn.burp_iter(filename, decode=False,
+                                      predicate=lambda h: h['idtyp'] < 0))
+            self.assertEqual(reps, [])
+            # Errors other than the end of the search are not silenced
+            self.assertRaises(rmn.BurpError, list, rmn.burp_iter(-999))
+
+    def testmrbcvtdecodemany(self):
+        """mrbcvt_decode_many should give same values as mrbcvt_decode"""
+        for mypath, itype, iunit in self.knownValues:
+            rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+            funit  = rmn.burp_open(self.getFN(mypath))
+            handle = rmn.mrfloc(funit, 0)
+            buf    = rmn.mrfget(handle, None, funit)
+            params = rmn.mrbhdr(buf)
+            blocks = []
+            for iblk in range(params['nblk']):
+                blkdata = rmn.mrbprm(buf, iblk+1)
+                blkdata.update(rmn.mrbxtr(buf, iblk+1))
+                if blkdata['bknat_kindd'] == 'flags' or \
+                   blkdata['datyp'] not in (2, 4):
+                    continue
+                blocks.append(blkdata)
+            rvals = rmn.mrbcvt_decode_many(blocks)
+            for blkdata, rval in zip(blocks, rvals):
+                rval0 = rmn.mrbcvt_decode(blkdata['cmcids'],
+                                          blkdata['tblval'].copy(order='F'))
+                self.assertEqual(rval.shape, rval0.shape)
+                self.assertTrue(_np.allclose(rval, rval0))
+                rval1 = rmn.mrbcvt_decode_many(blkdata['cmcids'],
+                                               blkdata['tblval'])
+                self.assertTrue(_np.all(rval1 == rval))
+                tblval = rmn.mrbcvt_encode_many(blkdata['cmcids'], rval)
+                self.assertTrue(_np.all(tblval == blkdata['tblval']))
+            rmn.burp_close(funit)
+
+    def testburpreadtables(self):
+        """burp_read_tables should give the concatenated burp_read_table"""
+        rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+        filenames = [self.getFN(mypath) for mypath, itype, iunit
+                     in self.knownValues]
+        filenames = (filenames + filenames[::-1])[0:4]
+        tables = [rmn.burp_read_table(f) for f in filenames]
+        for nproc in (1, 2):
+            table = rmn.burp_read_tables(filenames, nproc=nproc)
+            self.assertEqual(list(table.keys())[1:],
+                             [k for k, t in rmn.BURP_TABLE_COLUMNS])
+            for i, t in enumerate(tables):
+                sel = (table['ifile'] == i)
+                for k in t.keys():
+                    self.assertEqual(table[k].dtype, t[k].dtype)
+                    self.assertTrue(_np.all((table[k][sel] == t[k]) |
+                                            (t[k] != t[k])), k)
+        self.assertRaises(TypeError, rmn.burp_read_tables, filenames[0])
+
+    def testburpreadtablesnproc(self):
+        """burp_read_tables nproc=2 should not lose nor leak shared memory"""
+        import subprocess, sys
+        filenames = [self.getFN(mypath) for mypath, itype, iunit
+                     in self.knownValues]
+        filenames = (filenames * 3)[0:6]
+        nrows = sum([rmn.burp_read_table(f)['irep'].size for f in filenames])
+        script = '\n'.join([
+            "import sys",
+            "import rpnpy.librmn.all as rmn",
+            "rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)",
+            "table = rmn.burp_read_tables(sys.argv[1:], nproc=2)",
+            "print(table['irep'].size)"])
+        p = subprocess.Popen([sys.executable, '-c', script] + filenames,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             universal_newlines=True)
+        (out, err) = p.communicate()
+        self.assertEqual(p.returncode, 0, err)
+        self.assertEqual(int(out.strip().split()[-1]), nrows)
+        self.assertFalse('resource_tracker' in err, err)
+        self.assertFalse('leaked shared_memory' in err, err)
+
+    def testburpitertables(self):
+        """burp_iter_tables chunks should give the burp_read_table"""
+        rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+        for mypath, itype, iunit in self.knownValues:
+            filename = self.getFN(mypath)
+            table = rmn.burp_read_table(filename)
+            chunks = list(rmn.burp_iter_tables(filename, nrep=7))
+            self.assertTrue(len(chunks) > 0)
+            for k in table.keys():
+                v = _np.concatenate([c[k] for c in chunks])
+                self.assertEqual(v.dtype, table[k].dtype)
+                self.assertTrue(_np.all((v == table[k]) |
+                                        (table[k] != table[k])), k)
+        self.assertRaises(ValueError, lambda:
+                          list(rmn.burp_iter_tables(filename, nrep=0)))
+
+    def testburpindex(self):
+        """burp_index_query should find the same reports as a full scan"""
+        import tempfile, shutil
+        import rpnpy.librmn.burp as _burp
+        import rpnpy.librmn.npzcache as npzcache
+        cachedir = tempfile.mkdtemp()
+        try:
+            for mypath, itype, iunit in self.knownValues:
+                rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+                funit = rmn.burp_open(self.getFN(mypath))
+                index = rmn.burp_index(funit, cachedir=cachedir)
+                self.assertEqual(index['handle'].size, rmn.mrfnbr(funit))
+                rmn.burp_close(funit)
+                funit = rmn.burp_open(self.getFN(mypath))
+                index2 = rmn.burp_index(funit, cachedir=cachedir)
+                self.assertTrue(_np.all(index['stnid'] == index2['stnid']))
+                rpt = rmn.mrfget(int(index2['handle'][0]), None, funit)
+                self.assertEqual(rmn.mrbhdr(rpt)['stnid'].strip(),
+                                 index2['stnid'][0])
+                # No index file is written unless a cache dir is set
+                env = os.environ.pop(rmn.BURP_INDEX_DIR_ENV, None)
+                ipath = npzcache.npzcache_path(
+                    os.path.abspath(self.getFN(mypath)), None,
+                    rmn.BURP_INDEX_SUFFIX)
+                existed = os.path.isfile(ipath)
+                try:
+                    index3 = rmn.burp_index(funit)
+                finally:
+                    if env is not None:
+                        os.environ[rmn.BURP_INDEX_DIR_ENV] = env
+                self.assertEqual(index3['handle'].size, index['handle'].size)
+                self.assertEqual(os.path.isfile(ipath), existed)
+                rmn.burp_close(funit)
+                (lat0, lon0) = (float(index['lat'][0]), float(index['lon'][0]))
+                dist = _burp._burp_index_distance(lat0, lon0, index['lat'],
+                                                  index['lon'])
+                rows = rmn.burp_index_query(index, latlon=(lat0, lon0),
+                                            radius=500.)
+                self.assertEqual(rows.tolist(),
+                                 _np.nonzero(dist <= 500.)[0].tolist())
+                t0 = int(index['stamp'][0])
+                rows = rmn.burp_index_query(index, latlon=(lat0, lon0),
+                                            radius=500., timewindow=(t0, t0))
+                self.assertEqual(rows.tolist(),
+                                 _np.nonzero((dist <= 500.) &
+                                             (index['stamp'] == t0))[0].tolist())
+                box = (lat0 - 5., lat0 + 5., 350., 10.)
+                inbox = ((index['lat'] >= box[0]) & (index['lat'] <= box[1]) &
+                         ((index['lon'] >= 350.) | (index['lon'] <= 10.)))
+                rows = rmn.burp_index_query(index, box=box)
+                self.assertEqual(rows.tolist(), _np.nonzero(inbox)[0].tolist())
+        finally:
+            shutil.rmtree(cachedir)
+
+    def testburpwritetable(self):
+        """burp_write_table then burp_read_table should give back the table"""
+        rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+        mypath, itype, iunit = self.knownValues[0]
+        table = rmn.burp_read_table(self.getFN(mypath))
+        ofname = 'test_burp_write_table.brp'
+        try:
+            nrep = rmn.burp_write_table(ofname, table)
+            self.assertEqual(nrep, len(_np.unique(table['irep'])))
+            table2 = rmn.burp_read_table(ofname)
+        finally:
+            if os.path.isfile(ofname):
+                os.unlink(ofname)
+        self.assertEqual(table2['irep'].size, table['irep'].size)
+        for k in ('stnid', 'idtyp', 'date', 'time', 'iblk', 'btyp', 'bfam',
+                  'element', 'ilev', 'igrp', 'flag', 'datyp'):
+            self.assertTrue(_np.all(table2[k] == table[k]), k)
+        for k in ('lat', 'lon', 'value'):
+            self.assertTrue(_np.allclose(table2[k], table[k], equal_nan=True),
+                            k)
+
+    def testburpwritetablefloat(self):
+        """burp_write_table then burp_read_table should keep float blocks"""
+        rmn.mrfopt(rmn.FSTOP_MSGLVL, rmn.BURPOP_MSG_FATAL)
+        mypath, itype, iunit = self.knownValues[0]
+        table = rmn.burp_read_table(self.getFN(mypath))
+        table['value'] = table['value'] + _np.float32(0.125)
+        for datyp in (rmn.BURP_DATYP_LIST['float'],
+                      rmn.BURP_DATYP_LIST['double']):
+            table['datyp'][:] = datyp
+            ofname = 'test_burp_write_table_float.brp'
+            try:
+                rmn.burp_write_table(ofname, table)
+                table2 = rmn.burp_read_table(ofname)
+                # Read back and written again as is
+                rmn.burp_write_table(ofname, table2)
+                table3 = rmn.burp_read_table(ofname)
+            finally:
+                if os.path.isfile(ofname):
+                    os.unlink(ofname)
+            for t in (table2, table3):
+                self.assertEqual(t['value'].size, table['value'].size)
+                self.assertTrue(_np.all(t['datyp'] == datyp))
+                self.assertTrue(_np.allclose(t['value'], table['value'],
+                                             equal_nan=True))
+
     def testmrbcvtdictsetKnownValues(self):
         """mrbcvt_dict_path_set should give known result with known input"""
         rpnpypath = os.getenv('rpnpy', None)
@@ -693,6 +1000,50 @@ class RpnPyLibrmnBurp(unittest.TestCase):
     def testmrbcvtdictget(self):
         cvt = rmn.mrbcvt_dict_get()
 
+    def testmrbcvtdictmany(self):
+        """mrbcvt_dict_many should give same values as mrbcvt_dict"""
+        import tempfile, shutil
+        cachedir = tempfile.mkdtemp()
+        try:
+            rmn.mrbcvt_dict_path_set()  # Reset
+            table = rmn.mrbcvt_table(cachedir=cachedir)
+            self.assertEqual(table['bufrid'].size, rmn.BURP_TABLE_B_NCMCID)
+            self.assertEqual(len(os.listdir(cachedir)), 1)
+            rmn.mrbcvt_dict_path_set()  # Reset, read from cache
+            table2 = rmn.mrbcvt_table(cachedir=cachedir)
+            for k in ('bufrid', 'error', 'scale', 'bias', 'iunits', 'desc'):
+                self.assertTrue(_np.all(table[k] == table2[k]))
+            # No disk cache unless a cache dir is set
+            shutil.rmtree(cachedir)
+            os.mkdir(cachedir)
+            (env, home) = (os.environ.pop(rmn.BURP_TABLE_B_CACHE_DIR_ENV, None),
+                           os.environ.get('HOME', None))
+            os.environ['HOME'] = cachedir
+            try:
+                rmn.mrbcvt_dict_path_set()  # Reset
+                table3 = rmn.mrbcvt_table()
+            finally:
+                if env is not None:
+                    os.environ[rmn.BURP_TABLE_B_CACHE_DIR_ENV] = env
+                if home is not None:
+                    os.environ['HOME'] = home
+            self.assertEqual(table3['bufrid'].size, rmn.BURP_TABLE_B_NCMCID)
+            self.assertEqual(os.listdir(cachedir), [])
+        finally:
+            shutil.rmtree(cachedir)
+        cmcids = rmn.mrbcol([12004, 10004, 1041, 11011]).tolist() + [65535]
+        cvt = rmn.mrbcvt_dict_many(_np.array(cmcids))
+        self.assertEqual(cvt['e_bufrid'].tolist(), rmn.mrbdcl(cmcids).tolist())
+        for i, cmcid in enumerate(cmcids):
+            d = rmn.mrbcvt_dict(cmcid, raise_error=False)
+            for k in d.keys():
+                if k in ('e_bufrid_F', 'e_bufrid_X', 'e_bufrid_Y'):
+                    continue
+                self.assertEqual(cvt[k][i], d[k], k)
+        self.assertEqual(rmn.mrbcvt_dict_find_id('.*temperature.*', nmax=1)[0],
+                         [k for k, v in rmn.mrbcvt_dict_get().items()
+                          if v['e_desc'].lower().find('temperature') >= 0][0])
+
     def testmrbini(self):
         output_filename="test.burp"
         funit = rmn.burp_open(output_filename, rmn.BURP_MODE_CREATE)
@@ -194,6 +194,49 @@ class Librmn_ConvertIp_Test(unittest.TestCase):
             self.assertEqual(ip3a2,ip3)
             self.assertEqual(ip3v2,ip3)
             
+    def test_ConvertIp_many(self):
+        """convertIp_many should give the same result as convertIp"""
+        import numpy as np
+        for lvlnew,lvlold,ipnew,ipold,kind in self.ip1knownValues:
+            self.assertEqual(
+                rmn.convertIp_many(rmn.CONVIP_P2IP_NEW,[lvlnew],kind)[0],ipnew)
+            self.assertEqual(
+                rmn.convertIp_many(rmn.CONVIP_P2IP_OLD,[lvlold],kind)[0],ipold)
+            (lvl2,kind2) = rmn.convertIp_many(rmn.CONVIP_IP2P,[ipnew,ipold])
+            self.assertEqual(kind2.tolist(),[kind,kind])
+        # Bit for bit against c_ConvertIp
+        rng = np.random.RandomState(1234)
+        kinds = (rmn.KIND_ABOVE_SEA, rmn.KIND_SIGMA, rmn.KIND_PRESSURE,
+                 rmn.KIND_ARBITRARY, rmn.KIND_ABOVE_GND, rmn.KIND_HYBRID,
+                 rmn.KIND_THETA, rmn.KIND_HOURS)
+        for kind in kinds:
+            lvls = np.concatenate([
+                [0., 1., 0.5, 1.e-6, 999999., 12.25, 1100.],
+                rng.uniform(0., 1., 500),
+                10.**rng.uniform(-6., 5., 500)]).astype(np.float32)
+            ips = rmn.convertIp_many(rmn.CONVIP_ENCODE, lvls, kind)
+            for lvl, ip in zip(lvls.tolist(), ips.tolist()):
+                self.assertEqual(ip, rmn.convertIp(rmn.CONVIP_ENCODE,lvl,kind),
+                                 (lvl, kind))
+            (vals, kinds2) = rmn.convertIp_many(rmn.CONVIP_DECODE, ips)
+            for ip, val, kind2 in zip(ips.tolist(), vals.tolist(),
+                                      kinds2.tolist()):
+                self.assertEqual((val, kind2),
+                                 rmn.convertIp(rmn.CONVIP_DECODE, ip), ip)
+        ips = np.concatenate([np.arange(0, 32768, 7),
+                              rng.randint(0, 1 << 28, 2000)])
+        (vals, kinds2) = rmn.convertIp_many(rmn.CONVIP_DECODE, ips)
+        for ip, val, kind2 in zip(ips.tolist(), vals.tolist(), kinds2.tolist()):
+            (val0, kind0) = rmn.convertIp(rmn.CONVIP_DECODE, ip)
+            self.assertEqual(kind2, kind0, ip)
+            self.assertTrue(val == val0 or (val != val and val0 != val0), ip)
+        self.assertEqual(rmn.convertIp_many(rmn.CONVIP_ENCODE,
+                                            [[1000.], [-5.]], [2, 0]).shape,
+                         (2, 2))
+        self.assertRaises(TypeError, rmn.convertIp_many, rmn.CONVIP_DECODE,
+                          [1.5])
+        self.assertRaises(ValueError, rmn.convertIp_many, 9, [1])
+
 #--- fstd98/????? ---------------------------------------------------
 
 
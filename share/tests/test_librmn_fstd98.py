@@ -404,6 +404,189 @@ class Librmn_fstd98_Test(unittest.TestCase):
         self.erase_testfile()
         self.assertEqual(klo,None,'LO found after delete: '+repr(klo))
 
+    def test_fstprm_many(self):
+        """fstprm_many should give same result as fstprm"""
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES')
+        myfile = os.path.join(ATM_MODEL_DFILES.strip(),'bcmk/2009042700_012')
+        funit = rmn.fstopenall(myfile,rmn.FST_RO)
+        keylist = rmn.fstinl(funit)
+        meta = rmn.fstprm_many(keylist)
+        meta2 = rmn.fstinl(funit, withMeta=True)
+        self.assertEqual(len(meta),len(keylist))
+        self.assertEqual(meta['key'].tolist(),meta2['key'].tolist())
+        for i in (0, len(keylist)//2, len(keylist)-1):
+            a = rmn.fstprm(keylist[i])
+            for k in meta.dtype.names:
+                self.assertEqual(meta[i][k],a[k],'fstprm_many wrong {0}, Got {1} expected {2}'.format(k,meta[i][k],a[k]))
+        meta = rmn.fstinl(funit, nomvar='NONE', withMeta=True)
+        self.assertEqual(len(meta),0)
+        rmn.fstcloseall(funit)
+
+    def test_fstindex(self):
+        """fstindex should give same result with or without index files"""
+        import tempfile, glob
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES')
+        mydir = os.path.join(ATM_MODEL_DFILES.strip(),'bcmk/')
+        cachedir = tempfile.mkdtemp()
+        funit = rmn.fstopenall(mydir,rmn.FST_RO)
+        meta0 = rmn.fstinl(funit, withMeta=True)
+        if os.getenv(rmn.FST_INDEX_DIR_ENV) is None:
+            # Index files are only written when asked for
+            sidecar = os.path.join(mydir, '.*'+rmn.FST_INDEX_SUFFIX)
+            nside = len(glob.glob(sidecar))
+            meta1 = rmn.fstindex(funit)
+            self.assertEqual(len(glob.glob(sidecar)), nside)
+            self.assertEqual(len(meta1),len(meta0))
+        meta1 = rmn.fstindex(funit, cachedir=cachedir)
+        rmn.fstcloseall(funit)
+        nidx = len(glob.glob(os.path.join(cachedir, '*'+rmn.FST_INDEX_SUFFIX)))
+        self.assertTrue(nidx > 1, 'fstindex should write one index per file')
+        funit = rmn.fstopenall(mydir,rmn.FST_RO)
+        meta0 = rmn.fstinl(funit, withMeta=True)
+        meta2 = rmn.fstindex(funit, cachedir=cachedir)
+        rmn.fstcloseall(funit)
+        for f in glob.glob(os.path.join(cachedir, '*')):
+            os.unlink(f)
+        os.rmdir(cachedir)
+        self.assertEqual(len(meta1),len(meta0))
+        self.assertEqual(sorted(meta2['key'].tolist()),sorted(meta0['key'].tolist()))
+        self.assertEqual(sorted(meta2['nomvar'].tolist()),sorted(meta1['nomvar'].tolist()))
+
+    def test_fstindex_fstprm(self):
+        """fstprm_many should give same result from the fstindex index"""
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES')
+        mydir = os.path.join(ATM_MODEL_DFILES.strip(),'bcmk/')
+        funit = rmn.fstopenall(mydir,rmn.FST_RO)
+        keys = rmn.fstinl(funit)
+        meta0 = rmn.fstprm_many(keys)
+        rmn.fstindex(funit, cache=False)
+        meta1 = rmn.fstprm_many(keys)
+        meta2 = rmn.fstinl(funit, withMeta=True)
+        rmn.fstcloseall(funit)
+        self.assertEqual(meta1.tolist(), meta0.tolist())
+        self.assertEqual(meta2.tolist(), meta0.tolist())
+
+    def test_fstinventory(self):
+        """fstinventory should give known result with known input"""
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES')
+        mydir = os.path.join(ATM_MODEL_DFILES.strip(),'bcmk/')
+        funit = rmn.fstopenall(mydir,rmn.FST_RO)
+        inv = rmn.fstinventory(funit, cache=False)
+        self.assertEqual(len(inv['key']),2788)
+        self.assertEqual(int((inv['nomvar'] == 'VF').sum()),26)
+        for i in range(len(inv['key'])):
+            rps = rmn.DecodeIp(int(inv['ip1'][i]), int(inv['ip2'][i]),
+                               int(inv['ip3'][i]))
+            for (ip, rp) in zip(('ip1', 'ip2', 'ip3'), rps):
+                self.assertEqual((inv[ip+'v'][i], inv[ip+'v2'][i],
+                                  inv[ip+'k'][i]),
+                                 (np.float32(rp.v1), np.float32(rp.v2),
+                                  rp.kind))
+        self.assertTrue(np.all(inv['nbytes'] > 0))
+        rmn.fstcloseall(funit)
+        # Old style ip2 are hours
+        funit = rmn.fstopenall(os.path.join(ATM_MODEL_DFILES.strip(),
+                                            'bcmk_p/anlp2015070706_000'),
+                               rmn.FST_RO)
+        inv = rmn.fstinventory(funit)
+        rmn.fstcloseall(funit)
+        old = (inv['ip2'] > 0) & (inv['ip2'] <= 32767)
+        if np.any(old):
+            self.assertTrue(np.all(inv['ip2k'][old] == rmn.TIME_KIND_HR))
+            self.assertTrue(np.all(inv['ip2v'][old] == inv['ip2'][old]))
+
+    def test_fstluk_many(self):
+        """fstluk_many should give same result as fstluk"""
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES')
+        myfile = os.path.join(ATM_MODEL_DFILES.strip(),'bcmk/2009042700_000')
+        funit = rmn.fstopenall(myfile,rmn.FST_RO)
+        keylist = rmn.fstinl(funit,nomvar='TT')
+        a = rmn.fstluk_many(keylist)
+        self.assertEqual(a['d'].shape[2],len(keylist))
+        self.assertTrue(a['d'].flags['F_CONTIGUOUS'])
+        self.assertEqual(a['meta']['key'].tolist(),keylist)
+        for k in (0, len(keylist)-1):
+            b = rmn.fstluk(keylist[k])
+            self.assertTrue(np.all(a['d'][:,:,k] == b['d']))
+        d4 = np.empty((a['d'].shape[0], a['d'].shape[1], 2, len(keylist)//2),
+                      dtype=a['d'].dtype, order='F')
+        a2 = rmn.fstluk_many(keylist[0:2*(len(keylist)//2)], dataArray=d4)
+        self.assertTrue(np.all(a2['d'][:,:,1,0] == a['d'][:,:,1]))
+        self.assertRaises(TypeError, rmn.fstluk_many, keylist,
+                          dataArray=np.empty(a['d'].shape, dtype=a['d'].dtype))
+        rmn.fstcloseall(funit)
+
+
+    def test_fstunitid(self):
+        """fstunitid should identify the files opened with fstopenall"""
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        self.erase_testfile()
+        funit = rmn.fstopenall(self.fname,rmn.FST_RW)
+        self.assertEqual(rmn.fstunitid(funit), None)
+        rmn.fstecr(funit,np.asfortranarray(self.lad),{'nomvar':'ZZ'})
+        rmn.fstcloseall(funit)
+        funit = rmn.fstopenall(self.fname,rmn.FST_RO)
+        unitid = rmn.fstunitid(funit)
+        self.assertEqual(len(unitid), 1)
+        self.assertEqual(unitid[0][0], os.path.abspath(self.fname))
+        self.assertEqual(unitid[0][1], os.path.getsize(self.fname))
+        self.assertTrue(rmn.fstunitid(funit) is unitid)
+        rmn.fstcloseall(funit)
+        self.assertRaises(TypeError, rmn.fstunitid, 'a')
+
+
+    def test_fstmmap(self):
+        """fstmmap should give same result as fstluk for uncompressed rec"""
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        self.erase_testfile()
+        funit = rmn.fstopenall(self.fname,rmn.FST_RW)
+        data = np.asfortranarray(self.lad)
+        rmn.fstecr(funit,data,{'nomvar':'ZZ','datyp':5,'nbits':32})
+        rmn.fstecr(funit,data,{'nomvar':'PK','datyp':1,'nbits':16})
+        rmn.fstcloseall(funit)
+        funit = rmn.fstopenall(self.fname,rmn.FST_RO)
+        k = rmn.fstinf(funit,nomvar='ZZ')['key']
+        a = rmn.fstmmap(k)
+        self.assertEqual(a['nomvar'].strip(), 'ZZ')
+        # fstmmap should not reset the fstsui search context
+        self.assertEqual(rmn.fstsui(funit), None)
+        b = rmn.fstluk(k)
+        self.assertEqual(a['d'].shape,b['d'].shape)
+        self.assertTrue(np.all(a['d'] == b['d']))
+        self.assertFalse(a['d'].flags['WRITEABLE'])
+        k = rmn.fstinf(funit,nomvar='PK')['key']
+        self.assertRaises(rmn.FSTDError, rmn.fstmmap, k)
+        del a
+        rmn.fstcloseall(funit)
+        self.erase_testfile()
+
+    def test_fstmmap_linked(self):
+        """fstmmap should find the file of records in linked files"""
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        fnames = [self.fname, '__rpnstd__testfile2__.fst']
+        data = np.asfortranarray(self.lad)
+        for (i, fname) in enumerate(fnames):
+            if os.path.isfile(fname):
+                os.unlink(fname)
+            funit = rmn.fstopenall(fname,rmn.FST_RW)
+            rmn.fstecr(funit,data+i,{'nomvar':'ZZ','ip2':i,'datyp':5,'nbits':32})
+            rmn.fstcloseall(funit)
+        funit = rmn.fstopenall(fnames,rmn.FST_RO)
+        for i in (1, 0):
+            k = rmn.fstinf(funit,nomvar='ZZ',ip2=i)['key']
+            a = rmn.fstmmap(k)
+            self.assertEqual(a['path'], os.path.abspath(fnames[i]))
+            self.assertTrue(np.all(a['d'] == data+i))
+            del a
+        rmn.fstcloseall(funit)
+        for fname in fnames:
+            os.unlink(fname)
+
 
     ## def test_fstluk_f16_datyp134(self):
     ##     """fstluk of f16 fields (datyp=134) should give known result with known input"""
@@ -72,6 +72,32 @@ class Librmn_grids_Test(unittest.TestCase):
         self.assertEqual(grid['tag2'],1000)
         self.assertEqual(grid['tag3'],0)
 
+    def test_readGrid_cache(self):
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES')
+        myfile = os.path.join(ATM_MODEL_DFILES.strip(),'bcmk/geophy.fst')
+        funit = rmn.fstopenall(myfile)
+        rmn.readGridCacheClear()
+        rec   = rmn.fstlir(funit, nomvar='ME')
+        grid0 = rmn.readGrid(funit,rec)
+        grid1 = rmn.readGrid(funit,rec,cache=True)
+        rec2  = rmn.fstlir(funit, nomvar='ME')
+        grid2 = rmn.readGrid(funit,rec2,cache=True)
+        self.assertEqual(grid1['id'],grid2['id'])
+        self.assertEqual(rec2['id'],grid1['id'])
+        self.assertEqual(sorted(grid0.keys()),sorted(grid2.keys()))
+        self.assertTrue(np.all(grid0['ax'] == grid2['ax']))
+        self.assertEqual(grid0['grref'],grid2['grref'])
+        # Callers get their own writable arrays
+        grid2['ax'][0] += 1.
+        grid4 = rmn.readGrid(funit,rec2,cache=True)
+        self.assertTrue(np.all(grid0['ax'] == grid4['ax']))
+        size = rmn.readGridCacheSize()
+        self.assertEqual(rmn.readGridCacheSize(0),0)
+        grid3 = rmn.readGrid(funit,rec,cache=True)
+        self.assertEqual(grid3['ni'],grid1['ni'])
+        rmn.readGridCacheSize(size)
+        rmn.fstcloseall(funit)
+
     def test_writeGrid(self):
         ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES')
         file0  = os.path.join(ATM_MODEL_DFILES.strip(),'bcmk/geophy.fst')
@@ -280,6 +280,27 @@ class Librmn_interp_Test(unittest.TestCase):
                 self.assertTrue(abs((zin[i,j]+zin[i+1,j])/2.-zout[i,j]) < self.epsilon)
         #rmn.gdrls([gid1,gid2]) #TODO: Makes the test crash
 
+    def test_ezsint_3d(self):
+        gp1 = self.getGridParams_L()
+        gid1 = rmn.ezqkdef(gp1)
+        gp2 = self.getGridParams_L(0.25)
+        gid2 = rmn.ezqkdef(gp2)
+        zin = np.empty(gp1['shape']+(2,3),dtype=np.float32,order='F')
+        for x in _range(gp1['ni']):
+            zin[x,...] = x
+        zin[...,1,:] *= 2.
+        zout = rmn.ezsint(gid2,gid1,zin)
+        self.assertEqual(gp2['shape']+(2,3),zout.shape)
+        zout2 = np.empty(zout.shape,dtype=np.float32,order='F')
+        zout2 = rmn.ezsint(gid2,gid1,zin,zout2)
+        for k in _range(3):
+            zout1 = rmn.ezsint(gid2,gid1,zin[:,:,1,k])
+            self.assertTrue(np.all(np.abs(zout[:,:,1,k]-zout1) < self.epsilon))
+            self.assertTrue(np.all(np.abs(zout2[:,:,1,k]-zout1) < self.epsilon))
+        (uu, vv) = rmn.ezuvint(gid2,gid1,zin,zin)
+        self.assertEqual(gp2['shape']+(2,3),uu.shape)
+        self.assertEqual(gp2['shape']+(2,3),vv.shape)
+
     def test_ezsint_extrap(self):
         extrap_val = 99.
         gp = self.getGridParams_ZE()
@@ -334,6 +355,75 @@ class Librmn_interp_Test(unittest.TestCase):
         #rmn.gdrls([gid1,gid2]) #TODO: Makes the test crash
 
 
+    def test_ezinterpplan(self):
+        gp1 = self.getGridParams_L()
+        gid1 = rmn.ezqkdef(gp1)
+        gp2 = self.getGridParams_L(0.25)
+        gid2 = rmn.ezqkdef(gp2)
+        zin = np.empty(gp1['shape']+(3,),dtype=np.float32,order='F')
+        for x in _range(gp1['ni']):
+            zin[x,:,:] = x
+        for k in _range(3):
+            zin[:,:,k] *= (k+1)
+        rmn.ezsetopt(rmn.EZ_OPT_INTERP_DEGREE, rmn.EZ_INTERP_LINEAR)
+        plan = rmn.EzInterpPlan(gid2, gid1, rmn.EZ_INTERP_LINEAR)
+        self.assertTrue(plan.weights is not None)
+        zout = plan.ezsint(zin)
+        self.assertEqual(gp2['shape']+(3,),zout.shape)
+        for k in _range(3):
+            zout1 = rmn.ezsint(gid2,gid1,zin[:,:,k])
+            self.assertTrue(np.all(np.abs(zout[:,:,k]-zout1) < self.epsilon))
+        (uu, vv) = plan.ezuvint(zin[:,:,0], zin[:,:,1])
+        self.assertTrue(np.all(np.abs(uu-zout[:,:,0]) < self.epsilon))
+        self.assertTrue(np.all(np.abs(vv-zout[:,:,1]) < self.epsilon))
+        plan = rmn.EzInterpPlan(gid2, gid1, rmn.EZ_INTERP_CUBIC)
+        self.assertTrue(plan.weights is None)
+        zout = plan.ezsint(zin[:,:,0])
+        self.assertEqual(gp2['shape'],zout.shape)
+        rmn.ezsetopt(rmn.EZ_OPT_INTERP_DEGREE, rmn.EZ_INTERP_CUBIC)
+        zout1 = rmn.ezsint(gid2,gid1,zin[:,:,0])
+        rmn.ezsetopt(rmn.EZ_OPT_INTERP_DEGREE, rmn.EZ_INTERP_LINEAR)
+        self.assertTrue(np.all(np.abs(zout-zout1) < self.epsilon))
+
+    def test_ezinterpplan_global_outside(self):
+        rmn.ezsetopt(rmn.EZ_OPT_INTERP_DEGREE, rmn.EZ_INTERP_LINEAR)
+        # Global source grids, destination points over the poles
+        polar = rmn.defGrid_L(90, 10, 85.1, 0., 0.5, 4.)
+        gridA = rmn.ezgprm(rmn.ezqkdef(90, 45, 'A', 0, 0, 0, 0))
+        for grid in (rmn.defGrid_G(90, 45), gridA):
+            zin = np.empty(grid['shape'],dtype=np.float32,order='F')
+            for j in _range(grid['nj']):
+                zin[:,j] = j
+            plan = rmn.EzInterpPlan(polar, grid, rmn.EZ_INTERP_LINEAR)
+            self.assertTrue(plan.weights is None)
+            zout  = plan.ezsint(zin)
+            zout1 = rmn.ezsint(polar, grid, zin)
+            self.assertTrue(np.all(np.abs(zout-zout1) < self.epsilon))
+            # Inside points across the periodic x edge use weights
+            inner = rmn.defGrid_L(20, 10, -10., 350., 1., 1.)
+            plan = rmn.EzInterpPlan(inner, grid, rmn.EZ_INTERP_LINEAR)
+            self.assertTrue(plan.weights is not None)
+            zout  = plan.ezsint(zin)
+            zout1 = rmn.ezsint(inner, grid, zin)
+            self.assertTrue(np.all(np.abs(zout-zout1) < self.epsilon))
+        # Destination points outside a limited area source grid
+        gp1 = self.getGridParams_L()
+        gid1 = rmn.ezqkdef(gp1)
+        outside = rmn.defGrid_L(20, 20, 40., 270., 1., 1.)
+        zin = np.ones(gp1['shape'],dtype=np.float32,order='F')
+        extrap = rmn.ezgetopt(rmn.EZ_OPT_EXTRAP_DEGREE, vtype=str)
+        rmn.ezsetopt(rmn.EZ_OPT_EXTRAP_DEGREE, rmn.EZ_EXTRAP_VALUE)
+        rmn.ezsetopt(rmn.EZ_OPT_EXTRAP_VALUE, 99.)
+        try:
+            plan = rmn.EzInterpPlan(outside, gid1, rmn.EZ_INTERP_LINEAR)
+            self.assertTrue(plan.weights is None)
+            zout  = plan.ezsint(zin)
+            zout1 = rmn.ezsint(outside, gid1, zin)
+            self.assertTrue(np.all(np.abs(zout-zout1) < self.epsilon))
+            self.assertTrue(np.any(zout == 99.))
+        finally:
+            rmn.ezsetopt(rmn.EZ_OPT_EXTRAP_DEGREE, extrap.strip())
+
     def test_ezgkdef_fmem_gdxyfll(self):
         gp = self.getGridParams_ZE()
         gid1 = rmn.ezgdef_fmem(gp['ni'],gp['nj'],gp['grtyp'],gp['grref'],
@@ -41,6 +41,7 @@ class RpnPyUtilsFstd3D(unittest.TestCase):
     def test_get_levels_keys(self):
         import os, os.path
         import rpnpy.librmn.all as rmn
+        import rpnpy.vgd.all as vgd
         import rpnpy.utils.fstd3d as fstd3d
 
         ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
@@ -52,7 +53,14 @@ class RpnPyUtilsFstd3D(unittest.TestCase):
         # Get the pressure cube
         ipkeys  = fstd3d.get_levels_keys(fileId, 'TT', thermoMom='VIPT')
 
+        # Returned vptr is the caller's own, freeing it keeps the cache valid
+        vgd.vgd_free(ipkeys['vptr'])
+        ipkeys  = fstd3d.get_levels_keys(fileId, 'TT', thermoMom='VIPT')
+        vgrid   = vgd.vgd_read_cached(fileId)
         rmn.fstcloseall(fileId)
+        self.assertFalse(ipkeys['vptr'] is vgrid['vptr'])
+        self.assertTrue(vgd.vgd_cmp(ipkeys['vptr'], vgrid['vptr']))
+        vgd.vgd_free(vgrid['vptr'])
 
         exp = "# Found 80 levels for TT"
         got = '# Found {} levels for TT'.format(len(ipkeys['ip1keys']))
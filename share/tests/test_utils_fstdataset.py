@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+class RpnPyUtilsFstDataset(unittest.TestCase):
+
+
+    def test_fstdataset_slice(self):
+        import os, os.path
+        import numpy as np
+        import rpnpy.librmn.all as rmn
+        from rpnpy.utils.fstdataset import FstDataset
+
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+        filename = os.path.join(ATM_MODEL_DFILES,'bcmk')
+
+        with FstDataset(filename) as ds:
+            self.assertTrue('TT' in ds.keys())
+            self.assertFalse('>>' in ds.keys())
+            tt = ds['TT']
+            self.assertEqual(tt.dims, ('time', 'level', 'j', 'i'))
+            self.assertEqual(tt.shape[2:], (100, 200))
+
+            # Single record
+            k = int(tt.keys[0, 1])
+            self.assertTrue(k >= 0)
+            rec = rmn.fstluk(k)
+            got = tt[0, 1]
+            self.assertEqual(got.shape, (100, 200))
+            self.assertTrue(np.all(got == rec['d'].T))
+
+            # Sub domain of a few levels
+            got = tt[0, 0:3, 10:20, 5]
+            self.assertEqual(got.shape, (3, 10))
+            self.assertTrue(np.all(got[1] == rec['d'].T[10:20, 5]))
+
+            # Selection by datev and ip1
+            got = tt.sel(datev=tt.datev[0], ip1=[tt.ip1[1]])
+            self.assertEqual(got.shape, (1, 100, 200))
+            self.assertTrue(np.all(got[0] == rec['d'].T))
+            self.assertRaises(KeyError, tt.sel, ip1=-9)
+
+        self.assertRaises(rmn.FSTDError, tt.__getitem__, 0)
+
+
+    def test_fstdataset_duplicates(self):
+        import os
+        import numpy as np
+        import rpnpy.librmn.all as rmn
+        from rpnpy.utils.fstdataset import FstDataset
+
+        fname = '__rpnstd__testfile_fstdataset__.fst'
+        if os.path.isfile(fname):
+            os.unlink(fname)
+        rmn.fstopt(rmn.FSTOP_MSGLVL,rmn.FSTOPI_MSG_CATAST)
+        funit = rmn.fstopenall(fname, rmn.FST_RW)
+        data = np.zeros((4, 3), dtype=np.float32, order='F')
+        for etiket in ('RUN1', 'RUN2'):
+            rmn.fstecr(funit, data, {'nomvar':'ZZ', 'etiket':etiket,
+                                     'ip1':1, 'datyp':5, 'nbits':32})
+        rmn.fstcloseall(funit)
+        try:
+            with FstDataset(fname) as ds:
+                self.assertRaises(rmn.FSTDError, ds.__getitem__, 'ZZ')
+            with FstDataset(fname, etiket='RUN2') as ds:
+                zz = ds['ZZ']
+                self.assertEqual(zz.shape, (1, 1, 3, 4))
+                self.assertEqual(zz.meta['etiket'].strip(), 'RUN2')
+        finally:
+            os.unlink(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# -*- Mode: C; tab-width: 4; indent-tabs-mode: nil -*-
+# vim: set expandtab ts=4 sw=4:
+# kate: space-indent on; indent-mode cstyle; indent-width 4; mixedindent off;
@@ -596,6 +596,101 @@ class VGDBaseTests(unittest.TestCase):
         self.assertEqual(len(levels8.shape),3)
         self.assertEqual(levels8.dtype,np.float64)
 
+    def testLevels_many(self):
+        _printName()
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+        fileName = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+        fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+        vgd0ptr = vgd.vgd_read(fileId)
+        p0 = rmn.fstlir(fileId, nomvar='P0')['d'] * 100.
+        rmn.fstcloseall(fileId)
+        levels0 = vgd.vgd_levels2(vgd0ptr, p0)
+        rfld = np.array([p0.T, p0.T * 0.99, p0.T * 1.01], dtype=np.float32)
+        levels = vgd.vgd_levels_many(vgd0ptr, rfld)
+        (ni, nj, nk) = levels0.shape
+        self.assertEqual(levels.shape, (3, nk, nj, ni))
+        self.assertEqual(levels.dtype, np.float32)
+        self.assertTrue(np.all(levels[0] == levels0.T))
+        for t in range(rfld.shape[0]):
+            ref = vgd.vgd_levels2(vgd0ptr, np.asfortranarray(rfld[t].T))
+            self.assertTrue(np.all(levels[t] == ref.T))
+        levels8 = np.empty(levels.shape, dtype=np.float64)
+        levels2 = vgd.vgd_levels_many(vgd0ptr, rfld, double_precision=True,
+                                      levels=levels8)
+        self.assertTrue(levels2 is levels8)
+        self.assertTrue(np.allclose(levels8, levels, rtol=1e-5))
+        self.assertRaises(TypeError, vgd.vgd_levels_many, vgd0ptr, rfld,
+                          levels=levels8)
+
+    def testLevels_coefs(self):
+        _printName()
+        import pickle
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+        fileName = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+        fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+        vgd0ptr = vgd.vgd_read(fileId)
+        p0 = rmn.fstlir(fileId, nomvar='P0')['d'] * 100.
+        rmn.fstcloseall(fileId)
+        for ip1list in ('VIPM', 'VIPT'):
+            coefs = pickle.loads(pickle.dumps(vgd.vgd_coefs(vgd0ptr, ip1list)))
+            levels = vgd.vgd_levels_coefs(coefs, p0)
+            levels0 = vgd.vgd_levels2(vgd0ptr, p0, ip1list=ip1list)
+            self.assertEqual(levels.shape, levels0.shape)
+            self.assertEqual(levels.dtype, np.float32)
+            self.assertTrue(np.allclose(levels, levels0, rtol=1e-5))
+            levels = vgd.vgd_levels_coefs(coefs, p0, in_log=vgd.VGD_DIAG_LOGP,
+                                          double_precision=True)
+            levels0 = vgd.vgd_levels2(vgd0ptr, p0, ip1list=ip1list,
+                                      in_log=vgd.VGD_DIAG_LOGP,
+                                      double_precision=True)
+            self.assertTrue(np.allclose(levels, levels0, rtol=1e-7))
+        self.assertRaises(vgd.VGDError, vgd.vgd_coefs, vgd0ptr, [-9])
+
+        vgd0ptr = self._newReadBcmk(vcode_name="21001_SLEVE")
+        coefs = vgd.vgd_coefs(vgd0ptr)
+        prof = vgd.vgd_levels_coefs(coefs, 33., 11.)
+        prof0 = vgd.vgd_levels2(vgd0ptr, 33., 11., in_log=0)
+        self.assertEqual(prof.shape, prof0.shape)
+        self.assertTrue(np.allclose(prof, prof0, rtol=1e-5))
+        self.assertRaises(TypeError, vgd.vgd_levels_coefs, coefs, 33.)
+
+    def testReadCached(self):
+        _printName()
+        ATM_MODEL_DFILES = os.getenv('ATM_MODEL_DFILES').strip()
+        fileName = os.path.join(ATM_MODEL_DFILES,'bcmk_toctoc','2009042700_000')
+        vgd.vgd_read_cache_clear()
+        fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+        vgrid0 = vgd.vgd_read_cached(fileId)
+        vgrid1 = vgd.vgd_read_cached(fileId)
+        vgd0ptr = vgd.vgd_read(fileId)
+        rmn.fstcloseall(fileId)
+        self.assertFalse(vgrid0['vptr'] is vgrid1['vptr'])
+        self.assertEqual(list(vgrid0['VIPM']), vgd.vgd_get(vgd0ptr, 'VIPM'))
+        self.assertEqual(list(vgrid0['VIPT']), vgd.vgd_get(vgd0ptr, 'VIPT'))
+        self.assertTrue(vgd.vgd_cmp(vgrid0['vptr'], vgd0ptr))
+        self.assertTrue(vgd.vgd_cmp(vgrid1['vptr'], vgd0ptr))
+        # Returned descriptors are the caller's own, they outlive the cache
+        vgd.vgd_free(vgrid0['vptr'])
+        vgd.vgd_read_cache_clear()
+        self.assertTrue(vgd.vgd_cmp(vgrid1['vptr'], vgd0ptr))
+        vgd.vgd_free(vgrid1['vptr'])
+        # Same file opened again
+        fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+        vgrid2 = vgd.vgd_read_cached(fileId)
+        rmn.fstcloseall(fileId)
+        self.assertTrue(vgd.vgd_cmp(vgrid2['vptr'], vgd0ptr))
+        vgd.vgd_free(vgrid2['vptr'])
+        size = vgd.vgd_read_cache_size()
+        vgd.vgd_read_cache_size(0)
+        fileId = rmn.fstopenall(fileName, rmn.FST_RO)
+        vgrid3 = vgd.vgd_read_cached(fileId)
+        rmn.fstcloseall(fileId)
+        self.assertTrue(vgd.vgd_cmp(vgrid3['vptr'], vgd0ptr))
+        vgd.vgd_free(vgrid3['vptr'])
+        vgd.vgd_free(vgd0ptr)
+        vgd.vgd_read_cache_size(size)
+        self.assertRaises(ValueError, vgd.vgd_read_cache_size, -1)
+
     def testSdta76_temp(self):
         _printName()
         vgd0ptr = self._newReadBcmk(vcode_name="21002_SLEVE")